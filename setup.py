@@ -30,6 +30,7 @@ setup(
         "plotly>=5.0.0",
         "python-dotenv>=1.0.0",
         "aiohttp>=3.9.0",
+        "orjson>=3.9.0",
     ],
     extras_require={
         "dev": [
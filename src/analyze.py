@@ -14,6 +14,7 @@ import sys
 from pathlib import Path
 from typing import List, Tuple
 
+from .core.cache import TokenCache
 from .core.tokenizer import Tokenizer
 from .core.file_io import FileIO
 
@@ -152,7 +153,7 @@ def analyze_novel(novel_path: str, questions_per_10k: int = 5):
     novel_text = FileIO.read_novel(novel_path)
     
     tokenizer = Tokenizer()
-    novel_tokens = tokenizer.encode(novel_text)
+    novel_tokens = TokenCache().encode(tokenizer, novel_text)
     total_tokens = len(novel_tokens)
     
     # Print basic stats
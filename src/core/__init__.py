@@ -2,9 +2,11 @@
 
 from .config import Config
 from .tokenizer import Tokenizer
-from .file_io import FileIO
+from .file_io import FileIO, JsonlWriter
 from .llm_client import LLMClient
 from .prompt_template import PromptTemplateManager
 from .validator import QuestionValidator
+from .concurrency import AdaptiveSemaphore
 
-__all__ = ["Config", "Tokenizer", "FileIO", "LLMClient", "PromptTemplateManager", "QuestionValidator"]
+__all__ = ["Config", "Tokenizer", "FileIO", "JsonlWriter", "LLMClient", "PromptTemplateManager", "QuestionValidator",
+           "AdaptiveSemaphore"]
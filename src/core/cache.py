@@ -0,0 +1,231 @@
+"""On-disk caches shared across hogwarts-bench runs."""
+
+import hashlib
+import logging
+import mmap
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Sequence
+
+if TYPE_CHECKING:
+    from .tokenizer import Tokenizer
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds a stored context is kept after its last failed test
+DEFAULT_CONTEXT_MAX_AGE = 7 * 24 * 3600
+
+
+def get_cache_dir() -> Path:
+    """Get the directory used for on-disk caches.
+    
+    Uses HOGWARTS_CACHE_DIR if set, otherwise ~/.cache/hogwarts-bench.
+    
+    Returns:
+        Cache directory path (created if missing).
+    """
+    cache_dir = os.getenv("HOGWARTS_CACHE_DIR")
+    path = Path(cache_dir) if cache_dir else Path.home() / ".cache" / "hogwarts-bench"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def hash_context(context: str) -> str:
+    """Compute a stable content hash for a context string.
+    
+    Args:
+        context: Context text.
+    
+    Returns:
+        Hex digest identifying the context.
+    """
+    return hashlib.blake2b(context.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class ContextCache:
+    """SQLite-backed store of rendered test contexts keyed by content hash.
+    
+    The shared context of a standard run is stored once any of its tests
+    fails, so that recovery can re-send it without re-tokenizing the novel
+    and rebuilding the context. Depth-aware runs build one context per
+    assignment and are not cached.
+    Entries older than max_age are pruned when the database is opened.
+    The cache may be used from executor threads.
+    """
+    
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        max_age: float = DEFAULT_CONTEXT_MAX_AGE
+    ):
+        """Initialize the cache.
+        
+        Args:
+            db_path: Path to the SQLite database (default: hogwarts_cache.sqlite
+                in the cache directory). The database is opened lazily.
+            max_age: Seconds an entry is kept after it was last stored.
+        """
+        self.db_path = db_path
+        self.max_age = max_age
+        self._conn = None
+        self._lock = threading.Lock()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, create the table and prune stale entries on first use."""
+        if self._conn is None:
+            db_path = self.db_path or str(get_cache_dir() / "hogwarts_cache.sqlite")
+            conn = sqlite3.connect(db_path, check_same_thread=False)
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS contexts ("
+                    "context_hash TEXT PRIMARY KEY, context TEXT NOT NULL, "
+                    "stored_at REAL NOT NULL)"
+                )
+                conn.execute(
+                    "DELETE FROM contexts WHERE stored_at < ?",
+                    (time.time() - self.max_age,)
+                )
+            self._conn = conn
+        return self._conn
+    
+    def get(self, context_hash: str) -> Optional[str]:
+        """Look up a context by hash.
+        
+        Args:
+            context_hash: Hash from hash_context().
+        
+        Returns:
+            Context text, or None if not cached or the cache is unavailable.
+        """
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT context FROM contexts WHERE context_hash = ?",
+                    (context_hash,)
+                ).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Context cache lookup failed: {e}")
+            return None
+        return row[0] if row else None
+    
+    def put(self, context_hash: str, context: str) -> None:
+        """Store a context under its hash, or refresh its age if present.
+        
+        Cache write failures are logged and otherwise ignored.
+        
+        Args:
+            context_hash: Hash from hash_context().
+            context: Context text.
+        """
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    now = time.time()
+                    updated = conn.execute(
+                        "UPDATE contexts SET stored_at = ? WHERE context_hash = ?",
+                        (now, context_hash)
+                    ).rowcount
+                    if not updated:
+                        conn.execute(
+                            "INSERT INTO contexts (context_hash, context, stored_at) "
+                            "VALUES (?, ?, ?)",
+                            (context_hash, context, now)
+                        )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Context cache write failed: {e}")
+    
+    def close(self) -> None:
+        """Close the database connection if open."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class TokenCache:
+    """On-disk cache of tokenized texts, memory-mapped on reuse.
+    
+    Tokens are stored as packed native int32 in one file per (text,
+    encoding) pair. A hit maps the file read-only and returns an int32
+    memoryview over it, so a novel is neither re-tokenized nor copied
+    into process memory; slices are served from the OS page cache.
+    """
+    
+    def __init__(self, cache_dir: Optional[str] = None):
+        """Initialize the cache.
+        
+        Args:
+            cache_dir: Directory for token files (default: "tokens" in the
+                cache directory). Created on first write.
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+    
+    def _path_for(self, tokenizer: "Tokenizer", text: str) -> Path:
+        """Get the token file path for a text and encoding."""
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(tokenizer.encoding_id.encode('utf-8'))
+        hasher.update(b"\0")
+        hasher.update(text.encode('utf-8'))
+        cache_dir = self.cache_dir or get_cache_dir() / "tokens"
+        return cache_dir / f"{hasher.hexdigest()}.i32"
+    
+    def encode(self, tokenizer: "Tokenizer", text: str) -> Sequence[int]:
+        """Tokenize text, reusing the token file from an earlier run if present.
+        
+        Cache read and write failures are logged and fall back to plain
+        tokenization.
+        
+        Args:
+            tokenizer: Tokenizer to encode with.
+            text: Text to tokenize.
+        
+        Returns:
+            Token IDs: an int32 memoryview on a cache hit, else an int32
+            array.
+        """
+        try:
+            path = self._path_for(tokenizer, text)
+            tokens = self._load(path)
+        except OSError as e:
+            logger.warning(f"Token cache lookup failed: {e}")
+            return array('i', tokenizer.encode(text))
+        
+        if tokens is not None:
+            logger.info(f"Loaded {len(tokens)} cached tokens from {path}")
+            return tokens
+        
+        tokens = array('i', tokenizer.encode(text))
+        try:
+            self._save(path, tokens)
+        except OSError as e:
+            logger.warning(f"Token cache write failed: {e}")
+        return tokens
+    
+    @staticmethod
+    def _load(path: Path) -> Optional[memoryview]:
+        """Memory-map a token file, or return None if it does not exist."""
+        try:
+            with open(path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return memoryview(array('i'))
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return None
+        return memoryview(mapped).cast('i')
+    
+    @staticmethod
+    def _save(path: Path, tokens: Sequence[int]) -> None:
+        """Write tokens atomically so concurrent runs never see a partial file."""
+        if not (isinstance(tokens, array) and tokens.typecode == 'i'):
+            tokens = array('i', tokens)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            tokens.tofile(f)
+        os.replace(tmp_path, path)
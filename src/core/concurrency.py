@@ -0,0 +1,196 @@
+"""Adaptive concurrency control for LLM API calls."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveSemaphore:
+    """Semaphore whose capacity follows an AIMD (additive increase,
+    multiplicative decrease) policy.
+    
+    Capacity starts at ``max_capacity``, is halved whenever the provider
+    signals overload (HTTP 429 or 5xx), and grows by one after every
+    ``increase_every`` successful requests, always clamped to
+    ``[1, max_capacity]``. This lets a run converge to the provider's real
+    limit without hand-tuning ``--concurrency``.
+    
+    The LLM client reports outcomes through ``on_success`` and
+    ``on_rate_limit``; callers use the semaphore with ``async with``.
+    """
+    
+    def __init__(
+        self,
+        max_capacity: int,
+        increase_every: int = 100,
+        decrease_cooldown: float = 1.0
+    ):
+        """Initialize the semaphore.
+        
+        Args:
+            max_capacity: Upper bound on concurrent holders (the --concurrency cap).
+            increase_every: Number of successes required to raise capacity by one.
+            decrease_cooldown: Minimum seconds between two capacity halvings, so
+                a burst of simultaneous 429s only backs off once.
+        """
+        if max_capacity <= 0:
+            raise ValueError("max_capacity must be positive")
+        
+        self.max_capacity = max_capacity
+        self.capacity = max_capacity
+        self.increase_every = increase_every
+        self.decrease_cooldown = decrease_cooldown
+        
+        self._in_use = 0
+        self._successes = 0
+        self._last_decrease = float('-inf')
+        self._waiters: deque = deque()
+    
+    @property
+    def in_use(self) -> int:
+        """Number of currently held slots."""
+        return self._in_use
+    
+    async def acquire(self):
+        """Wait until a slot is available under the current capacity."""
+        while self._in_use >= self.capacity:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                elif not waiter.cancelled():
+                    # We were woken but are leaving; pass the slot on
+                    self._wake_waiters()
+                raise
+        self._in_use += 1
+    
+    def release(self):
+        """Release a slot and wake waiters that now fit under capacity."""
+        self._in_use -= 1
+        self._wake_waiters()
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        self.release()
+    
+    def on_success(self):
+        """Record a successful request; raise capacity every N successes."""
+        self._successes += 1
+        if self._successes >= self.increase_every:
+            self._successes = 0
+            if self.capacity < self.max_capacity:
+                self.capacity += 1
+                logger.info(f"Concurrency increased to {self.capacity}/{self.max_capacity}")
+                self._wake_waiters()
+    
+    def on_rate_limit(self, retry_after: Optional[float] = None):
+        """Record a rate-limit or server overload response; halve capacity.
+        
+        Args:
+            retry_after: Retry-After hint from the provider in seconds, used
+                as the cooldown before another halving if it is longer.
+        """
+        now = time.monotonic()
+        cooldown = max(self.decrease_cooldown, retry_after or 0.0)
+        if now - self._last_decrease < cooldown:
+            return
+        
+        self._last_decrease = now
+        self._successes = 0
+        new_capacity = max(1, self.capacity // 2)
+        if new_capacity != self.capacity:
+            self.capacity = new_capacity
+            logger.warning(f"Concurrency reduced to {self.capacity}/{self.max_capacity}")
+    
+    def _wake_waiters(self):
+        """Wake as many waiters as there are free slots."""
+        free = self.capacity - self._in_use
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+
+class RateLimiter:
+    """Token-bucket limiter for requests and tokens per minute.
+    
+    Where AdaptiveSemaphore bounds the number of in-flight requests, this
+    bounds throughput, so a run can use the provider's full RPM/TPM quota
+    without triggering 429 retry storms. Each bucket holds up to one
+    minute of quota and refills continuously.
+    
+    Quota is reserved synchronously before waiting, so callers are served
+    in arrival order without a lock; a request larger than the bucket
+    waits until the debt it leaves has been refilled.
+    """
+    
+    def __init__(self, requests_per_minute: int = 0, tokens_per_minute: int = 0):
+        """Initialize the limiter.
+        
+        Args:
+            requests_per_minute: Request quota per minute (0 for no limit).
+            tokens_per_minute: Token quota per minute (0 for no limit).
+        """
+        if requests_per_minute < 0 or tokens_per_minute < 0:
+            raise ValueError("Rate limits must be non-negative")
+        
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        
+        # Buckets start full; levels go negative while quota is owed
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute)
+        self._updated = time.monotonic()
+    
+    def reserve(self, tokens: int = 0) -> float:
+        """Take quota for one request of the given size.
+        
+        Args:
+            tokens: Estimated tokens the request consumes.
+        
+        Returns:
+            Seconds to wait before the request may be sent.
+        """
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        
+        delay = 0.0
+        if self.requests_per_minute:
+            rate = self.requests_per_minute / 60.0
+            self._requests = min(
+                float(self.requests_per_minute), self._requests + elapsed * rate
+            ) - 1
+            if self._requests < 0:
+                delay = -self._requests / rate
+        if self.tokens_per_minute:
+            rate = self.tokens_per_minute / 60.0
+            self._tokens = min(
+                float(self.tokens_per_minute), self._tokens + elapsed * rate
+            ) - tokens
+            if self._tokens < 0:
+                delay = max(delay, -self._tokens / rate)
+        return delay
+    
+    async def acquire(self, tokens: int = 0):
+        """Wait until one request of the given size fits the rate limits.
+        
+        Args:
+            tokens: Estimated tokens the request consumes.
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            logger.debug("Rate limit reached, waiting %.2fs", delay)
+            await asyncio.sleep(delay)
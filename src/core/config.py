@@ -42,6 +42,13 @@ class Config:
             "default_retry_times": int(os.getenv("DEFAULT_RETRY_TIMES", "3")),
             "default_retry_delay": int(os.getenv("DEFAULT_RETRY_DELAY", "5")),
             "interactive_retry": os.getenv("INTERACTIVE_RETRY", "").lower() in ("true", "1", "yes"),
+            
+            # Rate Limits (0 disables the limit)
+            "rate_limit_rpm": int(os.getenv("RATE_LIMIT_RPM", "0")),
+            "rate_limit_tpm": int(os.getenv("RATE_LIMIT_TPM", "0")),
+            
+            # Prompt Caching
+            "prompt_cache": os.getenv("PROMPT_CACHE", "").lower() in ("true", "1", "yes"),
         }
         
         return config
@@ -81,6 +88,9 @@ class Config:
         if config["timeout"] <= 0:
             raise ValueError("timeout must be positive")
         
+        if config.get("rate_limit_rpm", 0) < 0 or config.get("rate_limit_tpm", 0) < 0:
+            raise ValueError("Rate limits must be non-negative")
+        
         return True
     
     @staticmethod
@@ -106,4 +116,7 @@ class Config:
             "enable_thinking": config.get("enable_thinking", False),
             "thinking_style": config.get("thinking_style", "openai"),
             "interactive_retry": config.get("interactive_retry", False),
+            "rate_limit_rpm": config.get("rate_limit_rpm", 0),
+            "rate_limit_tpm": config.get("rate_limit_tpm", 0),
+            "prompt_cache": config.get("prompt_cache", False),
         }
@@ -1,9 +1,83 @@
 """File I/O utilities for reading novels and writing JSONL files."""
 
 import json
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterable, List, Optional
 from pathlib import Path
 
+import orjson
+
+
+# Serialize non-string dict keys (e.g. int context lengths) the way json.dumps does
+_ORJSON_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+
+# Output buffer size for JSONL writers
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+class JsonlWriter:
+    """Incremental JSONL writer.
+    
+    Writes the optional metadata line when opened and then one line per
+    record through a 1 MiB buffer, so records can be streamed to disk as
+    they are produced instead of collected into a list first.
+    
+    Usage:
+        with JsonlWriter(path, metadata) as writer:
+            for record in records:
+                writer.write(record)
+    """
+    
+    def __init__(self, file_path: str, metadata: Optional[Dict[str, Any]] = None):
+        """Open the output file and write the metadata line.
+        
+        Args:
+            file_path: Output file path. Parent directories are created.
+            metadata: Optional metadata to include as first line.
+        
+        Raises:
+            IOError: If file cannot be opened or written.
+        """
+        path = Path(file_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        try:
+            self._file = open(path, 'wb', buffering=_WRITE_BUFFER_SIZE)
+        except Exception as e:
+            raise IOError(f"Failed to write JSONL file: {e}")
+        
+        self.count = 0
+        if metadata:
+            self._write_line({"metadata": metadata})
+    
+    def _write_line(self, item: Dict[str, Any]) -> None:
+        try:
+            self._file.write(orjson.dumps(item, option=_ORJSON_OPTIONS))
+        except Exception as e:
+            raise IOError(f"Failed to write JSONL file: {e}")
+    
+    def write(self, item: Dict[str, Any]) -> None:
+        """Write one record as a JSON line.
+        
+        Args:
+            item: Dictionary to write.
+        
+        Raises:
+            IOError: If the record cannot be serialized or written.
+        """
+        self._write_line(item)
+        self.count += 1
+    
+    def close(self) -> None:
+        """Flush buffered lines and close the file."""
+        if not self._file.closed:
+            self._file.close()
+    
+    def __enter__(self) -> "JsonlWriter":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
 
 class FileIO:
     """Utilities for file input/output operations."""
@@ -34,32 +108,38 @@ class FileIO:
             raise IOError(f"Failed to read novel file: {e}")
     
     @staticmethod
-    def write_jsonl(file_path: str, data: List[Dict[str, Any]], 
+    def write_jsonl(file_path: str, data: Iterable[Dict[str, Any]], 
                    metadata: Dict[str, Any] = None) -> None:
         """Write data to JSONL file with optional metadata.
         
         Args:
             file_path: Output file path.
-            data: List of dictionaries to write.
+            data: Dictionaries to write. Any iterable is accepted, so a
+                generator is written without being materialized.
             metadata: Optional metadata to include as first line.
             
         Raises:
             IOError: If file cannot be written.
         """
-        path = Path(file_path)
-        path.parent.mkdir(parents=True, exist_ok=True)
+        with JsonlWriter(file_path, metadata) as writer:
+            for item in data:
+                writer.write(item)
+    
+    @staticmethod
+    def open_jsonl(file_path: str, metadata: Dict[str, Any] = None) -> JsonlWriter:
+        """Open a JSONL file for incremental writing.
         
-        try:
-            with open(path, 'w', encoding='utf-8') as f:
-                # Write metadata as first line if provided
-                if metadata:
-                    f.write(json.dumps({"metadata": metadata}, ensure_ascii=False) + '\n')
-                
-                # Write each data item as a JSON line
-                for item in data:
-                    f.write(json.dumps(item, ensure_ascii=False) + '\n')
-        except Exception as e:
-            raise IOError(f"Failed to write JSONL file: {e}")
+        Args:
+            file_path: Output file path.
+            metadata: Optional metadata to include as first line.
+        
+        Returns:
+            JsonlWriter to write records to; use as a context manager.
+        
+        Raises:
+            IOError: If file cannot be opened.
+        """
+        return JsonlWriter(file_path, metadata)
     
     @staticmethod
     def read_jsonl(file_path: str) -> tuple[Dict[str, Any], List[Dict[str, Any]]]:
@@ -82,14 +162,14 @@ class FileIO:
             raise FileNotFoundError(f"JSONL file not found: {file_path}")
         
         try:
-            with open(path, 'r', encoding='utf-8') as f:
+            with open(path, 'rb') as f:
                 lines = f.readlines()
             
             if not lines:
                 return {}, []
             
             # Check if first line is metadata
-            first_line = json.loads(lines[0])
+            first_line = orjson.loads(lines[0])
             if "metadata" in first_line:
                 metadata = first_line["metadata"]
                 data_lines = lines[1:]
@@ -98,7 +178,7 @@ class FileIO:
                 data_lines = lines
             
             # Parse data lines
-            data = [json.loads(line) for line in data_lines if line.strip()]
+            data = [orjson.loads(line) for line in data_lines if line.strip()]
             
             return metadata, data
         except json.JSONDecodeError as e:
@@ -4,7 +4,12 @@ import asyncio
 import logging
 import time
 from typing import Dict, List, Optional
-from openai import AsyncOpenAI, OpenAIError, APITimeoutError, RateLimitError, APIConnectionError
+from openai import (
+    AsyncOpenAI, OpenAIError, APITimeoutError, RateLimitError, APIConnectionError,
+    InternalServerError
+)
+
+from .concurrency import RateLimiter
 
 
 # Configure logging
@@ -30,6 +35,9 @@ class LLMClient:
                 - timeout: Request timeout in seconds
                 - user_agent: Custom User-Agent header (optional)
                 - enable_thinking: Enable thinking/reasoning output (optional)
+                - rate_limit_rpm: Requests per minute limit, 0 for none (optional)
+                - rate_limit_tpm: Tokens per minute limit, 0 for none (optional)
+                - prompt_cache: Mark prompt prefixes as cache breakpoints (optional)
         """
         self.config = config
         
@@ -54,12 +62,37 @@ class LLMClient:
         self.enable_thinking = config.get("enable_thinking", False)
         self.thinking_style = config.get("thinking_style", "openai")
         self.interactive_retry = config.get("interactive_retry", False)
+        self.prompt_cache = config.get("prompt_cache", False)
+        self.concurrency_listener = None
+        
+        # Throughput limit shared by every request made through this client
+        rpm = config.get("rate_limit_rpm", 0)
+        tpm = config.get("rate_limit_tpm", 0)
+        self.rate_limiter = RateLimiter(rpm, tpm) if rpm or tpm else None
+    
+    def set_concurrency_listener(self, listener) -> None:
+        """Register an object notified of request outcomes.
+        
+        The listener (typically an AdaptiveSemaphore) receives
+        ``on_success()`` after each successful request and
+        ``on_rate_limit(retry_after)`` on HTTP 429 or 5xx responses.
+        
+        Args:
+            listener: Listener object, or None to detach the current one
+        """
+        self.concurrency_listener = listener
+    
+    async def close(self) -> None:
+        """Close the HTTP connection pool shared by all requests."""
+        await self.client.close()
     
     async def generate(
         self, 
         prompt: str, 
         system_prompt: Optional[str] = None,
-        max_retries: int = 3
+        max_retries: int = 3,
+        prompt_prefix: Optional[str] = None,
+        prompt_tokens: Optional[int] = None
     ) -> Optional[str]:
         """Generate response from LLM.
         
@@ -67,6 +100,14 @@ class LLMClient:
             prompt: User prompt text
             system_prompt: Optional system prompt
             max_retries: Maximum number of retry attempts
+            prompt_prefix: Optional user prompt text sent before ``prompt``
+                that is shared across requests. With prompt_cache enabled it
+                is sent as a separate content part carrying an ephemeral
+                cache_control breakpoint, for providers that only cache
+                marked prefixes (e.g. Anthropic models).
+            prompt_tokens: Optional token count of the system and user
+                prompts, counted against the TPM limit. Estimated from
+                their UTF-8 byte count when omitted.
             
         Returns:
             Generated response text, or None if all retries failed
@@ -74,12 +115,25 @@ class LLMClient:
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+        if prompt_prefix is None:
+            messages.append({"role": "user", "content": prompt})
+        elif self.prompt_cache:
+            content = [{
+                "type": "text",
+                "text": prompt_prefix,
+                "cache_control": {"type": "ephemeral"}
+            }]
+            if prompt:
+                content.append({"type": "text", "text": prompt})
+            messages.append({"role": "user", "content": content})
+        else:
+            messages.append({"role": "user", "content": prompt_prefix + prompt})
         
         return await self._retry_with_backoff(
             self._single_generate,
             messages,
-            max_retries
+            max_retries,
+            prompt_tokens
         )
     
     async def generate_batch(
@@ -191,7 +245,8 @@ class LLMClient:
         self,
         func,
         messages: List[Dict],
-        max_retries: int = 3
+        max_retries: int = 3,
+        prompt_tokens: Optional[int] = None
     ) -> Optional[str]:
         """Retry failed requests with exponential backoff.
         
@@ -199,23 +254,34 @@ class LLMClient:
             func: Async function to retry
             messages: Messages to pass to the function
             max_retries: Maximum number of retry attempts
+            prompt_tokens: Known prompt token count for the rate limiter
             
         Returns:
             Function result, or None if all retries failed
         """
         base_delay = 1  # Initial delay in seconds
+        request_tokens = (
+            self._estimate_tokens(messages, prompt_tokens)
+            if self.rate_limiter is not None else 0
+        )
         
         while True:
             for attempt in range(max_retries):
                 try:
+                    if self.rate_limiter is not None:
+                        await self.rate_limiter.acquire(request_tokens)
                     result = await func(messages)
                     if attempt > 0:
                         logger.info(f"Request succeeded on attempt {attempt + 1}")
+                    if self.concurrency_listener is not None:
+                        self.concurrency_listener.on_success()
                     return result
                 
                 except RateLimitError as e:
+                    self._notify_rate_limit(e)
                     if attempt < max_retries - 1:
-                        delay = base_delay * (2 ** attempt)
+                        # Never retry sooner than the provider asked us to
+                        delay = max(base_delay * (2 ** attempt), self._retry_after(e) or 0)
                         logger.warning(
                             f"Rate limit hit, retrying in {delay}s "
                             f"(attempt {attempt + 1}/{max_retries})"
@@ -243,6 +309,8 @@ class LLMClient:
                 
                 except OpenAIError as e:
                     # For other API errors, don't retry
+                    if isinstance(e, InternalServerError):
+                        self._notify_rate_limit(e)
                     logger.error(f"Non-retryable API error: {e}")
                     return None
                 
@@ -259,6 +327,65 @@ class LLMClient:
             
             return None
     
+    def _estimate_tokens(
+        self,
+        messages: List[Dict],
+        prompt_tokens: Optional[int] = None
+    ) -> int:
+        """Estimate the tokens a request counts against the TPM limit.
+        
+        Uses the caller's prompt token count when given. Otherwise the
+        UTF-8 byte count of the messages is used, an upper bound for
+        byte-level BPE tokenizers since every token covers at least one
+        byte. The completion budget that providers reserve up front is
+        added either way.
+        
+        Args:
+            messages: List of message dictionaries
+            prompt_tokens: Known prompt token count, if any
+        
+        Returns:
+            Estimated token count
+        """
+        if prompt_tokens is None:
+            prompt_tokens = 0
+            for message in messages:
+                content = message["content"]
+                if isinstance(content, str):
+                    prompt_tokens += len(content.encode("utf-8"))
+                else:
+                    prompt_tokens += sum(len(part["text"].encode("utf-8")) for part in content)
+        return prompt_tokens + self.max_tokens
+    
+    def _notify_rate_limit(self, error: OpenAIError) -> None:
+        """Report a 429/5xx response to the concurrency listener.
+        
+        Args:
+            error: The API error carrying the HTTP response
+        """
+        if self.concurrency_listener is None:
+            return
+        
+        self.concurrency_listener.on_rate_limit(self._retry_after(error))
+    
+    @staticmethod
+    def _retry_after(error: OpenAIError) -> Optional[float]:
+        """Get the Retry-After hint of an API error.
+        
+        Args:
+            error: The API error carrying the HTTP response
+        
+        Returns:
+            Seconds to wait before retrying, or None if not given
+        """
+        response = getattr(error, "response", None)
+        if response is None:
+            return None
+        try:
+            return float(response.headers.get("retry-after", ""))
+        except ValueError:
+            return None
+    
     async def _prompt_interactive_retry(self, error: Exception) -> bool:
         """Prompt user for interactive retry decision.
         
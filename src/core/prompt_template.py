@@ -5,12 +5,77 @@ This module provides the PromptTemplateManager class for loading and managing
 prompt templates used in question generation and testing.
 """
 
+import functools
 import json
 import os
-from typing import Dict, Any, Optional
+from string import Formatter
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=32)
+def _split_context_template(template: str) -> Optional[Tuple[str, str]]:
+    """
+    Split a prompt template around its single {context} field.
+    
+    Args:
+        template: User prompt template
+    
+    Returns:
+        (prefix, suffix) templates that, formatted with the remaining
+        fields, surround the context; None if {context} does not appear
+        exactly once as a plain field
+    """
+    parts = ([], [])
+    side = 0
+    for literal, field, spec, conversion in Formatter().parse(template):
+        parts[side].append(literal.replace("{", "{{").replace("}", "}}"))
+        if field is None:
+            continue
+        if field == "context" and not spec and conversion is None:
+            if side:
+                return None
+            side = 1
+            continue
+        conversion = f"!{conversion}" if conversion else ""
+        spec = f":{spec}" if spec else ""
+        parts[side].append(f"{{{field}{conversion}{spec}}}")
+    
+    if not side:
+        return None
+    return "".join(parts[0]), "".join(parts[1])
+
+
+def _format_with_context(template: str, context: str, **fields: Any) -> str:
+    """
+    Format a prompt template whose context may be very large.
+    
+    str.format grows its output buffer while copying a multi-megabyte
+    context; formatting only the small pieces around it and joining
+    copies the context once into a presized string.
+    """
+    split = _split_context_template(template)
+    if split is None:
+        return template.format(context=context, **fields)
+    prefix, suffix = split
+    return "".join((prefix.format(**fields), context, suffix.format(**fields)))
+
+
+def _format_split_after_context(template: str, context: str, **fields: Any) -> Tuple[str, str]:
+    """
+    Format a prompt template as the text up to the end of its context and
+    the text after it.
+    
+    Joined, the two parts equal _format_with_context(). If the template
+    has no single plain {context} field, the whole prompt is the head.
+    """
+    split = _split_context_template(template)
+    if split is None:
+        return template.format(context=context, **fields), ""
+    prefix, suffix = split
+    return prefix.format(**fields) + context, suffix.format(**fields)
+
+
 class PromptTemplateManager:
     """
     Manages prompt templates for question generation and testing.
@@ -358,8 +423,9 @@ class PromptTemplateManager:
         template = self.question_generation_template
         
         system_prompt = template["system"]
-        user_prompt = template["user"].format(
-            context=context,
+        user_prompt = _format_with_context(
+            template["user"],
+            context,
             question_type=question_type
         )
         
@@ -390,14 +456,53 @@ class PromptTemplateManager:
         ])
         
         system_prompt = template["system"]
-        user_prompt = template["user"].format(
-            context=context,
+        user_prompt = _format_with_context(
+            template["user"],
+            context,
             question=question,
             choices=choices_str
         )
         
         return system_prompt, user_prompt
     
+    def get_split_testing_prompt(
+        self,
+        context: str,
+        question: str,
+        choices: Dict[str, str]
+    ) -> Tuple[str, str, str]:
+        """
+        Get the testing prompt with the user prompt split after the context.
+        
+        The head (everything up to and including the context) is the same
+        for every question tested against one context, so it can be marked
+        as a prompt cache breakpoint.
+        
+        Args:
+            context: The text context for answering the question.
+            question: The question text.
+            choices: Dictionary of answer choices (e.g., {"a": "...", "b": "..."}).
+        
+        Returns:
+            Tuple of (system_prompt, user_head, user_tail); user_head +
+            user_tail is the user prompt from get_testing_prompt().
+        """
+        template = self.testing_template
+        
+        # Format choices as a readable string
+        choices_str = "\n".join([
+            f"{key}. {value}" for key, value in choices.items()
+        ])
+        
+        user_head, user_tail = _format_split_after_context(
+            template["user"],
+            context,
+            question=question,
+            choices=choices_str
+        )
+        
+        return template["system"], user_head, user_tail
+    
     def load_custom_template(
         self,
         template_path: str,
@@ -459,8 +564,9 @@ class PromptTemplateManager:
         template = self.validation_template
         
         system_prompt = template["system"]
-        user_prompt = template["user"].format(
-            context=context,
+        user_prompt = _format_with_context(
+            template["user"],
+            context,
             question=question,
             choices=choices
         )
@@ -1,10 +1,17 @@
 """Tokenizer wrapper using tiktoken for consistent tokenization."""
 
 import re
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
 import tiktoken
 
 
+# Sentence boundary: punctuation followed by whitespace or newline
+_SENTENCE_BOUNDARY_RE = re.compile(r'[.!?][\s\n]')
+
+# Paragraph boundary: double newlines
+_PARAGRAPH_BOUNDARY_RE = re.compile(r'\n\n')
+
+
 class Tokenizer:
     """Wrapper for tiktoken encoder with boundary detection utilities."""
     
@@ -16,6 +23,11 @@ class Tokenizer:
         """
         self.encoder = tiktoken.get_encoding(encoding_name)
     
+    @property
+    def encoding_id(self) -> str:
+        """Identifier of the encoding and tiktoken version, for cache keys."""
+        return f"{self.encoder.name}-tiktoken{tiktoken.__version__}"
+    
     def encode(self, text: str) -> List[int]:
         """Convert text to token IDs.
         
@@ -27,17 +39,63 @@ class Tokenizer:
         """
         return self.encoder.encode(text)
     
-    def decode(self, tokens: List[int]) -> str:
+    def decode(self, tokens: Sequence[int]) -> str:
         """Convert token IDs to text.
         
         Args:
-            tokens: List of token IDs.
+            tokens: Token IDs (a list, array or memoryview).
             
         Returns:
             Decoded text string.
         """
         return self.encoder.decode(tokens)
     
+    def decode_bytes(self, tokens: Sequence[int]) -> bytes:
+        """Convert token IDs to raw UTF-8 bytes.
+        
+        Unlike decode(), the result can be split at any token boundary and
+        re-joined before decoding without mangling multi-byte characters.
+        
+        Args:
+            tokens: Token IDs (a list, array or memoryview).
+            
+        Returns:
+            Decoded bytes.
+        """
+        return self.encoder.decode_bytes(tokens)
+    
+    def decode_range(self, tokens: Sequence[int], start: int, end: int) -> str:
+        """Convert the token IDs in tokens[start:end] to text.
+        
+        Buffer-backed tokens (an array or memoryview) are sliced through a
+        memoryview, so the range is decoded without copying it first.
+        Lists are sliced as usual.
+        
+        Args:
+            tokens: Token IDs (a list, array or memoryview).
+            start: Start index (inclusive).
+            end: End index (exclusive).
+            
+        Returns:
+            Decoded text string.
+        """
+        try:
+            view = memoryview(tokens)
+        except TypeError:
+            return self.decode(tokens[start:end])
+        return self.decode(view[start:end])
+    
+    def token_bytes(self, token: int) -> bytes:
+        """Get the raw bytes of a single token.
+        
+        Args:
+            token: Token ID.
+            
+        Returns:
+            Bytes the token decodes to.
+        """
+        return self.encoder.decode_single_token_bytes(token)
+    
     def count_tokens(self, text: str) -> int:
         """Count tokens in text.
         
@@ -61,18 +119,14 @@ class Tokenizer:
         Returns:
             Position of nearest sentence boundary, or target_pos if none found.
         """
-        # Sentence boundary pattern: punctuation followed by whitespace or newline
-        sentence_pattern = r'[.!?][\s\n]'
-        
         if direction == "forward":
             # Search forward from target_pos
-            match = re.search(sentence_pattern, text[target_pos:])
+            match = _SENTENCE_BOUNDARY_RE.search(text, target_pos)
             if match:
-                return target_pos + match.end()
+                return match.end()
         else:
             # Search backward from target_pos
-            text_before = text[:target_pos]
-            matches = list(re.finditer(sentence_pattern, text_before))
+            matches = list(_SENTENCE_BOUNDARY_RE.finditer(text, 0, target_pos))
             if matches:
                 return matches[-1].end()
         
@@ -90,16 +144,12 @@ class Tokenizer:
         Returns:
             Position of nearest paragraph boundary, or target_pos if none found.
         """
-        # Paragraph boundary: double newlines
-        paragraph_pattern = r'\n\n'
-        
         if direction == "forward":
-            match = re.search(paragraph_pattern, text[target_pos:])
+            match = _PARAGRAPH_BOUNDARY_RE.search(text, target_pos)
             if match:
-                return target_pos + match.end()
+                return match.end()
         else:
-            text_before = text[:target_pos]
-            matches = list(re.finditer(paragraph_pattern, text_before))
+            matches = list(_PARAGRAPH_BOUNDARY_RE.finditer(text, 0, target_pos))
             if matches:
                 return matches[-1].end()
         
@@ -214,7 +264,7 @@ class Tokenizer:
             search_text = self.decode(search_tokens)
             
             # Try paragraph boundary first
-            para_match = re.search(r'\n\n', search_text)
+            para_match = _PARAGRAPH_BOUNDARY_RE.search(search_text)
             if para_match:
                 # Find token position corresponding to this character position
                 text_before_boundary = search_text[:para_match.end()]
@@ -222,7 +272,7 @@ class Tokenizer:
                 return pos + boundary_tokens
             
             # Try sentence boundary
-            sent_match = re.search(r'[.!?][\s\n]', search_text)
+            sent_match = _SENTENCE_BOUNDARY_RE.search(search_text)
             if sent_match:
                 text_before_boundary = search_text[:sent_match.end()]
                 boundary_tokens = len(self.encode(text_before_boundary))
@@ -235,7 +285,7 @@ class Tokenizer:
             search_text = self.decode(search_tokens)
             
             # Try paragraph boundary
-            para_matches = list(re.finditer(r'\n\n', search_text))
+            para_matches = list(_PARAGRAPH_BOUNDARY_RE.finditer(search_text))
             if para_matches:
                 last_match = para_matches[-1]
                 text_before_boundary = search_text[:last_match.end()]
@@ -243,7 +293,7 @@ class Tokenizer:
                 return search_start + boundary_tokens
             
             # Try sentence boundary
-            sent_matches = list(re.finditer(r'[.!?][\s\n]', search_text))
+            sent_matches = list(_SENTENCE_BOUNDARY_RE.finditer(search_text))
             if sent_matches:
                 last_match = sent_matches[-1]
                 text_before_boundary = search_text[:last_match.end()]
@@ -269,12 +319,12 @@ class Tokenizer:
         # Try paragraph boundary first
         if direction == "forward":
             search_text = text[pos:pos + max_search]
-            para_match = re.search(r'\n\n', search_text)
+            para_match = _PARAGRAPH_BOUNDARY_RE.search(search_text)
             if para_match:
                 return pos + para_match.end()
             
             # Try sentence boundary
-            sent_match = re.search(r'[.!?][\s\n]', search_text)
+            sent_match = _SENTENCE_BOUNDARY_RE.search(search_text)
             if sent_match:
                 return pos + sent_match.end()
         else:
@@ -282,12 +332,12 @@ class Tokenizer:
             search_text = text[search_start:pos]
             
             # Try paragraph boundary
-            para_matches = list(re.finditer(r'\n\n', search_text))
+            para_matches = list(_PARAGRAPH_BOUNDARY_RE.finditer(search_text))
             if para_matches:
                 return search_start + para_matches[-1].end()
             
             # Try sentence boundary
-            sent_matches = list(re.finditer(r'[.!?][\s\n]', search_text))
+            sent_matches = list(_SENTENCE_BOUNDARY_RE.finditer(search_text))
             if sent_matches:
                 return search_start + sent_matches[-1].end()
         
@@ -9,10 +9,12 @@ LLM generation, validation, and saving results.
 import asyncio
 import json
 import logging
+import re
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
+from ..core.cache import TokenCache
 from ..core.llm_client import LLMClient
 from ..core.tokenizer import Tokenizer
 from ..core.validator import QuestionValidator
@@ -26,6 +28,9 @@ from .summary_generator import SummaryGenerator
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# JSON object inside a markdown code block, e.g. ```json {...} ```
+_CODE_BLOCK_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+
 
 class QuestionGenerator:
     """
@@ -55,6 +60,7 @@ class QuestionGenerator:
         """
         self.llm_client = llm_client
         self.tokenizer = tokenizer or Tokenizer()
+        self.token_cache = TokenCache()
         self.prompt_manager = prompt_manager or PromptTemplateManager()
         self.validator = validator or QuestionValidator()
         self.summary_generator = summary_generator or SummaryGenerator(
@@ -107,9 +113,9 @@ class QuestionGenerator:
         logger.info("Reading novel text...")
         novel_text = FileIO.read_novel(novel_path)
         
-        # Tokenize novel
+        # Tokenize novel, reusing tokens cached by an earlier run
         logger.info("Tokenizing novel...")
-        novel_tokens = self.tokenizer.encode(novel_text)
+        novel_tokens = self.token_cache.encode(self.tokenizer, novel_text)
         total_tokens = len(novel_tokens)
         logger.info(f"Novel contains {total_tokens} tokens")
         
@@ -234,9 +240,11 @@ class QuestionGenerator:
                     question_type
                 )
                 
-                # Log context length for debugging
-                context_token_count = len(self.tokenizer.encode(context))
-                logger.debug(f"Context length: {context_token_count} tokens")
+                # Log context length for debugging; re-tokenizing is costly,
+                # so only do it when debug output is on
+                if logger.isEnabledFor(logging.DEBUG):
+                    context_token_count = len(self.tokenizer.encode(context))
+                    logger.debug("Context length: %d tokens", context_token_count)
                 
                 # Generate question via LLM
                 response = await self.llm_client.generate(
@@ -253,7 +261,7 @@ class QuestionGenerator:
                     continue
                 
                 # Log response length for debugging
-                logger.debug(f"Response length: {len(response)} chars")
+                logger.debug("Response length: %d chars", len(response))
                 
                 # Parse JSON response
                 question = self._parse_question_response(response)
@@ -278,7 +286,7 @@ class QuestionGenerator:
                 is_valid, error_msg = self.validator.validate(question)
                 
                 if is_valid:
-                    logger.debug(f"Successfully generated question at position {position}")
+                    logger.debug("Successfully generated question at position %d", position)
                     return question
                 else:
                     logger.warning(
@@ -295,7 +303,8 @@ class QuestionGenerator:
                     f"Error generating question at position {position}: {type(e).__name__}: {e}, "
                     f"attempt {attempt + 1}/{retry_times}"
                 )
-                logger.debug(f"Full traceback: {traceback.format_exc()}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Full traceback: %s", traceback.format_exc())
                 continue
         
         logger.error(
@@ -319,8 +328,6 @@ class QuestionGenerator:
         Returns:
             Parsed question dictionary, or None if parsing failed.
         """
-        import re
-        
         if not response or not response.strip():
             logger.debug("Empty response received")
             return None
@@ -334,11 +341,10 @@ class QuestionGenerator:
             if isinstance(question, dict):
                 return question
         except (json.JSONDecodeError, ValueError) as e:
-            logger.debug(f"Direct JSON parse failed: {e}")
+            logger.debug("Direct JSON parse failed: %s", e)
         
         # Strategy 2: Extract from markdown code blocks
-        code_block_pattern = r'```(?:json)?\s*(\{[\s\S]*?\})\s*```'
-        match = re.search(code_block_pattern, response, re.DOTALL)
+        match = _CODE_BLOCK_RE.search(response)
         if match:
             try:
                 json_str = match.group(1).strip()
@@ -346,7 +352,7 @@ class QuestionGenerator:
                 if isinstance(question, dict):
                     return question
             except (json.JSONDecodeError, ValueError) as e:
-                logger.debug(f"Markdown code block parse failed: {e}")
+                logger.debug("Markdown code block parse failed: %s", e)
         
         # Strategy 3: Extract JSON object with brace matching (handles nested objects)
         try:
@@ -394,10 +400,10 @@ class QuestionGenerator:
                 if isinstance(question, dict):
                     return question
         except (json.JSONDecodeError, ValueError, IndexError) as e:
-            logger.debug(f"Brace matching parse failed: {e}")
+            logger.debug("Brace matching parse failed: %s", e)
         
         # Log first 500 chars of failed response for debugging
-        logger.debug(f"Failed to parse response: {response[:500]}...")
+        logger.debug("Failed to parse response: %.500s...", response)
         return None
     
     async def _generate_questions_concurrent(
@@ -425,7 +431,7 @@ class QuestionGenerator:
         
         async def generate_with_semaphore(pos: int, idx: int) -> Optional[Dict]:
             async with semaphore:
-                logger.info(f"Generating question {idx + 1}/{len(positions)} at position {pos}")
+                logger.info("Generating question %d/%d at position %d", idx + 1, len(positions), pos)
                 
                 # Extract context
                 context, start_pos, end_pos = self._extract_context(
@@ -14,6 +14,7 @@ import os
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
 
+import orjson
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
@@ -194,10 +195,10 @@ def extract_metadata(file_path: str) -> DatasetMetadata:
     metadata = DatasetMetadata()
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
+        with open(file_path, 'rb') as f:
             first_line = f.readline().strip()
             if first_line:
-                data = json.loads(first_line)
+                data = orjson.loads(first_line)
                 if 'metadata' in data:
                     meta = data['metadata']
                     metadata.model_name = meta.get('model_name')
@@ -231,14 +232,14 @@ def load_question_data(file_path: str) -> Tuple[List[QuestionEntry], int, Datase
     skipped_count = 0
     metadata = extract_metadata(file_path)
     
-    with open(file_path, 'r', encoding='utf-8') as f:
+    with open(file_path, 'rb') as f:
         for line_num, line in enumerate(f, 1):
             line = line.strip()
             if not line:
                 continue
                 
             try:
-                data = json.loads(line)
+                data = orjson.loads(line)
                 
                 # Skip metadata lines
                 if 'metadata' in data:
@@ -285,14 +286,14 @@ def load_result_data(file_path: str) -> Tuple[List[ResultEntry], int, DatasetMet
     skipped_count = 0
     metadata = extract_metadata(file_path)
     
-    with open(file_path, 'r', encoding='utf-8') as f:
+    with open(file_path, 'rb') as f:
         for line_num, line in enumerate(f, 1):
             line = line.strip()
             if not line:
                 continue
                 
             try:
-                data = json.loads(line)
+                data = orjson.loads(line)
                 
                 # Skip metadata lines
                 if 'metadata' in data:
@@ -844,14 +845,14 @@ def load_depth_result_data(file_path: str) -> Tuple[List[dict], DatasetMetadata]
     valid_entries = []
     metadata = extract_metadata(file_path)
     
-    with open(file_path, 'r', encoding='utf-8') as f:
+    with open(file_path, 'rb') as f:
         for line_num, line in enumerate(f, 1):
             line = line.strip()
             if not line:
                 continue
             
             try:
-                data = json.loads(line)
+                data = orjson.loads(line)
                 
                 # Skip metadata lines
                 if 'metadata' in data:
@@ -6,6 +6,7 @@ for single-choice and multiple-choice questions, including accuracy,
 precision, recall, F1-score, and result categorization.
 """
 
+from collections import Counter
 from typing import Dict, List, Tuple
 
 
@@ -48,27 +49,7 @@ def calculate_multi_choice_metrics(results: List[dict]) -> Dict[str, float]:
         if result["question_type"] != "multiple_choice":
             continue
             
-        correct = set(result["correct_answer"])
-        predicted = set(result["model_answer"])
-        
-        # Calculate precision
-        if len(predicted) == 0:
-            precision = 0.0
-        else:
-            precision = len(correct & predicted) / len(predicted)
-            
-        # Calculate recall
-        if len(correct) == 0:
-            recall = 0.0
-        else:
-            recall = len(correct & predicted) / len(correct)
-            
-        # Calculate F1-score
-        if precision + recall == 0:
-            f1 = 0.0
-        else:
-            f1 = 2 * (precision * recall) / (precision + recall)
-            
+        precision, recall, f1 = _precision_recall_f1(result)
         precisions.append(precision)
         recalls.append(recall)
         f1_scores.append(f1)
@@ -80,6 +61,41 @@ def calculate_multi_choice_metrics(results: List[dict]) -> Dict[str, float]:
     }
 
 
+def _precision_recall_f1(result: dict) -> Tuple[float, float, float]:
+    """
+    Calculate precision, recall, and F1-score of one multiple-choice result.
+    
+    Args:
+        result: Test result dictionary
+    
+    Returns:
+        Tuple of (precision, recall, f1)
+    """
+    correct = set(result["correct_answer"])
+    predicted = set(result["model_answer"])
+    true_positives = len(correct & predicted)
+        
+    # Calculate precision
+    if len(predicted) == 0:
+        precision = 0.0
+    else:
+        precision = true_positives / len(predicted)
+            
+    # Calculate recall
+    if len(correct) == 0:
+        recall = 0.0
+    else:
+        recall = true_positives / len(correct)
+            
+    # Calculate F1-score
+    if precision + recall == 0:
+        f1 = 0.0
+    else:
+        f1 = 2 * (precision * recall) / (precision + recall)
+            
+    return precision, recall, f1
+
+
 def categorize_result(result: dict) -> str:
     """
     Categorize a test result as correct, partially correct, incorrect, or parsing error.
@@ -190,43 +206,50 @@ def calculate_all_metrics(results: List[dict]) -> Dict[str, any]:
     Returns:
         Dictionary containing all calculated metrics and statistics
     """
-    # Basic counts
-    total_questions = len(results)
-    
-    # Count by question type
-    single_choice_count = sum(1 for r in results if r["question_type"] == "single_choice")
-    multiple_choice_count = sum(1 for r in results if r["question_type"] == "multiple_choice")
-    negative_question_count = sum(1 for r in results if r["question_type"] == "negative_question")
-    
-    # Count by result category
-    categorized_results = [categorize_result(r) for r in results]
-    correct_count = categorized_results.count("correct")
-    partially_correct_count = categorized_results.count("partially_correct")
-    incorrect_count = categorized_results.count("incorrect")
-    parsing_error_count = categorized_results.count("parsing_error")
-    
-    # Calculate accuracy for single-choice questions
-    single_choice_accuracy = calculate_accuracy(results)
-    
-    # Calculate metrics for multiple-choice questions
-    multi_choice_metrics = calculate_multi_choice_metrics(results)
+    # Gather every count and sum in a single pass over the results
+    type_counts = Counter()
+    category_counts = Counter()
+    single_choice_correct = 0
+    precision_total = recall_total = f1_total = 0.0
+    score_total = 0.0
+    
+    for r in results:
+        question_type = r["question_type"]
+        type_counts[question_type] += 1
+        category_counts[categorize_result(r)] += 1
+        score_total += calculate_score(r)
+        
+        if question_type == "single_choice":
+            if r["model_answer"] == r["correct_answer"]:
+                single_choice_correct += 1
+        elif question_type == "multiple_choice":
+            precision, recall, f1 = _precision_recall_f1(r)
+            precision_total += precision
+            recall_total += recall
+            f1_total += f1
     
-    # Calculate overall average score
-    scores = [calculate_score(r) for r in results]
-    avg_score = sum(scores) / len(scores) if scores else 0.0
+    total_questions = len(results)
+    single_choice_count = type_counts["single_choice"]
+    multiple_choice_count = type_counts["multiple_choice"]
     
     return {
         "total_questions": total_questions,
         "single_choice_count": single_choice_count,
         "multiple_choice_count": multiple_choice_count,
-        "negative_question_count": negative_question_count,
-        "correct_count": correct_count,
-        "partially_correct_count": partially_correct_count,
-        "incorrect_count": incorrect_count,
-        "parsing_error_count": parsing_error_count,
-        "single_choice_accuracy": single_choice_accuracy,
-        "multi_choice_precision": multi_choice_metrics["avg_precision"],
-        "multi_choice_recall": multi_choice_metrics["avg_recall"],
-        "multi_choice_f1": multi_choice_metrics["avg_f1"],
-        "average_score": avg_score
+        "negative_question_count": type_counts["negative_question"],
+        "correct_count": category_counts["correct"],
+        "partially_correct_count": category_counts["partially_correct"],
+        "incorrect_count": category_counts["incorrect"],
+        "parsing_error_count": category_counts["parsing_error"],
+        "single_choice_accuracy": (
+            single_choice_correct / single_choice_count if single_choice_count > 0 else 0.0
+        ),
+        "multi_choice_precision": (
+            precision_total / multiple_choice_count if multiple_choice_count > 0 else 0.0
+        ),
+        "multi_choice_recall": (
+            recall_total / multiple_choice_count if multiple_choice_count > 0 else 0.0
+        ),
+        "multi_choice_f1": f1_total / multiple_choice_count if multiple_choice_count > 0 else 0.0,
+        "average_score": score_total / total_questions if total_questions > 0 else 0.0
     }
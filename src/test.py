@@ -10,12 +10,16 @@ based on context length, and executes tests concurrently with answer parsing.
 import argparse
 import asyncio
 import logging
+import os
+import stat
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 from .core.config import Config
 from .core.llm_client import LLMClient
-from .tester.testing_tool import TestingTool
+from .tester.testing_tool import TestingTool, summarize_results
 from .tester.question_checker import QuestionCheckError
 from .tester.depth_scheduler import DepthMode
 
@@ -28,6 +32,92 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Arguments each test mode requires, as (attribute, flag) pairs
+_MODE_REQUIRED_ARGS = {
+    'no-reference': (),
+    'legacy': (('novel', '--novel'), ('context_length', '--context_length')),
+    'uniform': (('novel', '--novel'), ('context_lengths', '--context-lengths')),
+    'fixed': (('novel', '--novel'), ('context_lengths', '--context-lengths'), ('depth', '--depth')),
+}
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for strictly positive integers."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: '{value}'")
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be positive, got {number}")
+    return number
+
+
+def _non_negative_int(value: str) -> int:
+    """argparse type for non-negative integers."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: '{value}'")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be non-negative, got {number}")
+    return number
+
+
+def _unit_float(value: str) -> float:
+    """argparse type for floats in [0.0, 1.0]."""
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid float: '{value}'")
+    if not 0.0 <= number <= 1.0:
+        raise argparse.ArgumentTypeError(f"must be between 0.0 and 1.0, got {number}")
+    return number
+
+
+def _context_lengths(value: str) -> Tuple[int, ...]:
+    """argparse type for a comma-separated list of positive context lengths.
+    
+    Returns a tuple so the parsed lengths can be used as a cache key.
+    """
+    try:
+        return tuple(_positive_int(x.strip()) for x in value.split(','))
+    except argparse.ArgumentTypeError as e:
+        raise argparse.ArgumentTypeError(f"invalid context length list '{value}': {e}")
+
+
+def _resolve_mode(parser: argparse.ArgumentParser, args: argparse.Namespace):
+    """Determine the test mode and check that its arguments are present.
+    
+    Sets ``args.mode`` to one of the keys of ``_MODE_REQUIRED_ARGS``.
+    Exits through ``parser.error`` on missing or conflicting arguments.
+    """
+    if args.no_reference:
+        conflicting = [
+            flag for flag, given in (
+                ('--depth-mode', args.depth_mode != 'legacy'),
+                ('--context_length', args.context_length is not None),
+                ('--context-lengths', args.context_lengths is not None),
+            ) if given
+        ]
+        if conflicting:
+            parser.error(
+                f"--no-reference cannot be used with {', '.join(conflicting)}. "
+                "No-reference mode tests without any context."
+            )
+        if args.novel:
+            logger.warning(
+                "--novel is ignored in no-reference mode. "
+                "Tests will use novel_summary from question set metadata."
+            )
+        args.mode = 'no-reference'
+    else:
+        args.mode = args.depth_mode
+    
+    missing = [flag for attr, flag in _MODE_REQUIRED_ARGS[args.mode] if getattr(args, attr) is None]
+    if missing:
+        parser.error(f"{args.mode} mode requires: {', '.join(missing)}")
+
+
 def parse_args():
     """Parse command-line arguments."""
     parser = argparse.ArgumentParser(
@@ -72,7 +162,7 @@ Examples:
     
     parser.add_argument(
         '--context_length',
-        type=int,
+        type=_positive_int,
         default=None,
         help='Number of tokens to use as context (required for legacy mode)'
     )
@@ -95,14 +185,14 @@ Examples:
     
     parser.add_argument(
         '--depth',
-        type=float,
+        type=_unit_float,
         default=None,
         help='Fixed depth value (0.0-1.0) for fixed mode'
     )
     
     parser.add_argument(
         '--context-lengths',
-        type=str,
+        type=_context_lengths,
         default=None,
         help='Comma-separated context lengths for depth-aware testing (e.g., 64000,128000,200000)'
     )
@@ -110,16 +200,25 @@ Examples:
     # Optional arguments
     parser.add_argument(
         '--padding_size',
-        type=int,
+        type=_non_negative_int,
         default=500,
         help='Buffer tokens to ensure answer region not truncated (default: 500)'
     )
     
     parser.add_argument(
         '--concurrency',
-        type=int,
+        type=_positive_int,
         default=None,
-        help='Number of concurrent test requests (default: from DEFAULT_CONCURRENCY in .env, or 5)'
+        help='Maximum number of concurrent test requests; lowered automatically on rate limits '
+             '(default: from DEFAULT_CONCURRENCY in .env, or 5)'
+    )
+    
+    parser.add_argument(
+        '--max-timeout-rate',
+        type=_unit_float,
+        default=0.5,
+        help='Abort a run once more than this fraction of finished requests timed out '
+             '(checked after 50 results; 1.0 disables; default: 0.5)'
     )
     
     parser.add_argument(
@@ -157,7 +256,7 @@ Examples:
     # Question limit argument
     parser.add_argument(
         '--max-questions',
-        type=int,
+        type=_positive_int,
         default=None,
         help='Maximum number of questions to test. Questions will be sampled uniformly across depth bins to ensure balanced coverage.'
     )
@@ -170,111 +269,76 @@ Examples:
         help='Path to previous results file for recovery mode. Will re-run failed/error/missing tests only.'
     )
     
-    return parser.parse_args()
+    args = parser.parse_args()
+    _resolve_mode(parser, args)
+    return args
+
+
+def _safe_stat(path: str) -> Optional[os.stat_result]:
+    """Stat a path, returning None if it does not exist."""
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def stat_paths(paths: List[Optional[str]]) -> Dict[str, Optional[os.stat_result]]:
+    """Stat several paths concurrently, once per unique path.
+    
+    Each check is a stat call; on network or cloud-mounted filesystems
+    these take tens of milliseconds, so they are issued in parallel.
+    
+    Args:
+        paths: Paths to stat. None entries are skipped.
+        
+    Returns:
+        Dictionary mapping each given path to its stat result, or None
+        if it does not exist.
+    """
+    unique_paths = list(dict.fromkeys(p for p in paths if p))
+    if not unique_paths:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=len(unique_paths)) as pool:
+        return dict(zip(unique_paths, pool.map(_safe_stat, unique_paths)))
 
 
 def validate_args(args):
-    """Validate command-line arguments.
+    """Validate input and output paths.
+    
+    Mode-specific argument checks happen at parse time (see parse_args).
     
     Args:
         args: Parsed arguments from argparse.
         
     Raises:
-        ValueError: If arguments are invalid.
+        ValueError: If a path is invalid.
     """
-    # Recovery mode validation
-    if args.recovery:
-        if not Path(args.recovery).exists():
-            raise ValueError(f"Recovery file not found: {args.recovery}")
-        # In recovery mode, we still need the original parameters to re-run failed tests
-    
-    # Validate question set file exists
-    if not Path(args.data_set).exists():
-        raise ValueError(f"Question set file not found: {args.data_set}")
+    # Stat every path once, up front and in parallel
+    path_stats = stat_paths([
+        args.recovery,
+        args.data_set,
+        None if args.no_reference else args.novel,
+        args.output,
+    ])
     
-    # No-reference mode validation
-    if args.no_reference:
-        # Check for mutually exclusive arguments
-        if args.depth_mode != 'legacy':
-            raise ValueError(
-                "--no-reference cannot be used with --depth-mode. "
-                "No-reference mode tests without any context."
-            )
-        if args.context_length is not None:
-            raise ValueError(
-                "--no-reference cannot be used with --context_length. "
-                "No-reference mode tests without any context."
-            )
-        if args.context_lengths is not None:
-            raise ValueError(
-                "--no-reference cannot be used with --context-lengths. "
-                "No-reference mode tests without any context."
-            )
-        # Warn if novel is provided
-        if args.novel:
-            logger.warning(
-                "--novel is ignored in no-reference mode. "
-                "Tests will use novel_summary from question set metadata."
-            )
-    else:
-        # Standard mode requires novel
-        if not args.novel:
-            raise ValueError(
-                "--novel is required (unless using --no-reference mode)"
-            )
-        
-        # Validate novel file exists
-        if not Path(args.novel).exists():
-            raise ValueError(f"Novel file not found: {args.novel}")
-        
-        # Validate depth mode and related arguments
-        depth_mode = args.depth_mode
-        
-        if depth_mode == 'legacy':
-            # Legacy mode requires context_length
-            if args.context_length is None:
-                raise ValueError("--context_length is required for legacy mode")
-            if args.context_length <= 0:
-                raise ValueError("context_length must be positive")
-        else:
-            # Depth-aware modes require context-lengths
-            if args.context_lengths is None:
-                raise ValueError(f"--context-lengths is required for {depth_mode} mode")
-            
-            # Parse and validate context lengths
-            try:
-                context_lengths = [int(x.strip()) for x in args.context_lengths.split(',')]
-                if not context_lengths:
-                    raise ValueError("--context-lengths cannot be empty")
-                for length in context_lengths:
-                    if length <= 0:
-                        raise ValueError(f"Invalid context length: {length}")
-            except ValueError as e:
-                raise ValueError(f"Invalid --context-lengths format: {e}")
-            
-            # Fixed mode requires depth
-            if depth_mode == 'fixed':
-                if args.depth is None:
-                    raise ValueError("--depth is required for fixed mode")
-                if not 0.0 <= args.depth <= 1.0:
-                    raise ValueError("--depth must be between 0.0 and 1.0")
-        
-        if args.padding_size < 0:
-            raise ValueError("padding_size must be non-negative")
+    if args.recovery and path_stats[args.recovery] is None:
+        raise ValueError(f"Recovery file not found: {args.recovery}")
     
-    if args.concurrency is not None and args.concurrency <= 0:
-        raise ValueError("concurrency must be positive")
+    if path_stats[args.data_set] is None:
+        raise ValueError(f"Question set file not found: {args.data_set}")
     
-    if args.max_questions is not None and args.max_questions <= 0:
-        raise ValueError("max-questions must be positive")
+    if not args.no_reference and path_stats[args.novel] is None:
+        raise ValueError(f"Novel file not found: {args.novel}")
     
     # Validate output path is writable
-    output_path = Path(args.output)
-    if output_path.exists() and not output_path.is_file():
+    output_stat = path_stats[args.output]
+    if output_stat is not None and not stat.S_ISREG(output_stat.st_mode):
         raise ValueError(f"Output path exists but is not a file: {args.output}")
     
     # Ensure output directory exists
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if output_stat is None:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
 
 
 async def main():
@@ -286,6 +350,7 @@ async def main():
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
+    testing_tool = None
     try:
         # Validate arguments
         logger.info("Validating arguments...")
@@ -312,25 +377,25 @@ async def main():
         # Create testing tool
         testing_tool = TestingTool(
             config=llm_config,
-            llm_client=llm_client
+            llm_client=llm_client,
+            max_timeout_rate=args.max_timeout_rate
         )
         
         # Display testing parameters
         logger.info("=" * 60)
         logger.info("Testing Parameters:")
-        if args.no_reference:
+        if args.mode == 'no-reference':
             logger.info(f"  Mode: NO-REFERENCE (testing model's inherent knowledge)")
             logger.info(f"  Question set: {args.data_set}")
         else:
             logger.info(f"  Novel: {args.novel}")
             logger.info(f"  Question set: {args.data_set}")
             logger.info(f"  Depth mode: {args.depth_mode}")
-            if args.depth_mode == 'legacy':
+            if args.mode == 'legacy':
                 logger.info(f"  Context length: {args.context_length} tokens")
             else:
-                context_lengths = [int(x.strip()) for x in args.context_lengths.split(',')]
-                logger.info(f"  Context lengths: {context_lengths}")
-                if args.depth_mode == 'fixed':
+                logger.info(f"  Context lengths: {list(args.context_lengths)}")
+                if args.mode == 'fixed':
                     logger.info(f"  Fixed depth: {args.depth}")
             logger.info(f"  Padding size: {args.padding_size} tokens")
         logger.info(f"  Concurrency: {args.concurrency}")
@@ -346,7 +411,7 @@ async def main():
         # Check for recovery mode
         if args.recovery:
             logger.info(f"Recovery mode enabled, loading previous results from: {args.recovery}")
-            if args.no_reference:
+            if args.mode == 'no-reference':
                 results = await testing_tool.run_no_reference_recovery(
                     recovery_path=args.recovery,
                     question_set_path=args.data_set,
@@ -355,7 +420,7 @@ async def main():
                     skip_validation=args.skip_validation,
                     ignore_invalid=args.ignore_invalid
                 )
-            elif args.depth_mode == 'legacy':
+            elif args.mode == 'legacy':
                 results = await testing_tool.run_recovery(
                     recovery_path=args.recovery,
                     novel_path=args.novel,
@@ -368,13 +433,12 @@ async def main():
                     ignore_invalid=args.ignore_invalid
                 )
             else:
-                context_lengths = [int(x.strip()) for x in args.context_lengths.split(',')]
                 results = await testing_tool.run_depth_aware_recovery(
                     recovery_path=args.recovery,
                     novel_path=args.novel,
                     question_set_path=args.data_set,
-                    depth_mode=args.depth_mode,
-                    context_lengths=context_lengths,
+                    depth_mode=args.mode,
+                    context_lengths=args.context_lengths,
                     fixed_depth=args.depth,
                     padding_size=args.padding_size,
                     concurrency=args.concurrency,
@@ -382,7 +446,7 @@ async def main():
                     skip_validation=args.skip_validation,
                     ignore_invalid=args.ignore_invalid
                 )
-        elif args.no_reference:
+        elif args.mode == 'no-reference':
             # No-reference mode - test model's inherent knowledge
             results = await testing_tool.run_no_reference_tests(
                 question_set_path=args.data_set,
@@ -392,7 +456,7 @@ async def main():
                 ignore_invalid=args.ignore_invalid,
                 max_questions=args.max_questions
             )
-        elif args.depth_mode == 'legacy':
+        elif args.mode == 'legacy':
             # Legacy mode - use original run_tests
             results = await testing_tool.run_tests(
                 novel_path=args.novel,
@@ -407,12 +471,11 @@ async def main():
             )
         else:
             # Depth-aware mode
-            context_lengths = [int(x.strip()) for x in args.context_lengths.split(',')]
             results = await testing_tool.run_depth_aware_tests(
                 novel_path=args.novel,
                 question_set_path=args.data_set,
-                depth_mode=args.depth_mode,
-                context_lengths=context_lengths,
+                depth_mode=args.mode,
+                context_lengths=args.context_lengths,
                 fixed_depth=args.depth,
                 padding_size=args.padding_size,
                 concurrency=args.concurrency,
@@ -427,28 +490,22 @@ async def main():
         logger.info("Testing Summary:")
         logger.info(f"  Total questions tested: {len(results)}")
         
-        # Count by parsing status
-        success = sum(1 for r in results if r["parsing_status"] == "success")
-        regex_extracted = sum(1 for r in results if r["parsing_status"] == "regex_extracted")
-        parsing_error = sum(1 for r in results if r["parsing_status"] == "parsing_error")
-        timeout = sum(1 for r in results if r["parsing_status"] == "timeout")
-        error = sum(1 for r in results if r["parsing_status"] == "error")
+        summary = summarize_results(results)
+        status_counts = summary["status_counts"]
         
         logger.info(f"  Parsing status:")
-        logger.info(f"    Success: {success}")
-        logger.info(f"    Regex extracted: {regex_extracted}")
-        logger.info(f"    Parsing error: {parsing_error}")
-        logger.info(f"    Timeout: {timeout}")
-        logger.info(f"    Error: {error}")
+        logger.info(f"    Success: {status_counts['success']}")
+        logger.info(f"    Regex extracted: {status_counts['regex_extracted']}")
+        logger.info(f"    Parsing error: {status_counts['parsing_error']}")
+        logger.info(f"    Timeout: {status_counts['timeout']}")
+        logger.info(f"    Error: {status_counts['error']}")
         
         # Calculate average score
         if results:
-            avg_score = sum(r["score"] for r in results) / len(results)
-            logger.info(f"  Average score: {avg_score:.4f}")
+            logger.info(f"  Average score: {summary['avg_score']:.4f}")
             
-            # Count by question type
-            single_choice = sum(1 for r in results if r["question_type"] == "single_choice")
-            multiple_choice = sum(1 for r in results if r["question_type"] == "multiple_choice")
+            single_choice = summary["single_choice"]
+            multiple_choice = summary["multiple_choice"]
             
             logger.info(f"  Question types:")
             logger.info(f"    Single choice: {single_choice}")
@@ -456,21 +513,13 @@ async def main():
             
             # Calculate accuracy for single choice
             if single_choice > 0:
-                single_correct = sum(
-                    1 for r in results 
-                    if r["question_type"] == "single_choice" and r["score"] == 1.0
-                )
+                single_correct = summary["single_correct"]
                 single_accuracy = single_correct / single_choice
                 logger.info(f"  Single choice accuracy: {single_accuracy:.4f} ({single_correct}/{single_choice})")
             
             # Calculate average F1 for multiple choice
             if multiple_choice > 0:
-                multi_f1_scores = [
-                    r["score"] for r in results 
-                    if r["question_type"] == "multiple_choice"
-                ]
-                avg_multi_f1 = sum(multi_f1_scores) / len(multi_f1_scores)
-                logger.info(f"  Multiple choice avg F1: {avg_multi_f1:.4f}")
+                logger.info(f"  Multiple choice avg F1: {summary['avg_multi_f1']:.4f}")
         
         logger.info(f"  Results saved to: {args.output}")
         logger.info("=" * 60)
@@ -497,6 +546,10 @@ async def main():
     except Exception as e:
         logger.error(f"Unexpected error during testing: {e}", exc_info=True)
         return 1
+    
+    finally:
+        if testing_tool is not None:
+            testing_tool.close()
 
 
 def cli_main():
@@ -1,12 +1,14 @@
 """Testing tool module."""
 
-from .testing_tool import TestingTool
+from .testing_tool import TestingTool, ResultSummary, summarize_results
 from .parser import parse_answer, is_valid_answer
 from .context_builder import ContextBuilder, ContextBuildResult
-from .depth_scheduler import DepthScheduler, DepthMode, DepthAssignment
+from .depth_scheduler import DepthScheduler, DepthMode, DepthAssignment, sample_questions_by_depth
 
 __all__ = [
     "TestingTool",
+    "ResultSummary",
+    "summarize_results",
     "parse_answer",
     "is_valid_answer",
     "ContextBuilder",
@@ -14,4 +16,5 @@ __all__ = [
     "DepthScheduler",
     "DepthMode",
     "DepthAssignment",
+    "sample_questions_by_depth",
 ]
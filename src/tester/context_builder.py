@@ -6,9 +6,11 @@ test contexts with evidence placed at specified depth positions.
 """
 
 import logging
-import random
+from array import array
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from functools import cached_property
+from itertools import accumulate
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from ..core.tokenizer import Tokenizer
 
@@ -63,29 +65,66 @@ class ContextBuilder:
     Depth 1.0 = evidence at the end
     """
     
-    def __init__(self, tokenizer: Tokenizer, novel_tokens: List[int]):
+    def __init__(self, tokenizer: Tokenizer, novel_tokens: Sequence[int]):
         """
         Initialize the context builder.
         
+        The novel is decoded to bytes once, on first use, together with the
+        byte offset of every token, so building a context only slices that
+        buffer. Reuse one builder for every depth and length of a run.
+        
         Args:
             tokenizer: Tokenizer instance for encoding/decoding
-            novel_tokens: Complete novel as a list of tokens
+            novel_tokens: Complete novel as a sequence of tokens
         """
         self.tokenizer = tokenizer
-        self.novel_tokens = novel_tokens
-        self.novel_length = len(novel_tokens)
+        # Packed int32 tokens (e.g. from the token cache) are used as is
+        if (
+            isinstance(novel_tokens, memoryview) and novel_tokens.format == 'i'
+            or isinstance(novel_tokens, array) and novel_tokens.typecode == 'i'
+        ):
+            self.novel_tokens = novel_tokens
+        else:
+            self.novel_tokens = array('i', novel_tokens)
+        self.novel_length = len(self.novel_tokens)
+        
+        logger.debug("ContextBuilder initialized with %d tokens", self.novel_length)
+    
+    def prepare(self) -> None:
+        """
+        Compute the decoded novel and token offsets now.
         
-        logger.debug(f"ContextBuilder initialized with {self.novel_length} tokens")
+        Call once before building contexts from several threads, so the
+        lazy state is not computed by each of them concurrently.
+        """
+        self._novel_bytes
+        self._byte_offsets
+    
+    @cached_property
+    def _novel_bytes(self) -> bytes:
+        """The whole novel decoded to UTF-8 bytes."""
+        return self.tokenizer.decode_bytes(self.novel_tokens)
+    
+    @cached_property
+    def _byte_offsets(self) -> array:
+        """Byte offset of every token in _novel_bytes, plus the total length."""
+        token_lengths = {t: len(self.tokenizer.token_bytes(t)) for t in set(self.novel_tokens)}
+        return array(
+            'q', accumulate(map(token_lengths.__getitem__, self.novel_tokens), initial=0)
+        )
 
-    def build_context(
+    def check_budget(
         self,
         question: Dict[str, Any],
         target_depth: float,
         context_length: int,
         padding_size: int = 500
-    ) -> ContextBuildResult:
+    ) -> Optional[ContextBuildResult]:
         """
-        Build a context with evidence at the specified depth.
+        Check whether a context can be built, using arithmetic only.
+        
+        Callers can use this to reject unbuildable (question, length) pairs
+        before dispatching any build work.
         
         Args:
             question: Question dictionary containing 'position' with start_pos and end_pos
@@ -94,21 +133,12 @@ class ContextBuilder:
             padding_size: Extra padding around evidence to ensure completeness
             
         Returns:
-            ContextBuildResult with the constructed context or error information
+            Failed ContextBuildResult if the context cannot be built, else None
         """
         # Validate inputs
         if not 0.0 <= target_depth <= 1.0:
-            return ContextBuildResult(
-                context="",
-                actual_depth=0.0,
-                evidence_start=0,
-                evidence_end=0,
-                prefix_length=0,
-                suffix_length=0,
-                evidence_length=0,
-                total_length=0,
-                success=False,
-                error_message=f"Invalid target_depth: {target_depth}, must be between 0.0 and 1.0"
+            return self._failed_result(
+                f"Invalid target_depth: {target_depth}, must be between 0.0 and 1.0"
             )
         
         # Extract position information
@@ -117,79 +147,105 @@ class ContextBuilder:
         end_pos = position.get("end_pos")
         
         if start_pos is None or end_pos is None:
-            return ContextBuildResult(
-                context="",
-                actual_depth=0.0,
-                evidence_start=0,
-                evidence_end=0,
-                prefix_length=0,
-                suffix_length=0,
-                evidence_length=0,
-                total_length=0,
-                success=False,
-                error_message="Question missing position.start_pos or position.end_pos"
-            )
-        
-        # Extract evidence with padding
-        evidence_tokens, actual_start, actual_end = self._extract_evidence(
-            start_pos, end_pos, padding_size
-        )
-        evidence_length = len(evidence_tokens)
+            return self._failed_result("Question missing position.start_pos or position.end_pos")
         
         # Check if evidence fits in context
+        actual_start, actual_end = self._evidence_range(start_pos, end_pos, padding_size)
+        evidence_length = actual_end - actual_start
         if evidence_length >= context_length:
-            return ContextBuildResult(
-                context="",
-                actual_depth=0.0,
-                evidence_start=0,
-                evidence_end=0,
-                prefix_length=0,
-                suffix_length=0,
-                evidence_length=evidence_length,
-                total_length=0,
-                success=False,
-                error_message=f"Evidence length ({evidence_length}) exceeds context length ({context_length})"
+            return self._failed_result(
+                f"Evidence length ({evidence_length}) exceeds context length ({context_length})",
+                evidence_length=evidence_length
             )
         
+        return None
+    
+    @staticmethod
+    def _failed_result(error_message: str, evidence_length: int = 0) -> ContextBuildResult:
+        """Create a ContextBuildResult for a build that cannot proceed."""
+        return ContextBuildResult(
+            context="",
+            actual_depth=0.0,
+            evidence_start=0,
+            evidence_end=0,
+            prefix_length=0,
+            suffix_length=0,
+            evidence_length=evidence_length,
+            total_length=0,
+            success=False,
+            error_message=error_message
+        )
+
+    def build_context(
+        self,
+        question: Dict[str, Any],
+        target_depth: float,
+        context_length: int,
+        padding_size: int = 500
+    ) -> ContextBuildResult:
+        """
+        Build a context with evidence at the specified depth.
+        
+        Args:
+            question: Question dictionary containing 'position' with start_pos and end_pos
+            target_depth: Target depth for evidence (0.0=start, 0.5=middle, 1.0=end)
+            context_length: Desired total context length in tokens
+            padding_size: Extra padding around evidence to ensure completeness
+            
+        Returns:
+            ContextBuildResult with the constructed context or error information
+        """
+        # Reject unbuildable requests before touching the novel
+        failure = self.check_budget(question, target_depth, context_length, padding_size)
+        if failure is not None:
+            return failure
+        
+        position = question["position"]
+        actual_start, actual_end = self._evidence_range(
+            position["start_pos"], position["end_pos"], padding_size
+        )
+        evidence_length = actual_end - actual_start
+        
         # Calculate filler lengths based on target depth
         available_filler = context_length - evidence_length
         prefix_length = int(available_filler * target_depth)
         suffix_length = available_filler - prefix_length
         
-        # Get filler tokens (excluding evidence region)
-        prefix_tokens = self._get_filler_tokens(prefix_length, actual_start, actual_end, position="before")
-        suffix_tokens = self._get_filler_tokens(suffix_length, actual_start, actual_end, position="after")
+        # Get filler ranges (excluding evidence region)
+        prefix_ranges, suffix_ranges = self._plan_filler(
+            prefix_length, suffix_length, actual_start, actual_end
+        )
         
-        # Assemble context
-        context_tokens = prefix_tokens + evidence_tokens + suffix_tokens
-        context = self.tokenizer.decode(context_tokens)
+        # Assemble context from the decoded novel ranges
+        context = self._decode_ranges(prefix_ranges + [(actual_start, actual_end)] + suffix_ranges)
         
         # Calculate actual depth
-        actual_prefix_len = len(prefix_tokens)
-        actual_total_len = len(context_tokens)
+        actual_prefix_len = sum(end - start for start, end in prefix_ranges)
+        actual_suffix_len = sum(end - start for start, end in suffix_ranges)
+        actual_total_len = actual_prefix_len + evidence_length + actual_suffix_len
         actual_depth = actual_prefix_len / actual_total_len if actual_total_len > 0 else 0.0
         
         return ContextBuildResult(
             context=context,
             actual_depth=actual_depth,
             evidence_start=actual_prefix_len,
-            evidence_end=actual_prefix_len + len(evidence_tokens),
+            evidence_end=actual_prefix_len + evidence_length,
             prefix_length=actual_prefix_len,
-            suffix_length=len(suffix_tokens),
-            evidence_length=len(evidence_tokens),
+            suffix_length=actual_suffix_len,
+            evidence_length=evidence_length,
             total_length=actual_total_len,
             success=True,
             error_message=None
         )
 
-    def _extract_evidence(
+    def _evidence_range(
         self,
         start_pos: int,
         end_pos: int,
         padding: int
-    ) -> Tuple[List[int], int, int]:
+    ) -> Tuple[int, int]:
         """
-        Extract evidence tokens with padding.
+        Get the novel token range of the evidence with padding.
         
         Args:
             start_pos: Start position in tokens
@@ -197,92 +253,109 @@ class ContextBuilder:
             padding: Extra tokens to include before and after
             
         Returns:
-            Tuple of (evidence_tokens, actual_start, actual_end)
+            Tuple of (actual_start, actual_end)
         """
         # Apply padding and clamp to valid range
         actual_start = max(0, start_pos - padding)
         actual_end = min(self.novel_length, end_pos + padding)
         
-        evidence_tokens = self.novel_tokens[actual_start:actual_end]
+        return actual_start, actual_end
+        
+    def _decode_ranges(self, ranges: List[Tuple[int, int]]) -> str:
+        """
+        Get the text of novel token ranges, in order, without re-decoding.
+    
+        Adjacent ranges are merged first. In the common case (filler on both
+        sides of the evidence) that leaves a single range, which is decoded
+        straight out of the novel buffer with no intermediate copy.
+        Otherwise the byte slices are joined before decoding, so multi-byte
+        characters split at a seam stay intact.
+        
+        Args:
+            ranges: (start, end) novel token ranges in context order
+            
+        Returns:
+            Decoded text of the concatenated ranges
+        """
+        merged = []
+        for start, end in ranges:
+            if start == end:
+                continue
+            if merged and merged[-1][1] == start:
+                merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
         
-        return evidence_tokens, actual_start, actual_end
+        buffer = memoryview(self._novel_bytes)
+        offsets = self._byte_offsets
+        if len(merged) == 1:
+            start, end = merged[0]
+            return str(buffer[offsets[start]:offsets[end]], "utf-8", "replace")
+        return b"".join(
+            buffer[offsets[start]:offsets[end]] for start, end in merged
+        ).decode("utf-8", errors="replace")
     
-    def _get_filler_tokens(
+    def _plan_filler(
         self,
-        length: int,
+        prefix_length: int,
+        suffix_length: int,
         exclude_start: int,
-        exclude_end: int,
-        position: str = "before"
-    ) -> List[int]:
+        exclude_end: int
+    ) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
         """
-        Get filler tokens from the novel, excluding the evidence region.
+        Plan prefix and suffix filler as one window over the novel minus evidence.
+        
+        The novel with the evidence region cut out is treated as a single
+        virtual sequence. The filler is the contiguous window of
+        prefix_length + suffix_length tokens in it that keeps the evidence
+        at its original position, shifted only as far as the novel's ends
+        require. The window's first prefix_length tokens become the prefix,
+        the rest the suffix, so no filler token is used twice.
         
         Args:
-            length: Number of tokens needed
+            prefix_length: Number of tokens needed before the evidence
+            suffix_length: Number of tokens needed after the evidence
             exclude_start: Start of region to exclude
             exclude_end: End of region to exclude
-            position: "before" to prefer text before evidence, "after" for after
             
         Returns:
-            List of filler tokens
+            Tuple of (prefix_ranges, suffix_ranges); each is a list of at
+            most two (start, end) novel token ranges, in context order
         """
-        if length <= 0:
-            return []
-        
-        # Calculate available regions
-        before_region = (0, exclude_start)
-        after_region = (exclude_end, self.novel_length)
-        
-        before_available = before_region[1] - before_region[0]
-        after_available = after_region[1] - after_region[0]
-        
-        filler_tokens = []
-        
-        if position == "before":
-            # Prefer taking from before the evidence
-            if before_available >= length:
-                # Take from the end of the before region (closest to evidence)
-                start = exclude_start - length
-                filler_tokens = self.novel_tokens[start:exclude_start]
-            elif before_available > 0:
-                # Take all available before, then fill from after
-                filler_tokens = self.novel_tokens[0:exclude_start]
-                remaining = length - before_available
-                if after_available >= remaining:
-                    filler_tokens = self.novel_tokens[exclude_end:exclude_end + remaining] + filler_tokens
-                elif after_available > 0:
-                    filler_tokens = self.novel_tokens[exclude_end:self.novel_length] + filler_tokens
-            elif after_available >= length:
-                # No before region, take from after
-                filler_tokens = self.novel_tokens[exclude_end:exclude_end + length]
-            elif after_available > 0:
-                filler_tokens = self.novel_tokens[exclude_end:self.novel_length]
-        else:  # position == "after"
-            # Prefer taking from after the evidence
-            if after_available >= length:
-                # Take from the start of the after region (closest to evidence)
-                filler_tokens = self.novel_tokens[exclude_end:exclude_end + length]
-            elif after_available > 0:
-                # Take all available after, then fill from before
-                filler_tokens = self.novel_tokens[exclude_end:self.novel_length]
-                remaining = length - after_available
-                if before_available >= remaining:
-                    start = exclude_start - remaining
-                    filler_tokens = filler_tokens + self.novel_tokens[start:exclude_start]
-                elif before_available > 0:
-                    filler_tokens = filler_tokens + self.novel_tokens[0:exclude_start]
-            elif before_available >= length:
-                # No after region, take from before
-                start = exclude_start - length
-                filler_tokens = self.novel_tokens[max(0, start):exclude_start]
-            elif before_available > 0:
-                filler_tokens = self.novel_tokens[0:exclude_start]
-        
-        # Log warning if we couldn't get enough filler
-        if len(filler_tokens) < length:
+        available = self.novel_length - (exclude_end - exclude_start)
+        needed = prefix_length + suffix_length
+        if needed > available:
             logger.warning(
-                f"Could only get {len(filler_tokens)} filler tokens, "
-                f"requested {length}"
+                "Could only get %d filler tokens, requested %d", available, needed
             )
         
-        return filler_tokens
+        # Window [anchor, anchor + needed) in virtual coordinates
+        anchor = max(0, min(exclude_start - prefix_length, available - needed))
+        split = min(anchor + prefix_length, available)
+        window_end = min(anchor + needed, available)
+
+        return (
+            self._virtual_to_novel_ranges(anchor, split, exclude_start, exclude_end),
+            self._virtual_to_novel_ranges(split, window_end, exclude_start, exclude_end),
+        )
+    
+    @staticmethod
+    def _virtual_to_novel_ranges(
+        start: int,
+        end: int,
+        exclude_start: int,
+        exclude_end: int
+    ) -> List[Tuple[int, int]]:
+        """
+        Map a range of the evidence-free virtual sequence to novel ranges.
+        
+        Virtual positions before exclude_start are novel positions; later
+        ones are shifted past the excluded region.
+        """
+        gap = exclude_end - exclude_start
+        ranges = []
+        if start < exclude_start and start < end:
+            ranges.append((start, min(end, exclude_start)))
+        if end > exclude_start:
+            ranges.append((max(start, exclude_start) + gap, end + gap))
+        return ranges
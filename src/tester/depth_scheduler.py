@@ -6,14 +6,22 @@ to questions based on different scheduling strategies.
 """
 
 import logging
+import math
 import random
+from bisect import bisect_right
+from collections import Counter
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Sequence
 
 
 logger = logging.getLogger(__name__)
 
+# Upper edges of the depth bins used by sample_questions_by_depth
+# (0-20%, 20-40%, 40-60%, 60-80%, 80-100%)
+_DEPTH_BIN_BOUNDS = (0.2, 0.4, 0.6, 0.8)
+
 
 class DepthMode(Enum):
     """Depth scheduling mode."""
@@ -32,6 +40,9 @@ class DepthMode(Enum):
 class DepthAssignment:
     """Assignment of a question to a specific depth and context length."""
     
+    # One assignment exists per scheduled test; slots keep them compact
+    __slots__ = ("question_index", "target_depth", "depth_bin", "context_length")
+    
     question_index: int
     """Index of the question in the original list."""
     
@@ -62,7 +73,7 @@ class DepthScheduler:
         self,
         mode: DepthMode,
         fixed_depth: Optional[float] = None,
-        context_lengths: Optional[List[int]] = None
+        context_lengths: Optional[Sequence[int]] = None
     ):
         """
         Initialize the depth scheduler.
@@ -86,6 +97,12 @@ class DepthScheduler:
             if not 0.0 <= fixed_depth <= 1.0:
                 raise ValueError(f"fixed_depth must be between 0.0 and 1.0, got {fixed_depth}")
         
+        # Resolve the scheduling method once; None for LEGACY and unknown modes
+        self._schedule_impl = {
+            DepthMode.UNIFORM: self._schedule_uniform,
+            DepthMode.FIXED: self._schedule_fixed,
+        }.get(mode)
+        
         logger.debug(
             f"DepthScheduler initialized: mode={mode.value}, "
             f"fixed_depth={fixed_depth}, context_lengths={context_lengths}"
@@ -116,17 +133,15 @@ class DepthScheduler:
         if not self.context_lengths:
             raise ValueError("context_lengths must be provided for depth scheduling")
         
-        if self.mode == DepthMode.UNIFORM:
-            return self._schedule_uniform(questions, self.context_lengths)
-        elif self.mode == DepthMode.FIXED:
-            return self._schedule_fixed(questions, self.context_lengths)
-        else:
+        if self._schedule_impl is None:
             raise ValueError(f"Unknown mode: {self.mode}")
+        
+        return self._schedule_impl(questions, self.context_lengths)
     
     def _schedule_uniform(
         self,
         questions: List[Dict[str, Any]],
-        context_lengths: List[int]
+        context_lengths: Sequence[int]
     ) -> List[DepthAssignment]:
         """
         Distribute questions uniformly across depth bins and context lengths.
@@ -141,31 +156,19 @@ class DepthScheduler:
         Returns:
             List of DepthAssignment objects
         """
-        assignments = []
-        num_questions = len(questions)
-        num_depths = len(self.DEPTH_BINS)
-        num_lengths = len(context_lengths)
-        
-        # Total number of combinations
-        total_combinations = num_depths * num_lengths
+        # Every (depth, context length) combination, depths varying fastest
+        combinations = [
+            (target_depth, depth_bin, context_length)
+            for context_length in context_lengths
+            for target_depth, depth_bin in zip(self.DEPTH_BINS, self.DEPTH_LABELS)
+        ]
+        total_combinations = len(combinations)
         
-        for idx, question in enumerate(questions):
-            # Cycle through combinations
-            combo_idx = idx % total_combinations
-            depth_idx = combo_idx % num_depths
-            length_idx = combo_idx // num_depths
-            
-            target_depth = self.DEPTH_BINS[depth_idx]
-            depth_bin = self.DEPTH_LABELS[depth_idx]
-            context_length = context_lengths[length_idx % num_lengths]
-            
-            assignment = DepthAssignment(
-                question_index=idx,
-                target_depth=target_depth,
-                depth_bin=depth_bin,
-                context_length=context_length
-            )
-            assignments.append(assignment)
+        # Cycle through combinations
+        assignments = [
+            DepthAssignment(idx, *combinations[idx % total_combinations])
+            for idx in range(len(questions))
+        ]
         
         # Log distribution summary
         self._log_distribution(assignments, context_lengths)
@@ -175,7 +178,7 @@ class DepthScheduler:
     def _schedule_fixed(
         self,
         questions: List[Dict[str, Any]],
-        context_lengths: List[int]
+        context_lengths: Sequence[int]
     ) -> List[DepthAssignment]:
         """
         Assign all questions to a fixed depth, cycling through context lengths.
@@ -220,22 +223,16 @@ class DepthScheduler:
         Returns:
             Closest depth bin label
         """
-        # Find closest bin
-        min_diff = float('inf')
-        closest_label = self.DEPTH_LABELS[0]
-        
-        for bin_value, label in zip(self.DEPTH_BINS, self.DEPTH_LABELS):
-            diff = abs(depth - bin_value)
-            if diff < min_diff:
-                min_diff = diff
-                closest_label = label
-        
-        return closest_label
+        # Bins are evenly spaced, so the closest one is a rounding away;
+        # ceil(x - 0.5) rounds halves down, keeping ties in the lower bin
+        last = len(self.DEPTH_BINS) - 1
+        idx = math.ceil(depth * last - 0.5)
+        return self.DEPTH_LABELS[max(0, min(last, idx))]
     
     def _log_distribution(
         self,
         assignments: List[DepthAssignment],
-        context_lengths: List[int]
+        context_lengths: Sequence[int]
     ) -> None:
         """
         Log the distribution of assignments across depth bins and context lengths.
@@ -244,22 +241,42 @@ class DepthScheduler:
             assignments: List of depth assignments
             context_lengths: List of context lengths
         """
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
         # Count by depth bin
-        depth_counts = {label: 0 for label in self.DEPTH_LABELS}
-        for a in assignments:
-            depth_counts[a.depth_bin] += 1
+        depth_counter = Counter(map(attrgetter("depth_bin"), assignments))
+        depth_counts = {label: depth_counter[label] for label in self.DEPTH_LABELS}
         
         # Count by context length
-        length_counts = {length: 0 for length in context_lengths}
-        for a in assignments:
-            if a.context_length in length_counts:
-                length_counts[a.context_length] += 1
+        length_counter = Counter(map(attrgetter("context_length"), assignments))
+        length_counts = {length: length_counter[length] for length in context_lengths}
         
         logger.info(f"Uniform depth scheduling: {len(assignments)} total assignments")
         logger.info(f"  By depth: {depth_counts}")
         logger.info(f"  By context length: {length_counts}")
 
 
+def _depth_bin_index(question: Dict[str, Any], novel_length: int) -> int:
+    """
+    Get the depth bin of a question from its position.end_pos.
+    
+    Args:
+        question: Question dictionary with position information
+        novel_length: Total length of novel in tokens
+    
+    Returns:
+        Bin index in [0, len(_DEPTH_BIN_BOUNDS)]
+    """
+    end_pos = question.get("position", {}).get("end_pos", 0)
+    
+    # Depth as ratio of end_pos to novel_length; out-of-range depths fall
+    # into the first or last bin
+    depth = end_pos / novel_length if novel_length > 0 else 0.0
+    
+    return bisect_right(_DEPTH_BIN_BOUNDS, depth)
+
+
 def sample_questions_by_depth(
     questions: List[Dict[str, Any]],
     max_questions: int,
@@ -289,89 +306,71 @@ def sample_questions_by_depth(
         return questions
     
     # Define depth bins (5 bins: 0-20%, 20-40%, 40-60%, 60-80%, 80-100%)
-    num_bins = 5
-    bin_boundaries = [i / num_bins for i in range(num_bins + 1)]
+    num_bins = len(_DEPTH_BIN_BOUNDS) + 1
     
-    # Group questions by depth bin
-    depth_bins: List[List[Dict[str, Any]]] = [[] for _ in range(num_bins)]
-    
-    for question in questions:
-        position = question.get("position", {})
-        end_pos = position.get("end_pos", 0)
-        
-        # Calculate depth as ratio of end_pos to novel_length
-        if novel_length > 0:
-            depth = end_pos / novel_length
-        else:
-            depth = 0.0
-        
-        # Clamp depth to [0, 1]
-        depth = max(0.0, min(1.0, depth))
-        
-        # Find the appropriate bin
-        bin_idx = min(int(depth * num_bins), num_bins - 1)
-        depth_bins[bin_idx].append(question)
+    # Bin every question once; the index list is reused after sampling
+    question_bins = [
+        _depth_bin_index(question, novel_length) for question in questions
+    ]
+    depth_bins: List[List[int]] = [[] for _ in range(num_bins)]
+    for idx, bin_idx in enumerate(question_bins):
+        depth_bins[bin_idx].append(idx)
     
     # Log bin distribution before sampling
     bin_labels = ["0-20%", "20-40%", "40-60%", "60-80%", "80-100%"]
-    logger.info(f"Question distribution by depth before sampling:")
-    for i, (label, bin_questions) in enumerate(zip(bin_labels, depth_bins)):
-        logger.info(f"  {label}: {len(bin_questions)} questions")
+    log_info = logger.isEnabledFor(logging.INFO)
+    if log_info:
+        logger.info(f"Question distribution by depth before sampling:")
+        for i, (label, bin_indices) in enumerate(zip(bin_labels, depth_bins)):
+            logger.info(f"  {label}: {len(bin_indices)} questions")
     
     # Calculate samples per bin
     # Try to distribute evenly, but handle bins with fewer questions
     samples_per_bin = max_questions // num_bins
     remaining_samples = max_questions % num_bins
     
-    sampled_questions = []
+    sampled_indices: List[int] = []
+    sampled_mask = bytearray(len(questions))
+    final_bins = [0] * num_bins
     extra_needed = 0
     
     # First pass: sample from each bin
-    for i, bin_questions in enumerate(depth_bins):
+    for i, bin_indices in enumerate(depth_bins):
         target_samples = samples_per_bin
         if i < remaining_samples:
             target_samples += 1
         
-        if len(bin_questions) <= target_samples:
+        if len(bin_indices) <= target_samples:
             # Take all questions from this bin
-            sampled_questions.extend(bin_questions)
-            extra_needed += target_samples - len(bin_questions)
+            sampled = bin_indices
+            extra_needed += target_samples - len(bin_indices)
         else:
             # Random sample from this bin
-            sampled = random.sample(bin_questions, target_samples)
-            sampled_questions.extend(sampled)
+            sampled = random.sample(bin_indices, target_samples)
+        sampled_indices.extend(sampled)
+        final_bins[i] = len(sampled)
+        for idx in sampled:
+            sampled_mask[idx] = 1
     
     # Second pass: if some bins had fewer questions, sample extra from other bins
     if extra_needed > 0:
         # Collect remaining questions not yet sampled
-        sampled_set = set(id(q) for q in sampled_questions)
-        remaining_questions = [
-            q for q in questions if id(q) not in sampled_set
-        ]
+        remaining_indices = [idx for idx, taken in enumerate(sampled_mask) if not taken]
         
-        if remaining_questions:
-            extra_samples = min(extra_needed, len(remaining_questions))
-            extra = random.sample(remaining_questions, extra_samples)
-            sampled_questions.extend(extra)
+        if remaining_indices:
+            extra_samples = min(extra_needed, len(remaining_indices))
+            extra = random.sample(remaining_indices, extra_samples)
+            sampled_indices.extend(extra)
+            for idx in extra:
+                final_bins[question_bins[idx]] += 1
     
-    # Log final distribution
-    logger.info(f"Sampled {len(sampled_questions)} questions from {len(questions)} total")
+    sampled_questions = [questions[idx] for idx in sampled_indices]
     
-    # Recalculate distribution after sampling
-    final_bins = [0] * num_bins
-    for question in sampled_questions:
-        position = question.get("position", {})
-        end_pos = position.get("end_pos", 0)
-        if novel_length > 0:
-            depth = end_pos / novel_length
-        else:
-            depth = 0.0
-        depth = max(0.0, min(1.0, depth))
-        bin_idx = min(int(depth * num_bins), num_bins - 1)
-        final_bins[bin_idx] += 1
-    
-    logger.info(f"Question distribution by depth after sampling:")
-    for label, count in zip(bin_labels, final_bins):
-        logger.info(f"  {label}: {count} questions")
+    # Log final distribution
+    if log_info:
+        logger.info(f"Sampled {len(sampled_questions)} questions from {len(questions)} total")
+        logger.info(f"Question distribution by depth after sampling:")
+        for label, count in zip(bin_labels, final_bins):
+            logger.info(f"  {label}: {count} questions")
     
     return sampled_questions
@@ -12,6 +12,15 @@ import json
 import re
 from typing import Tuple, List, Optional
 
+import orjson
+
+
+# Opening brace of a candidate JSON object
+_BRACE_RE = re.compile(r'\{')
+
+# Shared decoder for locating complete JSON objects inside free text
+_JSON_DECODER = json.JSONDecoder()
+
 
 def _find_last_json_object(text: str) -> Optional[str]:
     """
@@ -27,54 +36,17 @@ def _find_last_json_object(text: str) -> Optional[str]:
     Returns:
         The last valid JSON object string, or None if not found
     """
-    # Find all potential JSON object positions (starting with {)
-    # Search from end to beginning
-    last_valid_json = None
-    
-    # Find all '{' positions
-    brace_positions = [i for i, c in enumerate(text) if c == '{']
-    
-    # Try each position from the end
-    for start_pos in reversed(brace_positions):
-        # Try to find matching closing brace
-        depth = 0
-        in_string = False
-        escape_next = False
-        
-        for i in range(start_pos, len(text)):
-            char = text[i]
-            
-            if escape_next:
-                escape_next = False
-                continue
-                
-            if char == '\\' and in_string:
-                escape_next = True
-                continue
-                
-            if char == '"' and not escape_next:
-                in_string = not in_string
-                continue
-                
-            if in_string:
-                continue
-                
-            if char == '{':
-                depth += 1
-            elif char == '}':
-                depth -= 1
-                if depth == 0:
-                    # Found a complete JSON object
-                    candidate = text[start_pos:i+1]
-                    try:
-                        json.loads(candidate)
-                        last_valid_json = candidate
-                        # Return immediately since we're searching from the end
-                        return last_valid_json
-                    except (json.JSONDecodeError, ValueError):
-                        break
+    # Try each '{' from the end; raw_decode finds where a valid object ends
+    for match in reversed(list(_BRACE_RE.finditer(text))):
+        start_pos = match.start()
+        try:
+            _, end_pos = _JSON_DECODER.raw_decode(text, start_pos)
+        except (json.JSONDecodeError, ValueError):
+            continue
+        # Return immediately since we're searching from the end
+        return text[start_pos:end_pos]
     
-    return last_valid_json
+    return None
 
 
 def parse_answer(response: str) -> Tuple[List[str], str]:
@@ -82,7 +54,7 @@ def parse_answer(response: str) -> Tuple[List[str], str]:
     Parse LLM response to extract answer with fallback strategies.
     
     This function attempts to parse the LLM response using multiple strategies:
-    1. Direct JSON parsing using json.loads
+    1. Direct JSON parsing using orjson.loads
     2. Regex extraction to find the last valid JSON object in the response
        (handles cases where LLM includes thinking blocks with JSON examples)
     3. Mark as parsing error if all strategies fail
@@ -109,23 +81,30 @@ def parse_answer(response: str) -> Tuple[List[str], str]:
         ([], "parsing_error")
     """
     # Handle edge case: empty or None response
-    if not response or not response.strip():
+    if not response:
+        return [], "parsing_error"
+    text = response.strip()
+    if not text:
         return [], "parsing_error"
     
     # Strategy 1: Direct JSON parse
     try:
-        data = json.loads(response.strip())
+        data = orjson.loads(text)
         answer = data.get("answer", [])
         # Ensure answer is a list
         if not isinstance(answer, list):
             answer = [answer] if answer else []
         return answer, "success"
-    except (json.JSONDecodeError, ValueError, TypeError):
+    except (orjson.JSONDecodeError, TypeError):
         pass
     
+    # Prose without both braces cannot contain a JSON object
+    if '{' not in text or '}' not in text:
+        return [], "parsing_error"
+    
     # Strategy 2: Find the last valid JSON object
     # This handles cases where LLM includes thinking/reasoning with JSON examples
-    last_json = _find_last_json_object(response)
+    last_json = _find_last_json_object(text)
     if last_json:
         try:
             data = json.loads(last_json)
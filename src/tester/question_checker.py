@@ -55,7 +55,9 @@ class QuestionChecker:
             ignore_invalid: If True, filter out invalid questions instead of erroring
             
         Returns:
-            Tuple of (valid_questions, check_results)
+            Tuple of (valid_questions, check_results), where check_results
+            covers only the invalid questions that were filtered out and is
+            empty when every question passed
             
         Raises:
             QuestionCheckError: If validation fails and ignore_invalid=False
@@ -64,48 +66,23 @@ class QuestionChecker:
             logger.info("Skipping validation check (--skip-validation enabled)")
             return questions, []
         
-        check_results = []
-        missing_validation = []
-        invalid_questions = []
-        valid_questions = []
+        # Partition in bulk: one validation lookup per question, then
+        # index buckets instead of a branchy per-question loop
+        validations = [question.get("validation") for question in questions]
+        missing_idx = [idx for idx, validation in enumerate(validations) if validation is None]
         
-        for idx, question in enumerate(questions):
-            question_preview = self._get_question_preview(question)
-            validation = question.get("validation")
-            
-            # Check if validation field exists
-            if validation is None:
-                result = CheckResult(
+        # Handle missing validation fields (always error)
+        if missing_idx:
+            missing_validation = [
+                CheckResult(
                     index=idx,
-                    question_preview=question_preview,
+                    question_preview=self._get_question_preview(questions[idx]),
                     has_validation=False,
                     is_valid=None,
                     failure_reasons=["Missing 'validation' field"]
                 )
-                check_results.append(result)
-                missing_validation.append(result)
-                continue
-            
-            # Check if is_valid is True
-            is_valid = validation.get("is_valid", False)
-            failure_reasons = validation.get("failure_reasons", [])
-            
-            result = CheckResult(
-                index=idx,
-                question_preview=question_preview,
-                has_validation=True,
-                is_valid=is_valid,
-                failure_reasons=failure_reasons if not is_valid else []
-            )
-            check_results.append(result)
-            
-            if is_valid:
-                valid_questions.append(question)
-            else:
-                invalid_questions.append(result)
-        
-        # Handle missing validation fields (always error)
-        if missing_validation:
+                for idx in missing_idx
+            ]
             self._log_missing_validation(missing_validation)
             raise QuestionCheckError(
                 f"Found {len(missing_validation)} questions without validation metadata. "
@@ -113,6 +90,23 @@ class QuestionChecker:
                 missing_validation
             )
         
+        is_valid_flags = [validation.get("is_valid", False) for validation in validations]
+        valid_questions = [
+            question for question, is_valid in zip(questions, is_valid_flags) if is_valid
+        ]
+        
+        # Only questions that failed the check get a CheckResult
+        invalid_questions = [
+            CheckResult(
+                index=idx,
+                question_preview=self._get_question_preview(questions[idx]),
+                has_validation=True,
+                is_valid=is_valid,
+                failure_reasons=validations[idx].get("failure_reasons", [])
+            )
+            for idx, is_valid in enumerate(is_valid_flags) if not is_valid
+        ]
+        
         # Handle invalid questions
         if invalid_questions:
             if ignore_invalid:
@@ -136,14 +130,14 @@ class QuestionChecker:
             raise QuestionCheckError(
                 "No valid questions remaining after filtering. "
                 "All questions either lack validation or failed validation.",
-                check_results
+                invalid_questions
             )
         
         logger.info(
             f"Pre-check passed: {len(valid_questions)}/{len(questions)} questions valid"
         )
         
-        return valid_questions, check_results
+        return valid_questions, invalid_questions
     
     def _get_question_preview(self, question: Dict[str, Any], max_length: int = 50) -> str:
         """Get a preview of the question text for logging."""
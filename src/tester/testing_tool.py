@@ -7,18 +7,24 @@ and saving results with metadata.
 """
 
 import asyncio
+import functools
 import logging
+import os
+from collections import Counter
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 from pathlib import Path
 
 from ..core.llm_client import LLMClient
+from ..core.concurrency import AdaptiveSemaphore
+from ..core.cache import ContextCache, TokenCache, hash_context
 from ..core.tokenizer import Tokenizer
-from ..core.file_io import FileIO
+from ..core.file_io import FileIO, JsonlWriter
 from ..core.prompt_template import PromptTemplateManager
 from .parser import parse_answer
 from .question_checker import QuestionChecker, QuestionCheckError
-from .context_builder import ContextBuilder
+from .context_builder import ContextBuilder, ContextBuildResult
 from .depth_scheduler import DepthScheduler, DepthMode, DepthAssignment, sample_questions_by_depth
 
 
@@ -26,6 +32,232 @@ from .depth_scheduler import DepthScheduler, DepthMode, DepthAssignment, sample_
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Per-question progress lines logged per batch; larger batches log every Nth question
+_PROGRESS_LOG_STEPS = 100
+
+
+class ResultSummary:
+    """
+    Running summary statistics over test results.
+    
+    Results are added one at a time as tests finish, so the totals are
+    available mid-run without keeping or re-scanning the result list.
+    """
+    
+    def __init__(self):
+        """Initialize an empty summary."""
+        self.total = 0
+        self.status_counts = Counter()
+        self.score_total = 0.0
+        self.single_choice = 0
+        self.single_correct = 0
+        self.multiple_choice = 0
+        self.multi_score_total = 0.0
+    
+    def add(self, result: Dict[str, Any]):
+        """
+        Add one test result to the summary.
+        
+        Args:
+            result: Test result dictionary
+        """
+        self.total += 1
+        self.status_counts[result["parsing_status"]] += 1
+        score = result["score"]
+        self.score_total += score
+        
+        question_type = result["question_type"]
+        if question_type == "single_choice":
+            self.single_choice += 1
+            if score == 1.0:
+                self.single_correct += 1
+        elif question_type == "multiple_choice":
+            self.multiple_choice += 1
+            self.multi_score_total += score
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the summary in the format returned by summarize_results.
+        
+        Returns:
+            Dictionary with parsing status counts, question type counts,
+            average score, single choice correct count and multiple choice
+            average F1.
+        """
+        total = self.total
+        multiple_choice = self.multiple_choice
+        return {
+            "total": total,
+            "status_counts": self.status_counts,
+            "avg_score": self.score_total / total if total > 0 else 0.0,
+            "single_choice": self.single_choice,
+            "single_correct": self.single_correct,
+            "multiple_choice": multiple_choice,
+            "avg_multi_f1": self.multi_score_total / multiple_choice if multiple_choice > 0 else 0.0,
+        }
+
+
+def summarize_results(results: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Aggregate summary statistics over test results in a single pass.
+    
+    Args:
+        results: Test result dictionaries.
+    
+    Returns:
+        Dictionary with parsing status counts, question type counts,
+        average score, single choice correct count and multiple choice
+        average F1.
+    """
+    summary = ResultSummary()
+    for r in results:
+        summary.add(r)
+    return summary.to_dict()
+
+
+class BatchAborted(Exception):
+    """Raised in place of a test that was not run because its batch was aborted."""
+
+
+class _TimeoutCircuitBreaker:
+    """
+    Stops a batch early once too many of its requests time out.
+    
+    A provider that times out on most requests will keep doing so for
+    the rest of the batch, and every further request only burns wall
+    time. Once at least `min_results` tests have finished and more than
+    `max_timeout_rate` of them timed out, the breaker trips: requests
+    already in flight finish, and tests that have not started yet are
+    recorded as errors so a recovery run picks them up.
+    """
+    
+    def __init__(self, max_timeout_rate: float, min_results: int):
+        """
+        Initialize the breaker.
+        
+        Args:
+            max_timeout_rate: Timeout fraction above which to abort
+                (1.0 never aborts)
+            min_results: Finished tests required before the rate is checked
+        """
+        self.max_timeout_rate = max_timeout_rate
+        self.min_results = min_results
+        self.summary = ResultSummary()
+        self.tripped = False
+    
+    def check(self):
+        """
+        Raise BatchAborted if the breaker has tripped.
+        
+        Raises:
+            BatchAborted: If the batch has been aborted
+        """
+        if self.tripped:
+            raise BatchAborted("batch aborted after too many timeouts")
+    
+    def record(self, result: Dict[str, Any]):
+        """
+        Record a finished test and trip the breaker if needed.
+        
+        Args:
+            result: Test result dictionary
+        """
+        summary = self.summary
+        summary.add(result)
+        if self.tripped or summary.total < self.min_results:
+            return
+        
+        timeouts = summary.status_counts["timeout"]
+        if timeouts / summary.total > self.max_timeout_rate:
+            self.tripped = True
+            logger.error(
+                f"Aborting batch: {timeouts}/{summary.total} requests timed out "
+                f"(limit {self.max_timeout_rate:.0%}). Remaining tests are marked "
+                f"as errors; use --recovery to re-run them."
+            )
+
+
+class _SharedContextBuilds:
+    """
+    Builds each distinct depth-aware context once per batch.
+    
+    Assignments with the same context length, target depth and evidence
+    span get identical contexts. The first one to ask starts the build on
+    the executor and the rest await the same future. A build is dropped
+    as soon as its last expected assignment has taken it, so finished
+    contexts are not held for the rest of the batch.
+    """
+    
+    def __init__(
+        self,
+        context_builder: ContextBuilder,
+        executor: Optional[Executor],
+        padding_size: int,
+        keys: Sequence[tuple] = ()
+    ):
+        """
+        Initialize the shared builds.
+        
+        Args:
+            context_builder: Context builder instance
+            executor: Executor to build contexts in (None for the loop default)
+            padding_size: Padding around evidence
+            keys: Build keys of every assignment that will request a build
+        """
+        self.context_builder = context_builder
+        self.executor = executor
+        self.padding_size = padding_size
+        self._remaining = Counter(keys)
+        self._builds: Dict[tuple, asyncio.Future] = {}
+    
+    @staticmethod
+    def key(question: Dict[str, Any], assignment: DepthAssignment) -> tuple:
+        """Get the key under which identical contexts are shared."""
+        position = question.get("position", {})
+        return (
+            assignment.context_length,
+            assignment.target_depth,
+            position.get("start_pos"),
+            position.get("end_pos"),
+        )
+    
+    async def build(
+        self,
+        question: Dict[str, Any],
+        assignment: DepthAssignment
+    ) -> ContextBuildResult:
+        """
+        Get the context for an assignment, building it if not in flight.
+        
+        Args:
+            question: Question dictionary
+            assignment: Depth assignment for this question
+        
+        Returns:
+            ContextBuildResult, shared with assignments of the same key
+        """
+        key = self.key(question, assignment)
+        future = self._builds.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().run_in_executor(
+                self.executor,
+                functools.partial(
+                    self.context_builder.build_context,
+                    question=question,
+                    target_depth=assignment.target_depth,
+                    context_length=assignment.context_length,
+                    padding_size=self.padding_size
+                )
+            )
+            self._builds[key] = future
+        
+        self._remaining[key] -= 1
+        if self._remaining[key] <= 0:
+            del self._builds[key]
+        
+        # Shield so one cancelled waiter does not cancel the others' build
+        return await asyncio.shield(future)
+
 
 class TestingTool:
     """
@@ -40,23 +272,41 @@ class TestingTool:
     6. Save results with metadata
     """
     
-    def __init__(self, config: Dict, llm_client: LLMClient):
+    def __init__(
+        self,
+        config: Dict,
+        llm_client: LLMClient,
+        max_timeout_rate: float = 0.5,
+        abort_min_results: int = 50
+    ):
         """
         Initialize TestingTool with configuration and LLM client.
         
         Args:
             config: Configuration dictionary containing test parameters
             llm_client: Initialized LLM client for making API calls
+            max_timeout_rate: Abort a batch once more than this fraction of
+                its finished tests timed out (1.0 never aborts)
+            abort_min_results: Finished tests required before a batch can
+                be aborted
         """
         self.config = config
         self.llm_client = llm_client
+        self.max_timeout_rate = max_timeout_rate
+        self.abort_min_results = abort_min_results
         self.tokenizer = Tokenizer()
         self.file_io = FileIO()
         self.prompt_manager = PromptTemplateManager()
         self.question_checker = QuestionChecker()
+        self.context_cache = ContextCache()
+        self.token_cache = TokenCache()
         
         logger.info("TestingTool initialized")
     
+    def close(self) -> None:
+        """Release the context cache's database connection."""
+        self.context_cache.close()
+    
     async def run_tests(
         self,
         novel_path: str,
@@ -105,18 +355,27 @@ class TestingTool:
         if max_questions:
             logger.info(f"Max questions: {max_questions}")
         
-        # Load novel and tokenize
+        # Load and tokenize the novel in a worker thread while the question
+        # set is parsed here; tiktoken releases the GIL while encoding
         logger.info("Loading and tokenizing novel...")
-        novel_text = self.file_io.read_novel(novel_path)
-        novel_tokens = self.tokenizer.encode(novel_text)
-        novel_length = len(novel_tokens)
-        logger.info(f"Novel loaded: {novel_length} tokens")
+        novel_future = asyncio.get_running_loop().run_in_executor(
+            None, self._load_novel, novel_path
+        )
         
         # Load question set
         logger.info("Loading question set...")
-        metadata, questions = self.file_io.read_jsonl(question_set_path)
+        try:
+            metadata, questions = self.file_io.read_jsonl(question_set_path)
+        except BaseException:
+            # Report the question set error, not a later novel error
+            novel_future.cancel()
+            raise
+        novel_tokens = await novel_future
         logger.info(f"Loaded {len(questions)} questions")
         
+        novel_length = len(novel_tokens)
+        logger.info(f"Novel loaded: {novel_length} tokens")
+        
         # Pre-check questions for validation status (before any API calls)
         logger.info("Pre-checking questions for validation status...")
         questions, check_results = self.question_checker.check_questions(
@@ -153,28 +412,79 @@ class TestingTool:
                 novel_length=novel_length
             )
         
-        # Execute tests concurrently
+        # Execute tests concurrently, streaming results to the output file
         logger.info(f"Executing tests (concurrency={concurrency})...")
-        results = await self._test_batch(
-            context, filtered_questions, concurrency
-        )
+        if output_path:
+            results_metadata = self._build_results_metadata(
+                len(filtered_questions), novel_path, question_set_path,
+                context_length, padding_size, metadata,
+                planned_tests=[
+                    {"question": question.get("question", "")}
+                    for question in filtered_questions
+                ]
+            )
+            with self.file_io.open_jsonl(output_path, results_metadata) as writer:
+                results = await self._test_batch(
+                    context, filtered_questions, concurrency, writer,
+                    context_tokens=context_length
+                )
+            logger.info(f"Results saved to: {output_path}")
+        else:
+            results = await self._test_batch(
+                context, filtered_questions, concurrency,
+                context_tokens=context_length
+            )
         logger.info(f"Testing complete: {len(results)} results")
         
         # Calculate summary statistics
         self._log_summary(results)
         
-        # Save results if output path provided
-        if output_path:
-            self._save_results(
-                results, output_path, novel_path, question_set_path,
-                context_length, padding_size, metadata
-            )
-        
         return results
     
+    def _load_novel(self, novel_path: str) -> Sequence[int]:
+        """
+        Read a novel and tokenize it through the token cache.
+        
+        The text is dropped once tokenized; only the tokens are needed later.
+        
+        Args:
+            novel_path: Path to novel text file
+            
+        Returns:
+            Novel tokens
+        """
+        return self.token_cache.encode(self.tokenizer, self.file_io.read_novel(novel_path))
+    
+    def _create_semaphore(self, concurrency: int) -> AdaptiveSemaphore:
+        """
+        Create the concurrency limiter for a test batch.
+        
+        The limiter starts at `concurrency` and backs off on 429/5xx
+        responses reported by the LLM client, so `concurrency` acts as
+        a cap rather than a fixed target.
+        
+        Args:
+            concurrency: Maximum concurrent requests
+            
+        Returns:
+            AdaptiveSemaphore registered as the LLM client's listener
+        """
+        semaphore = AdaptiveSemaphore(concurrency)
+        self.llm_client.set_concurrency_listener(semaphore)
+        return semaphore
+    
+    def _create_breaker(self) -> _TimeoutCircuitBreaker:
+        """
+        Create the timeout circuit breaker for a test batch.
+        
+        Returns:
+            _TimeoutCircuitBreaker using this tool's abort thresholds
+        """
+        return _TimeoutCircuitBreaker(self.max_timeout_rate, self.abort_min_results)
+    
     def _prepare_context(
         self,
-        novel_tokens: List[int],
+        novel_tokens: Sequence[int],
         context_length: int
     ) -> str:
         """
@@ -187,13 +497,8 @@ class TestingTool:
         Returns:
             Context text string
         """
-        # Extract first N tokens
-        context_tokens = novel_tokens[:context_length]
-        
-        # Decode to text
-        context = self.tokenizer.decode(context_tokens)
-        
-        return context
+        # Decode the first N tokens in place
+        return self.tokenizer.decode_range(novel_tokens, 0, context_length)
     
     def _filter_questions(
         self,
@@ -218,6 +523,15 @@ class TestingTool:
         Returns:
             Filtered list of questions
         """
+        # Hoist the bound so each question costs one comparison
+        max_end_pos = context_length - padding_size
+        
+        if not logger.isEnabledFor(logging.DEBUG):
+            return [
+                question for question in questions
+                if question.get("position", {}).get("end_pos", 0) <= max_end_pos
+            ]
+        
         filtered = []
         
         for question in questions:
@@ -226,13 +540,12 @@ class TestingTool:
             end_pos = position.get("end_pos", 0)
             
             # Check if question fits in context with padding
-            if end_pos + padding_size <= context_length:
+            if end_pos <= max_end_pos:
                 filtered.append(question)
             else:
                 logger.debug(
-                    f"Filtered out question: end_pos={end_pos}, "
-                    f"required={end_pos + padding_size}, "
-                    f"context_length={context_length}"
+                    "Filtered out question: end_pos=%d, required=%d, context_length=%d",
+                    end_pos, end_pos + padding_size, context_length
                 )
         
         return filtered
@@ -241,7 +554,9 @@ class TestingTool:
         self,
         context: str,
         questions: List[Dict[str, Any]],
-        concurrency: int
+        concurrency: int,
+        writer: Optional[JsonlWriter] = None,
+        context_tokens: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Execute tests concurrently using asyncio.
@@ -250,52 +565,115 @@ class TestingTool:
             context: Prepared context text
             questions: List of questions to test
             concurrency: Maximum concurrent requests
+            writer: Optional JSONL writer; each result is written as soon
+                as its test finishes, in completion order
+            context_tokens: Token length of the context, if known; passed
+                on so the rate limiter need not estimate it
             
         Returns:
-            List of test results
+            List of test results, in question order
         """
-        semaphore = asyncio.Semaphore(concurrency)
+        context_hash = hash_context(context)
+        semaphore = self._create_semaphore(concurrency)
+        breaker = self._create_breaker()
+        context_cached = False
+        
+        # A fixed pool of workers pulls questions on demand, so only
+        # `concurrency` coroutines exist however large the batch is; the
+        # adaptive semaphore still throttles them below the cap
+        results: List[Optional[Dict[str, Any]]] = [None] * len(questions)
+        pending = iter(enumerate(questions))
+        total = len(questions)
+        log_every = max(1, total // _PROGRESS_LOG_STEPS)
+        
+        async def worker():
+            nonlocal context_cached
+            for idx, question in pending:
+                try:
+                    async with semaphore:
+                        breaker.check()
+                        if idx % log_every == 0:
+                            logger.info("Testing question %d/%d", idx + 1, total)
+                        result = await self._test_single_question(
+                            context, question, context_tokens
+                        )
+                        breaker.record(result)
+                except Exception as e:
+                    if not isinstance(e, BatchAborted):
+                        logger.error("Question %d failed with exception: %s", idx + 1, e)
+                    # Create error result
+                    result = self._make_error_result(question, "error")
+                
+                # Record the shared context; keep it on disk once recovery will
+                # need it, before the result reaches the output file
+                result["context_hash"] = context_hash
+                if not context_cached and self._is_result_failed(result):
+                    context_cached = True
+                    await self._cache_context(context_hash, context)
+                if writer is not None:
+                    writer.write(result)
+                results[idx] = result
+        
+        try:
+            await asyncio.gather(*(worker() for _ in range(min(concurrency, len(questions)))))
+        finally:
+            self.llm_client.set_concurrency_listener(None)
         
-        async def test_with_semaphore(question: Dict[str, Any], idx: int) -> Dict[str, Any]:
-            async with semaphore:
-                logger.info(f"Testing question {idx + 1}/{len(questions)}")
-                return await self._test_single_question(context, question)
+        return results
+    
+    async def _cache_context(
+        self,
+        context_hash: str,
+        context: str
+    ) -> None:
+        """
+        Store a failed test's context for recovery without blocking the loop.
         
-        tasks = [
-            test_with_semaphore(question, idx)
-            for idx, question in enumerate(questions)
-        ]
+        Args:
+            context_hash: Hash of the context
+            context: Context text
+        """
+        await asyncio.get_running_loop().run_in_executor(
+            None, self.context_cache.put, context_hash, context
+        )
+    
+    def _count_prompt_tokens(
+        self,
+        context_tokens: int,
+        question_text: str,
+        choices: Dict[str, str]
+    ) -> Optional[int]:
+        """
+        Count a testing prompt's tokens without re-tokenizing its context.
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Handle exceptions
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Question {i + 1} failed with exception: {result}")
-                # Create error result
-                question = questions[i]
-                processed_results.append({
-                    "question": question.get("question", ""),
-                    "question_type": question.get("question_type", ""),
-                    "choice": question.get("choice", {}),
-                    "correct_answer": question.get("answer", []),
-                    "model_answer": [],
-                    "raw_answer": None,
-                    "parsing_status": "error",
-                    "position": question.get("position", {}),
-                    "score": 0.0,
-                    "metrics": {}
-                })
-            else:
-                processed_results.append(result)
+        Args:
+            context_tokens: Token length of the context
+            question_text: Question text
+            choices: Answer choices
+            
+        Returns:
+            Prompt token count for the LLM client's rate limiter, or None
+            if the client has no rate limiter to feed
+        """
+        if self.llm_client.rate_limiter is None:
+            return None
         
-        return processed_results
+        system_prompt, user_prompt = self.prompt_manager.get_testing_prompt(
+            context="",
+            question=question_text,
+            choices=choices
+        )
+        return (
+            context_tokens
+            + self.tokenizer.count_tokens(system_prompt)
+            + self.tokenizer.count_tokens(user_prompt)
+        )
     
     async def _test_single_question(
         self,
         context: str,
-        question: Dict[str, Any]
+        question: Dict[str, Any],
+        context_tokens: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Test one question.
@@ -310,6 +688,7 @@ class TestingTool:
         Args:
             context: Context text for answering
             question: Question dictionary
+            context_tokens: Token length of the context, if known
             
         Returns:
             Test result dictionary with all fields
@@ -321,34 +700,29 @@ class TestingTool:
         correct_answer = question.get("answer", [])
         position = question.get("position", {})
         
-        # Get testing prompt
-        system_prompt, user_prompt = self.prompt_manager.get_testing_prompt(
+        # Get testing prompt; the head up to the end of the shared context is
+        # identical across the batch, so providers can serve it from cache
+        system_prompt, user_head, user_tail = self.prompt_manager.get_split_testing_prompt(
             context=context,
             question=question_text,
             choices=choices
         )
         
         # Call LLM
+        prompt_tokens = None
+        if context_tokens is not None:
+            prompt_tokens = self._count_prompt_tokens(context_tokens, question_text, choices)
         response = await self.llm_client.generate(
-            prompt=user_prompt,
-            system_prompt=system_prompt
+            prompt=user_tail,
+            system_prompt=system_prompt,
+            prompt_prefix=user_head,
+            prompt_tokens=prompt_tokens
         )
         
         # Handle None response (all retries failed)
         if response is None:
-            logger.warning(f"LLM returned None for question: {question_text[:50]}...")
-            return {
-                "question": question_text,
-                "question_type": question_type,
-                "choice": choices,
-                "correct_answer": correct_answer,
-                "model_answer": [],
-                "raw_answer": None,
-                "parsing_status": "timeout",
-                "position": position,
-                "score": 0.0,
-                "metrics": {}
-            }
+            logger.warning("LLM returned None for question: %.50s...", question_text)
+            return self._make_error_result(question, "timeout")
         
         # Parse answer
         model_answer, parsing_status = parse_answer(response)
@@ -374,6 +748,32 @@ class TestingTool:
         
         return result
     
+    @staticmethod
+    def _make_error_result(question: Dict[str, Any], status: str) -> Dict[str, Any]:
+        """
+        Build the result of a question that produced no model answer.
+        
+        Args:
+            question: Question dictionary
+            status: parsing_status to record (e.g. "error", "timeout")
+            
+        Returns:
+            Result dictionary with an empty answer and zero score; callers
+            append mode-specific fields
+        """
+        return {
+            "question": question.get("question", ""),
+            "question_type": question.get("question_type", ""),
+            "choice": question.get("choice", {}),
+            "correct_answer": question.get("answer", []),
+            "model_answer": [],
+            "raw_answer": None,
+            "parsing_status": status,
+            "position": question.get("position", {}),
+            "score": 0.0,
+            "metrics": {}
+        }
+    
     def _calculate_score(
         self,
         correct_answer: List[str],
@@ -398,31 +798,69 @@ class TestingTool:
         Returns:
             Tuple of (score, metrics_dict)
         """
-        metrics = {}
-        
         if question_type == "single_choice":
-            # Simple accuracy for single choice
-            if model_answer == correct_answer:
-                score = 1.0
-            else:
-                score = 0.0
+            # Exact match needs no cache key: a direct compare is cheaper
+            return (1.0 if model_answer == correct_answer else 0.0), {}
         
-        elif question_type == "multiple_choice":
+        if isinstance(correct_answer, list):
+            try:
+                score, metrics = self._score_cached(
+                    tuple(correct_answer), tuple(model_answer), question_type
+                )
+                return score, dict(metrics)
+            except TypeError:
+                # Unhashable answer items (malformed model output)
+                pass
+        
+        score, metrics = self._score(correct_answer, model_answer, question_type)
+        return score, dict(metrics)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _score_cached(
+        correct_answer: Sequence[str],
+        model_answer: Sequence[str],
+        question_type: str
+    ) -> Tuple[float, Tuple[Tuple[str, float], ...]]:
+        """
+        Memoized _score, keyed on (correct_answer, model_answer, question_type).
+        
+        Answers are passed as tuples so they can be cache keys.
+        """
+        return TestingTool._score(correct_answer, model_answer, question_type)
+    
+    @staticmethod
+    def _score(
+        correct_answer: Sequence[str],
+        model_answer: Sequence[str],
+        question_type: str
+    ) -> Tuple[float, Tuple[Tuple[str, float], ...]]:
+        """
+        Score a non-single-choice answer.
+        
+        Single choice is scored by _calculate_score before this is reached.
+        Metrics are returned as (name, value) pairs so cached results stay
+        immutable.
+        """
+        metrics = ()
+        
+        if question_type == "multiple_choice":
             # Calculate precision, recall, F1 for multiple choice
             correct_set = set(correct_answer)
             predicted_set = set(model_answer)
+            true_positives = len(correct_set & predicted_set)
             
             # Precision
             if len(predicted_set) == 0:
                 precision = 0.0
             else:
-                precision = len(correct_set & predicted_set) / len(predicted_set)
+                precision = true_positives / len(predicted_set)
             
             # Recall
             if len(correct_set) == 0:
                 recall = 0.0
             else:
-                recall = len(correct_set & predicted_set) / len(correct_set)
+                recall = true_positives / len(correct_set)
             
             # F1 score
             if precision + recall == 0:
@@ -430,11 +868,11 @@ class TestingTool:
             else:
                 f1 = 2 * (precision * recall) / (precision + recall)
             
-            metrics = {
-                "precision": precision,
-                "recall": recall,
-                "f1_score": f1
-            }
+            metrics = (
+                ("precision", precision),
+                ("recall", recall),
+                ("f1_score", f1)
+            )
             
             score = f1
         
@@ -446,7 +884,7 @@ class TestingTool:
     
     def _validate_context_lengths(
         self,
-        context_lengths: List[int],
+        context_lengths: Sequence[int],
         novel_length: int,
         questions: List[Dict[str, Any]],
         padding_size: int
@@ -477,21 +915,19 @@ class TestingTool:
             )
         
         # Find minimum evidence end position in questions
-        min_evidence_end = float('inf')
-        max_evidence_end = 0
-        
-        for q in questions:
-            position = q.get("position", {})
-            end_pos = position.get("end_pos", 0)
-            if end_pos > 0:
-                min_evidence_end = min(min_evidence_end, end_pos)
-                max_evidence_end = max(max_evidence_end, end_pos)
+        positions = [q.get("position", {}) for q in questions]
+        evidence_ends = [
+            end_pos for end_pos in (p.get("end_pos", 0) for p in positions)
+            if end_pos > 0
+        ]
         
-        if min_evidence_end == float('inf'):
+        if not evidence_ends:
             raise ValueError(
                 "No valid position information found in questions. "
                 "Questions must have position.end_pos field."
             )
+        min_evidence_end = min(evidence_ends)
+        max_evidence_end = max(evidence_ends)
         
         # Check minimum context length
         # Need at least: evidence + padding on both sides
@@ -507,19 +943,13 @@ class TestingTool:
             )
         
         # Check if any context length can cover questions
-        # For depth-aware testing, we need context_length > evidence_length + padding
-        usable_questions = 0
-        for q in questions:
-            position = q.get("position", {})
-            start_pos = position.get("start_pos", 0)
-            end_pos = position.get("end_pos", 0)
-            evidence_length = end_pos - start_pos + 2 * padding_size
-            
-            # Check if any context length can accommodate this question
-            for ctx_len in context_lengths:
-                if ctx_len > evidence_length:
-                    usable_questions += 1
-                    break
+        # For depth-aware testing, we need context_length > evidence_length + padding;
+        # some context length fits a question exactly when the longest one does
+        max_evidence_length = max_context - 2 * padding_size
+        usable_questions = sum(
+            1 for p in positions
+            if p.get("end_pos", 0) - p.get("start_pos", 0) < max_evidence_length
+        )
         
         if usable_questions == 0:
             raise ValueError(
@@ -543,37 +973,70 @@ class TestingTool:
         Args:
             results: List of test results
         """
-        total = len(results)
-        
-        # Count by parsing status
-        success = sum(1 for r in results if r["parsing_status"] == "success")
-        regex_extracted = sum(1 for r in results if r["parsing_status"] == "regex_extracted")
-        parsing_error = sum(1 for r in results if r["parsing_status"] == "parsing_error")
-        timeout = sum(1 for r in results if r["parsing_status"] == "timeout")
-        
-        # Calculate average score
-        avg_score = sum(r["score"] for r in results) / total if total > 0 else 0.0
+        if not logger.isEnabledFor(logging.INFO):
+            return
         
-        # Count by question type
-        single_choice = sum(1 for r in results if r["question_type"] == "single_choice")
-        multiple_choice = sum(1 for r in results if r["question_type"] == "multiple_choice")
+        summary = summarize_results(results)
+        status_counts = summary["status_counts"]
         
         logger.info("=" * 60)
         logger.info("TEST SUMMARY")
         logger.info("=" * 60)
-        logger.info(f"Total questions tested: {total}")
-        logger.info(f"  Single choice: {single_choice}")
-        logger.info(f"  Multiple choice: {multiple_choice}")
+        logger.info(f"Total questions tested: {summary['total']}")
+        logger.info(f"  Single choice: {summary['single_choice']}")
+        logger.info(f"  Multiple choice: {summary['multiple_choice']}")
         logger.info("")
         logger.info(f"Parsing status:")
-        logger.info(f"  Success: {success}")
-        logger.info(f"  Regex extracted: {regex_extracted}")
-        logger.info(f"  Parsing error: {parsing_error}")
-        logger.info(f"  Timeout: {timeout}")
+        logger.info(f"  Success: {status_counts['success']}")
+        logger.info(f"  Regex extracted: {status_counts['regex_extracted']}")
+        logger.info(f"  Parsing error: {status_counts['parsing_error']}")
+        logger.info(f"  Timeout: {status_counts['timeout']}")
         logger.info("")
-        logger.info(f"Average score: {avg_score:.4f}")
+        logger.info(f"Average score: {summary['avg_score']:.4f}")
         logger.info("=" * 60)
     
+    def _build_results_metadata(
+        self,
+        num_results: int,
+        novel_path: str,
+        question_set_path: str,
+        context_length: int,
+        padding_size: int,
+        question_metadata: Dict[str, Any],
+        planned_tests: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Build the metadata line for a test results file.
+        
+        Args:
+            num_results: Number of results in the file
+            novel_path: Path to novel file
+            question_set_path: Path to question set
+            context_length: Context length used
+            padding_size: Padding size used
+            question_metadata: Metadata from question set
+            planned_tests: Optional list of the tests the run will write,
+                so recovery can find the ones an interrupted run missed
+            
+        Returns:
+            Metadata dictionary
+        """
+        metadata = {
+            "tested_at": datetime.now().isoformat(),
+            "model_name": self.config.get("model_name", "unknown"),
+            "novel_path": novel_path,
+            "question_set_path": question_set_path,
+            "context_length": context_length,
+            "padding_size": padding_size,
+            "total_questions": num_results,
+            "tested_questions": num_results,
+            "config": self.config,
+            "question_set_metadata": question_metadata
+        }
+        if planned_tests is not None:
+            metadata["planned_tests"] = planned_tests
+        return metadata
+    
     def _save_results(
         self,
         results: List[Dict[str, Any]],
@@ -596,19 +1059,10 @@ class TestingTool:
             padding_size: Padding size used (for metadata)
             question_metadata: Metadata from question set
         """
-        # Build metadata
-        metadata = {
-            "tested_at": datetime.now().isoformat(),
-            "model_name": self.config.get("model_name", "unknown"),
-            "novel_path": novel_path,
-            "question_set_path": question_set_path,
-            "context_length": context_length,
-            "padding_size": padding_size,
-            "total_questions": len(results),
-            "tested_questions": len(results),
-            "config": self.config,
-            "question_set_metadata": question_metadata
-        }
+        metadata = self._build_results_metadata(
+            len(results), novel_path, question_set_path,
+            context_length, padding_size, question_metadata
+        )
         
         # Save to JSONL
         self.file_io.write_jsonl(output_path, results, metadata)
@@ -619,7 +1073,7 @@ class TestingTool:
         novel_path: str,
         question_set_path: str,
         depth_mode: str,
-        context_lengths: List[int],
+        context_lengths: Sequence[int],
         fixed_depth: Optional[float] = None,
         padding_size: int = 500,
         concurrency: int = 5,
@@ -653,23 +1107,32 @@ class TestingTool:
         """
         logger.info(f"Starting depth-aware test run")
         logger.info(f"  Mode: {depth_mode}")
-        logger.info(f"  Context lengths: {context_lengths}")
+        logger.info(f"  Context lengths: {list(context_lengths)}")
         logger.info(f"  Fixed depth: {fixed_depth}")
         if max_questions:
             logger.info(f"  Max questions: {max_questions}")
         
-        # Load novel and tokenize
+        # Load and tokenize the novel in a worker thread while the question
+        # set is parsed here; tiktoken releases the GIL while encoding
         logger.info("Loading and tokenizing novel...")
-        novel_text = self.file_io.read_novel(novel_path)
-        novel_tokens = self.tokenizer.encode(novel_text)
-        novel_length = len(novel_tokens)
-        logger.info(f"Novel loaded: {novel_length} tokens")
+        novel_future = asyncio.get_running_loop().run_in_executor(
+            None, self._load_novel, novel_path
+        )
         
         # Load question set
         logger.info("Loading question set...")
-        metadata, questions = self.file_io.read_jsonl(question_set_path)
+        try:
+            metadata, questions = self.file_io.read_jsonl(question_set_path)
+        except BaseException:
+            # Report the question set error, not a later novel error
+            novel_future.cancel()
+            raise
+        novel_tokens = await novel_future
         logger.info(f"Loaded {len(questions)} questions")
         
+        novel_length = len(novel_tokens)
+        logger.info(f"Novel loaded: {novel_length} tokens")
+        
         # Validate context lengths against novel and questions
         logger.info("Validating context lengths...")
         self._validate_context_lengths(
@@ -716,34 +1179,45 @@ class TestingTool:
         # Initialize context builder
         context_builder = ContextBuilder(self.tokenizer, novel_tokens)
         
-        # Execute tests concurrently
+        # Execute tests concurrently, streaming results to the output file
         logger.info(f"Executing depth-aware tests (concurrency={concurrency})...")
-        results = await self._test_depth_aware_batch(
-            questions=questions,
-            assignments=assignments,
-            context_builder=context_builder,
-            padding_size=padding_size,
-            concurrency=concurrency
-        )
+        if output_path:
+            results_metadata = self._build_depth_aware_results_metadata(
+                len(assignments), novel_path, question_set_path, depth_mode,
+                context_lengths, fixed_depth, padding_size, metadata,
+                planned_tests=[
+                    {
+                        "question": questions[assignment.question_index].get("question", ""),
+                        "target_depth": assignment.target_depth,
+                        "depth_bin": assignment.depth_bin,
+                        "test_context_length": assignment.context_length
+                    }
+                    for assignment in assignments
+                ]
+            )
+            with self.file_io.open_jsonl(output_path, results_metadata) as writer:
+                results = await self._test_depth_aware_batch(
+                    questions=questions,
+                    assignments=assignments,
+                    context_builder=context_builder,
+                    padding_size=padding_size,
+                    concurrency=concurrency,
+                    writer=writer
+                )
+            logger.info(f"Depth-aware results saved to: {output_path}")
+        else:
+            results = await self._test_depth_aware_batch(
+                questions=questions,
+                assignments=assignments,
+                context_builder=context_builder,
+                padding_size=padding_size,
+                concurrency=concurrency
+            )
         logger.info(f"Testing complete: {len(results)} results")
         
         # Calculate summary statistics
         self._log_depth_aware_summary(results)
         
-        # Save results if output path provided
-        if output_path:
-            self._save_depth_aware_results(
-                results=results,
-                output_path=output_path,
-                novel_path=novel_path,
-                question_set_path=question_set_path,
-                depth_mode=depth_mode,
-                context_lengths=context_lengths,
-                fixed_depth=fixed_depth,
-                padding_size=padding_size,
-                question_metadata=metadata
-            )
-        
         return results
     
     async def _test_depth_aware_batch(
@@ -752,7 +1226,8 @@ class TestingTool:
         assignments: List[DepthAssignment],
         context_builder: ContextBuilder,
         padding_size: int,
-        concurrency: int
+        concurrency: int,
+        writer: Optional[JsonlWriter] = None
     ) -> List[Dict[str, Any]]:
         """
         Execute depth-aware tests concurrently.
@@ -763,69 +1238,88 @@ class TestingTool:
             context_builder: Context builder instance
             padding_size: Padding around evidence
             concurrency: Maximum concurrent requests
+            writer: Optional JSONL writer; each result is written as soon
+                as its test finishes, in completion order
             
         Returns:
-            List of test results with depth information
+            List of test results with depth information, in assignment order
         """
-        semaphore = asyncio.Semaphore(concurrency)
-        
-        async def test_with_semaphore(
-            assignment: DepthAssignment,
-            idx: int
-        ) -> Dict[str, Any]:
-            async with semaphore:
-                question = questions[assignment.question_index]
-                logger.info(
-                    f"Testing question {idx + 1}/{len(assignments)} "
-                    f"(depth={assignment.depth_bin}, context={assignment.context_length})"
-                )
-                return await self._test_single_depth_aware(
-                    question=question,
-                    assignment=assignment,
-                    context_builder=context_builder,
-                    padding_size=padding_size
-                )
+        semaphore = self._create_semaphore(concurrency)
+        breaker = self._create_breaker()
+        # Build contexts off the event loop so they overlap in-flight requests
+        build_executor = ThreadPoolExecutor(
+            max_workers=min(concurrency, os.cpu_count() or 1),
+            thread_name_prefix="context-builder"
+        )
         
-        tasks = [
-            test_with_semaphore(assignment, idx)
-            for idx, assignment in enumerate(assignments)
-        ]
+        shared_builds = _SharedContextBuilds(
+            context_builder,
+            build_executor,
+            padding_size,
+            keys=[
+                _SharedContextBuilds.key(questions[assignment.question_index], assignment)
+                for assignment in assignments
+            ]
+        )
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # A fixed pool of workers pulls assignments on demand, so only
+        # `concurrency` coroutines exist however large the batch is
+        results: List[Optional[Dict[str, Any]]] = [None] * len(assignments)
+        pending = iter(enumerate(assignments))
+        total = len(assignments)
+        log_every = max(1, total // _PROGRESS_LOG_STEPS)
         
-        # Handle exceptions
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Assignment {i + 1} failed with exception: {result}")
-                assignment = assignments[i]
+        async def worker():
+            for idx, assignment in pending:
                 question = questions[assignment.question_index]
-                processed_results.append({
-                    "question": question.get("question", ""),
-                    "question_type": question.get("question_type", ""),
-                    "choice": question.get("choice", {}),
-                    "correct_answer": question.get("answer", []),
-                    "model_answer": [],
-                    "raw_answer": None,
-                    "parsing_status": "error",
-                    "position": question.get("position", {}),
-                    "score": 0.0,
-                    "metrics": {},
-                    "depth": assignment.target_depth,
-                    "depth_bin": assignment.depth_bin,
-                    "test_context_length": assignment.context_length
-                })
-            else:
-                processed_results.append(result)
+                try:
+                    async with semaphore:
+                        breaker.check()
+                        if idx % log_every == 0:
+                            logger.info(
+                                "Testing question %d/%d (depth=%s, context=%d)",
+                                idx + 1, total, assignment.depth_bin, assignment.context_length
+                            )
+                        result = await self._test_single_depth_aware(
+                            question=question,
+                            assignment=assignment,
+                            context_builder=context_builder,
+                            padding_size=padding_size,
+                            shared_builds=shared_builds
+                        )
+                        breaker.record(result)
+                except Exception as e:
+                    if not isinstance(e, BatchAborted):
+                        logger.error("Assignment %d failed with exception: %s", idx + 1, e)
+                    result = {
+                        **self._make_error_result(question, "error"),
+                        "depth": assignment.target_depth,
+                        "depth_bin": assignment.depth_bin,
+                        "test_context_length": assignment.context_length
+                    }
+                
+                if writer is not None:
+                    writer.write(result)
+                results[idx] = result
+        
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                build_executor, context_builder.prepare
+            )
+            await asyncio.gather(*(worker() for _ in range(min(concurrency, len(assignments)))))
+        finally:
+            self.llm_client.set_concurrency_listener(None)
+            build_executor.shutdown(wait=False)
         
-        return processed_results
+        return results
     
     async def _test_single_depth_aware(
         self,
         question: Dict[str, Any],
         assignment: DepthAssignment,
         context_builder: ContextBuilder,
-        padding_size: int
+        padding_size: int,
+        shared_builds: Optional[_SharedContextBuilds] = None
     ) -> Dict[str, Any]:
         """
         Test one question with depth-aware context.
@@ -835,6 +1329,8 @@ class TestingTool:
             assignment: Depth assignment for this question
             context_builder: Context builder instance
             padding_size: Padding around evidence
+            shared_builds: Batch-wide builds to share identical contexts
+                through (default: build this context on its own)
             
         Returns:
             Test result dictionary with depth information
@@ -846,63 +1342,55 @@ class TestingTool:
         correct_answer = question.get("answer", [])
         position = question.get("position", {})
         
-        # Build context with evidence at target depth
-        build_result = context_builder.build_context(
+        # Reject pairs that cannot fit before dispatching any build work
+        build_result = context_builder.check_budget(
             question=question,
             target_depth=assignment.target_depth,
             context_length=assignment.context_length,
             padding_size=padding_size
         )
+        if build_result is None:
+            # Build context with evidence at target depth
+            if shared_builds is None:
+                shared_builds = _SharedContextBuilds(context_builder, None, padding_size)
+            build_result = await shared_builds.build(question, assignment)
         
         if not build_result.success:
             logger.warning(
-                f"Context build failed for question: {build_result.error_message}"
+                "Context build failed for question: %s", build_result.error_message
             )
             return {
-                "question": question_text,
-                "question_type": question_type,
-                "choice": choices,
-                "correct_answer": correct_answer,
-                "model_answer": [],
-                "raw_answer": None,
-                "parsing_status": "context_build_error",
-                "position": position,
-                "score": 0.0,
-                "metrics": {},
+                **self._make_error_result(question, "context_build_error"),
                 "depth": assignment.target_depth,
                 "depth_bin": assignment.depth_bin,
                 "test_context_length": assignment.context_length,
                 "error_message": build_result.error_message
             }
         
+        context, actual_depth = build_result.context, build_result.actual_depth
+        
         # Get testing prompt
         system_prompt, user_prompt = self.prompt_manager.get_testing_prompt(
-            context=build_result.context,
+            context=context,
             question=question_text,
             choices=choices
         )
         
-        # Call LLM
+        # Call LLM; the context is exactly context_length tokens
         response = await self.llm_client.generate(
             prompt=user_prompt,
-            system_prompt=system_prompt
+            system_prompt=system_prompt,
+            prompt_tokens=self._count_prompt_tokens(
+                assignment.context_length, question_text, choices
+            )
         )
         
         # Handle None response
         if response is None:
-            logger.warning(f"LLM returned None for question: {question_text[:50]}...")
+            logger.warning("LLM returned None for question: %.50s...", question_text)
             return {
-                "question": question_text,
-                "question_type": question_type,
-                "choice": choices,
-                "correct_answer": correct_answer,
-                "model_answer": [],
-                "raw_answer": None,
-                "parsing_status": "timeout",
-                "position": position,
-                "score": 0.0,
-                "metrics": {},
-                "depth": assignment.target_depth,
+                **self._make_error_result(question, "timeout"),
+                "depth": actual_depth,
                 "depth_bin": assignment.depth_bin,
                 "test_context_length": assignment.context_length
             }
@@ -927,7 +1415,7 @@ class TestingTool:
             "position": position,
             "score": score,
             "metrics": metrics,
-            "depth": build_result.actual_depth,
+            "depth": actual_depth,
             "depth_bin": assignment.depth_bin,
             "test_context_length": assignment.context_length
         }
@@ -941,31 +1429,35 @@ class TestingTool:
         Args:
             results: List of test results with depth information
         """
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
         total = len(results)
         if total == 0:
             logger.info("No results to summarize")
             return
         
-        # Overall statistics
-        avg_score = sum(r["score"] for r in results) / total
-        
-        # Group by depth bin
+        # Overall score and per depth bin / context length groups, in one pass
+        score_total = 0.0
         depth_stats = {}
+        length_stats = {}
         for r in results:
+            score = r["score"]
+            score_total += score
+        
             depth_bin = r.get("depth_bin", "unknown")
             if depth_bin not in depth_stats:
                 depth_stats[depth_bin] = {"count": 0, "total_score": 0.0}
             depth_stats[depth_bin]["count"] += 1
-            depth_stats[depth_bin]["total_score"] += r["score"]
+            depth_stats[depth_bin]["total_score"] += score
         
-        # Group by context length
-        length_stats = {}
-        for r in results:
             ctx_len = r.get("test_context_length", 0)
             if ctx_len not in length_stats:
                 length_stats[ctx_len] = {"count": 0, "total_score": 0.0}
             length_stats[ctx_len]["count"] += 1
-            length_stats[ctx_len]["total_score"] += r["score"]
+            length_stats[ctx_len]["total_score"] += score
+        
+        avg_score = score_total / total
         
         logger.info("=" * 60)
         logger.info("DEPTH-AWARE TEST SUMMARY")
@@ -987,24 +1479,23 @@ class TestingTool:
             logger.info(f"  {ctx_len//1000}K: {acc:.4f} ({stats['count']} questions)")
         logger.info("=" * 60)
     
-    def _save_depth_aware_results(
+    def _build_depth_aware_results_metadata(
         self,
-        results: List[Dict[str, Any]],
-        output_path: str,
+        num_results: int,
         novel_path: str,
         question_set_path: str,
         depth_mode: str,
-        context_lengths: List[int],
+        context_lengths: Sequence[int],
         fixed_depth: Optional[float],
         padding_size: int,
-        question_metadata: Dict[str, Any]
-    ):
+        question_metadata: Dict[str, Any],
+        planned_tests: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
         """
-        Save depth-aware test results to JSONL file with metadata.
+        Build the metadata line for a depth-aware results file.
         
         Args:
-            results: List of test results
-            output_path: Path to save results
+            num_results: Number of results in the file
             novel_path: Path to novel file
             question_set_path: Path to question set
             depth_mode: Depth mode used
@@ -1012,8 +1503,12 @@ class TestingTool:
             fixed_depth: Fixed depth value (if applicable)
             padding_size: Padding size used
             question_metadata: Metadata from question set
+            planned_tests: Optional list of the assignments the run will
+                test, so recovery can find the ones an interrupted run missed
+        
+        Returns:
+            Metadata dictionary
         """
-        # Build metadata
         metadata = {
             "tested_at": datetime.now().isoformat(),
             "model_name": self.config.get("model_name", "unknown"),
@@ -1024,10 +1519,44 @@ class TestingTool:
             "fixed_depth": fixed_depth,
             "depth_bins": ["0%", "25%", "50%", "75%", "100%"],
             "padding_size": padding_size,
-            "total_questions": len(results),
+            "total_questions": num_results,
             "config": self.config,
             "question_set_metadata": question_metadata
         }
+        if planned_tests is not None:
+            metadata["planned_tests"] = planned_tests
+        return metadata
+    
+    def _save_depth_aware_results(
+        self,
+        results: List[Dict[str, Any]],
+        output_path: str,
+        novel_path: str,
+        question_set_path: str,
+        depth_mode: str,
+        context_lengths: Sequence[int],
+        fixed_depth: Optional[float],
+        padding_size: int,
+        question_metadata: Dict[str, Any]
+    ):
+        """
+        Save depth-aware test results to JSONL file with metadata.
+        
+        Args:
+            results: List of test results
+            output_path: Path to save results
+            novel_path: Path to novel file
+            question_set_path: Path to question set
+            depth_mode: Depth mode used
+            context_lengths: Context lengths tested
+            fixed_depth: Fixed depth value (if applicable)
+            padding_size: Padding size used
+            question_metadata: Metadata from question set
+        """
+        metadata = self._build_depth_aware_results_metadata(
+            len(results), novel_path, question_set_path, depth_mode,
+            context_lengths, fixed_depth, padding_size, question_metadata
+        )
         
         # Save to JSONL
         self.file_io.write_jsonl(output_path, results, metadata)
@@ -1154,49 +1683,43 @@ class TestingTool:
         Returns:
             List of test results
         """
-        semaphore = asyncio.Semaphore(concurrency)
+        semaphore = self._create_semaphore(concurrency)
+        breaker = self._create_breaker()
+        total = len(questions)
+        log_every = max(1, total // _PROGRESS_LOG_STEPS)
         
         async def test_with_semaphore(
             question: Dict[str, Any],
             idx: int
         ) -> Dict[str, Any]:
-            async with semaphore:
-                logger.info(f"Testing question {idx + 1}/{len(questions)}")
-                return await self._test_single_no_reference(
-                    question=question,
-                    summary=summary
-                )
+            try:
+                async with semaphore:
+                    breaker.check()
+                    if idx % log_every == 0:
+                        logger.info("Testing question %d/%d", idx + 1, total)
+                    result = await self._test_single_no_reference(
+                        question=question,
+                        summary=summary
+                    )
+                    breaker.record(result)
+                    return result
+            except Exception as e:
+                if not isinstance(e, BatchAborted):
+                    logger.error("Question %d failed with exception: %s", idx + 1, e)
+                return {
+                    **self._make_error_result(question, "error"),
+                    "test_mode": "no_reference"
+                }
         
         tasks = [
             test_with_semaphore(question, idx)
             for idx, question in enumerate(questions)
         ]
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Handle exceptions
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Question {i + 1} failed with exception: {result}")
-                question = questions[i]
-                processed_results.append({
-                    "question": question.get("question", ""),
-                    "question_type": question.get("question_type", ""),
-                    "choice": question.get("choice", {}),
-                    "correct_answer": question.get("answer", []),
-                    "model_answer": [],
-                    "raw_answer": None,
-                    "parsing_status": "error",
-                    "position": question.get("position", {}),
-                    "score": 0.0,
-                    "metrics": {},
-                    "test_mode": "no_reference"
-                })
-            else:
-                processed_results.append(result)
-        
-        return processed_results
+        try:
+            return await asyncio.gather(*tasks)
+        finally:
+            self.llm_client.set_concurrency_listener(None)
     
     async def _test_single_no_reference(
         self,
@@ -1235,18 +1758,9 @@ class TestingTool:
         
         # Handle None response
         if response is None:
-            logger.warning(f"LLM returned None for question: {question_text[:50]}...")
+            logger.warning("LLM returned None for question: %.50s...", question_text)
             return {
-                "question": question_text,
-                "question_type": question_type,
-                "choice": choices,
-                "correct_answer": correct_answer,
-                "model_answer": [],
-                "raw_answer": None,
-                "parsing_status": "timeout",
-                "position": position,
-                "score": 0.0,
-                "metrics": {},
+                **self._make_error_result(question, "timeout"),
                 "test_mode": "no_reference"
             }
         
@@ -1282,39 +1796,21 @@ class TestingTool:
         Args:
             results: List of test results
         """
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
         total = len(results)
         if total == 0:
             logger.info("No results to summarize")
             return
         
-        # Count by parsing status
-        success = sum(1 for r in results if r["parsing_status"] == "success")
-        regex_extracted = sum(1 for r in results if r["parsing_status"] == "regex_extracted")
-        parsing_error = sum(1 for r in results if r["parsing_status"] == "parsing_error")
-        timeout = sum(1 for r in results if r["parsing_status"] == "timeout")
-        error = sum(1 for r in results if r["parsing_status"] == "error")
-        
-        # Calculate average score
-        avg_score = sum(r["score"] for r in results) / total
-        
-        # Count by question type
-        single_choice = sum(1 for r in results if r["question_type"] == "single_choice")
-        multiple_choice = sum(1 for r in results if r["question_type"] == "multiple_choice")
-        
-        # Calculate accuracy for single choice
-        single_correct = sum(
-            1 for r in results 
-            if r["question_type"] == "single_choice" and r["score"] == 1.0
-        )
+        summary = summarize_results(results)
+        status_counts = summary["status_counts"]
+        single_choice = summary["single_choice"]
+        single_correct = summary["single_correct"]
+        multiple_choice = summary["multiple_choice"]
         single_accuracy = single_correct / single_choice if single_choice > 0 else 0.0
         
-        # Calculate average F1 for multiple choice
-        multi_f1_scores = [
-            r["score"] for r in results 
-            if r["question_type"] == "multiple_choice"
-        ]
-        avg_multi_f1 = sum(multi_f1_scores) / len(multi_f1_scores) if multi_f1_scores else 0.0
-        
         logger.info("=" * 60)
         logger.info("NO-REFERENCE TEST SUMMARY")
         logger.info("=" * 60)
@@ -1324,17 +1820,17 @@ class TestingTool:
         logger.info(f"  Multiple choice: {multiple_choice}")
         logger.info("")
         logger.info(f"Parsing status:")
-        logger.info(f"  Success: {success}")
-        logger.info(f"  Regex extracted: {regex_extracted}")
-        logger.info(f"  Parsing error: {parsing_error}")
-        logger.info(f"  Timeout: {timeout}")
-        logger.info(f"  Error: {error}")
+        logger.info(f"  Success: {status_counts['success']}")
+        logger.info(f"  Regex extracted: {status_counts['regex_extracted']}")
+        logger.info(f"  Parsing error: {status_counts['parsing_error']}")
+        logger.info(f"  Timeout: {status_counts['timeout']}")
+        logger.info(f"  Error: {status_counts['error']}")
         logger.info("")
-        logger.info(f"Overall average score: {avg_score:.4f}")
+        logger.info(f"Overall average score: {summary['avg_score']:.4f}")
         if single_choice > 0:
             logger.info(f"Single choice accuracy: {single_accuracy:.4f} ({single_correct}/{single_choice})")
         if multiple_choice > 0:
-            logger.info(f"Multiple choice avg F1: {avg_multi_f1:.4f}")
+            logger.info(f"Multiple choice avg F1: {summary['avg_multi_f1']:.4f}")
         logger.info("=" * 60)
     
     def _save_no_reference_results(
@@ -1393,6 +1889,110 @@ class TestingTool:
             return True
         return False
     
+    def _partition_results(
+        self,
+        results: List[Dict[str, Any]]
+    ) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Split previous results into failed and successful ones in one pass.
+        
+        Args:
+            results: Previous test results
+            
+        Returns:
+            Tuple of (failed_results, successful_results)
+        """
+        failed_results = []
+        successful_results = []
+        for result in results:
+            if self._is_result_failed(result):
+                failed_results.append(result)
+            else:
+                successful_results.append(result)
+        return failed_results, successful_results
+    
+    def _count_missing_results(
+        self,
+        metadata: Dict[str, Any],
+        results: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Count the results a previous run planned but never wrote.
+        
+        Results are streamed to disk as tests finish, so an interrupted run
+        leaves fewer results than the total_questions in its metadata.
+        
+        Args:
+            metadata: Metadata of the previous results file
+            results: Previous test results
+            
+        Returns:
+            Number of missing results (0 for a complete file)
+        """
+        return max(0, metadata.get("total_questions", len(results)) - len(results))
+    
+    def _find_missing_results(
+        self,
+        metadata: Dict[str, Any],
+        results: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Find the planned tests a previous run never wrote a result for.
+        
+        Streamed results files list their tests under "planned_tests",
+        which may be a sample of the question set. Files written without
+        that list cannot be topped up safely, so their missing results are
+        reported and skipped.
+        
+        Args:
+            metadata: Metadata of the previous results file
+            results: Previous test results
+            
+        Returns:
+            Planned test entries without a result, in planned order
+        """
+        missing_count = self._count_missing_results(metadata, results)
+        if not missing_count:
+            return []
+        
+        planned_tests = metadata.get("planned_tests")
+        if planned_tests is None:
+            logger.warning(
+                "Results file is missing %d results but does not list its "
+                "planned tests; re-run the test to cover them", missing_count
+            )
+            return []
+        
+        tested = Counter(self._build_result_key(r) for r in results)
+        missing = []
+        for planned in planned_tests:
+            key = self._build_result_key(planned)
+            if tested[key]:
+                tested[key] -= 1
+            else:
+                missing.append(planned)
+        return missing
+    
+    def _build_question_index(
+        self,
+        questions: List[Dict[str, Any]]
+    ) -> Dict[str, int]:
+        """
+        Map question text to its index in the question list.
+        
+        The first occurrence wins when question texts are duplicated.
+        
+        Args:
+            questions: List of question dictionaries
+            
+        Returns:
+            Dictionary mapping question text to list index
+        """
+        question_index = {}
+        for idx, question in enumerate(questions):
+            question_index.setdefault(question.get("question", ""), idx)
+        return question_index
+    
     def _build_result_key(self, result: Dict[str, Any]) -> str:
         """
         Build a unique key for a test result to match with questions.
@@ -1423,7 +2023,7 @@ class TestingTool:
         novel_path: str,
         question_set_path: str,
         depth_mode: str,
-        context_lengths: List[int],
+        context_lengths: Sequence[int],
         fixed_depth: Optional[float] = None,
         padding_size: int = 500,
         concurrency: int = 5,
@@ -1462,24 +2062,23 @@ class TestingTool:
         prev_metadata, prev_results = self.file_io.read_jsonl(recovery_path)
         logger.info(f"Loaded {len(prev_results)} previous results")
         
-        # Identify failed results
-        failed_results = [r for r in prev_results if self._is_result_failed(r)]
-        successful_results = [r for r in prev_results if not self._is_result_failed(r)]
+        # Identify failed and missing results
+        failed_results, successful_results = self._partition_results(prev_results)
+        missing_results = self._find_missing_results(prev_metadata, prev_results)
         
         logger.info(f"  Successful results (will keep): {len(successful_results)}")
         logger.info(f"  Failed results (will re-run): {len(failed_results)}")
+        logger.info(f"  Missing results (will run): {len(missing_results)}")
         
-        # Count failure types
-        error_count = sum(1 for r in failed_results if r.get("parsing_status") == "error")
-        timeout_count = sum(1 for r in failed_results if r.get("parsing_status") == "timeout")
-        context_error_count = sum(1 for r in failed_results if r.get("parsing_status") == "context_build_error")
+        # Count failure types in one pass
+        failure_counts = Counter(r.get("parsing_status") for r in failed_results)
         
         logger.info(f"  Failure breakdown:")
-        logger.info(f"    Error: {error_count}")
-        logger.info(f"    Timeout: {timeout_count}")
-        logger.info(f"    Context build error: {context_error_count}")
+        logger.info(f"    Error: {failure_counts['error']}")
+        logger.info(f"    Timeout: {failure_counts['timeout']}")
+        logger.info(f"    Context build error: {failure_counts['context_build_error']}")
         
-        if not failed_results:
+        if not failed_results and not missing_results:
             logger.info("No failed results to recover. All tests passed!")
             # Still save to output if specified
             if output_path:
@@ -1496,12 +2095,6 @@ class TestingTool:
                 )
             return prev_results
         
-        # Load novel and tokenize
-        logger.info("Loading and tokenizing novel...")
-        novel_text = self.file_io.read_novel(novel_path)
-        novel_tokens = self.tokenizer.encode(novel_text)
-        logger.info(f"Novel loaded: {len(novel_tokens)} tokens")
-        
         # Load question set
         logger.info("Loading question set...")
         metadata, questions = self.file_io.read_jsonl(question_set_path)
@@ -1513,31 +2106,19 @@ class TestingTool:
             ignore_invalid=ignore_invalid
         )
         
-        # Build question lookup by question text
-        question_lookup = {q.get("question", ""): q for q in questions}
-        
-        # Initialize context builder
-        context_builder = ContextBuilder(self.tokenizer, novel_tokens)
+        # Build question index by question text
+        question_index = self._build_question_index(questions)
         
         # Build assignments for failed results only
         failed_assignments = []
         for result in failed_results:
             question_text = result.get("question", "")
-            question = question_lookup.get(question_text)
+            question_idx = question_index.get(question_text)
             
-            if not question:
+            if question_idx is None:
                 logger.warning(f"Question not found in dataset: {question_text[:50]}...")
                 continue
             
-            # Find question index
-            question_idx = next(
-                (i for i, q in enumerate(questions) if q.get("question") == question_text),
-                -1
-            )
-            
-            if question_idx < 0:
-                continue
-            
             # Create assignment from previous result
             assignment = DepthAssignment(
                 question_index=question_idx,
@@ -1546,9 +2127,30 @@ class TestingTool:
                 context_length=result.get("test_context_length", context_lengths[0])
             )
             failed_assignments.append(assignment)
+        num_failed = len(failed_assignments)
+        
+        # Add the planned assignments an interrupted run never reached
+        for planned in missing_results:
+            question_text = planned.get("question", "")
+            question_idx = question_index.get(question_text)
+            if question_idx is None:
+                logger.warning(f"Question not found in dataset: {question_text[:50]}...")
+                continue
+            failed_assignments.append(DepthAssignment(
+                question_index=question_idx,
+                target_depth=planned["target_depth"],
+                depth_bin=planned["depth_bin"],
+                context_length=planned["test_context_length"]
+            ))
         
         logger.info(f"Created {len(failed_assignments)} recovery assignments")
         
+        logger.info("Loading and tokenizing novel...")
+        novel_text = self.file_io.read_novel(novel_path)
+        novel_tokens = self.token_cache.encode(self.tokenizer, novel_text)
+        logger.info(f"Novel loaded: {len(novel_tokens)} tokens")
+        context_builder = ContextBuilder(self.tokenizer, novel_tokens)
+        
         # Re-run failed tests
         logger.info(f"Re-running failed tests (concurrency={concurrency})...")
         recovery_results = await self._test_depth_aware_batch(
@@ -1584,6 +2186,8 @@ class TestingTool:
             else:
                 # Keep original result
                 final_results.append(result)
+        # Results for missing assignments come after the earlier ones
+        final_results.extend(recovery_results[num_failed:])
         
         logger.info(f"Final merged results: {len(final_results)}")
         
@@ -1652,14 +2256,15 @@ class TestingTool:
         prev_metadata, prev_results = self.file_io.read_jsonl(recovery_path)
         logger.info(f"Loaded {len(prev_results)} previous results")
         
-        # Identify failed results
-        failed_results = [r for r in prev_results if self._is_result_failed(r)]
-        successful_results = [r for r in prev_results if not self._is_result_failed(r)]
+        # Identify failed and missing results
+        failed_results, successful_results = self._partition_results(prev_results)
+        missing_results = self._find_missing_results(prev_metadata, prev_results)
         
         logger.info(f"  Successful results (will keep): {len(successful_results)}")
         logger.info(f"  Failed results (will re-run): {len(failed_results)}")
+        logger.info(f"  Missing results (will run): {len(missing_results)}")
         
-        if not failed_results:
+        if not failed_results and not missing_results:
             logger.info("No failed results to recover. All tests passed!")
             if output_path:
                 self._save_results(
@@ -1673,11 +2278,20 @@ class TestingTool:
                 )
             return prev_results
         
-        # Load novel and prepare context
-        logger.info("Loading and tokenizing novel...")
-        novel_text = self.file_io.read_novel(novel_path)
-        novel_tokens = self.tokenizer.encode(novel_text)
-        context = self._prepare_context(novel_tokens, context_length)
+        # All legacy tests share one context; reuse it if it was cached
+        context = None
+        context_hash = prev_results[0].get("context_hash") if prev_results else None
+        if context_hash and prev_metadata.get("context_length") == context_length:
+            context = self.context_cache.get(context_hash)
+        
+        if context is not None:
+            logger.info("Reusing cached context, skipping novel tokenization")
+        else:
+            # Load novel and prepare context
+            logger.info("Loading and tokenizing novel...")
+            novel_text = self.file_io.read_novel(novel_path)
+            novel_tokens = self.token_cache.encode(self.tokenizer, novel_text)
+            context = self._prepare_context(novel_tokens, context_length)
         
         # Load question set
         logger.info("Loading question set...")
@@ -1690,24 +2304,34 @@ class TestingTool:
             ignore_invalid=ignore_invalid
         )
         
-        # Build question lookup
-        question_lookup = {q.get("question", ""): q for q in questions}
+        # Build question index
+        question_index = self._build_question_index(questions)
         
         # Get questions to re-test
         questions_to_retest = []
         for result in failed_results:
-            question_text = result.get("question", "")
-            question = question_lookup.get(question_text)
-            if question:
-                questions_to_retest.append(question)
+            question_idx = question_index.get(result.get("question", ""))
+            if question_idx is not None:
+                questions_to_retest.append(questions[question_idx])
+        num_failed = len(questions_to_retest)
         
-        logger.info(f"Re-running {len(questions_to_retest)} failed tests...")
+        # Add the planned questions an interrupted run never reached
+        for planned in missing_results:
+            question_idx = question_index.get(planned.get("question", ""))
+            if question_idx is not None:
+                questions_to_retest.append(questions[question_idx])
+        
+        logger.info(
+            f"Re-running {num_failed} failed and "
+            f"{len(questions_to_retest) - num_failed} missing tests..."
+        )
         
         # Re-run failed tests
         recovery_results = await self._test_batch(
             context=context,
             questions=questions_to_retest,
-            concurrency=concurrency
+            concurrency=concurrency,
+            context_tokens=context_length
         )
         
         # Build recovery lookup
@@ -1721,6 +2345,7 @@ class TestingTool:
                 final_results.append(recovery_lookup[question_text])
             else:
                 final_results.append(result)
+        final_results.extend(recovery_results[num_failed:])
         
         # Log summary
         self._log_summary(final_results)
@@ -1772,9 +2397,9 @@ class TestingTool:
         logger.info(f"Loaded {len(prev_results)} previous results")
         
         # Identify failed results
-        failed_results = [r for r in prev_results if self._is_result_failed(r)]
+        failed_results, successful_results = self._partition_results(prev_results)
         
-        logger.info(f"  Successful results (will keep): {len(prev_results) - len(failed_results)}")
+        logger.info(f"  Successful results (will keep): {len(successful_results)}")
         logger.info(f"  Failed results (will re-run): {len(failed_results)}")
         
         if not failed_results:
@@ -1798,16 +2423,15 @@ class TestingTool:
             ignore_invalid=ignore_invalid
         )
         
-        # Build question lookup
-        question_lookup = {q.get("question", ""): q for q in questions}
+        # Build question index
+        question_index = self._build_question_index(questions)
         
         # Get questions to re-test
         questions_to_retest = []
         for result in failed_results:
-            question_text = result.get("question", "")
-            question = question_lookup.get(question_text)
-            if question:
-                questions_to_retest.append(question)
+            question_idx = question_index.get(result.get("question", ""))
+            if question_idx is not None:
+                questions_to_retest.append(questions[question_idx])
         
         logger.info(f"Re-running {len(questions_to_retest)} failed tests...")
         
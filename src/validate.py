@@ -17,6 +17,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any
 
+from .core.cache import TokenCache
 from .core.config import Config
 from .core.llm_client import LLMClient
 from .core.tokenizer import Tokenizer
@@ -200,18 +201,12 @@ def save_results(
         }
     }
     
-    # Convert results to dictionaries
-    if valid_only:
-        output_data = [
-            r.to_question_with_validation()
-            for r in results
-            if r.is_valid
-        ]
-    else:
-        output_data = [
-            r.to_question_with_validation()
-            for r in results
-        ]
+    # Convert results to dictionaries as they are written
+    output_data = (
+        r.to_question_with_validation()
+        for r in results
+        if r.is_valid or not valid_only
+    )
     
     # Save to JSONL
     FileIO.write_jsonl(output_path, output_data, metadata)
@@ -226,6 +221,7 @@ async def main():
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
+    llm_client = None
     try:
         # Validate arguments
         logger.info("Validating arguments...")
@@ -257,7 +253,9 @@ async def main():
         # Load novel and tokenize
         logger.info("Loading and tokenizing novel...")
         novel_text = FileIO.read_novel(args.novel)
-        novel_tokens = tokenizer.encode(novel_text)
+        # Packed int32 tokens, reused from the token cache on later runs, so
+        # each question's span is decoded without a list copy
+        novel_tokens = TokenCache().encode(tokenizer, novel_text)
         logger.info(f"Novel loaded: {len(novel_tokens)} tokens")
         
         # Load questions
@@ -344,6 +342,10 @@ async def main():
         logger.error(f"Unexpected error during validation: {e}", exc_info=True)
         return 1
 
+    finally:
+        if llm_client is not None:
+            await llm_client.close()
+
 
 def cli_main():
     """CLI entry point wrapper for console script."""
@@ -11,6 +11,10 @@ from difflib import SequenceMatcher
 from typing import Tuple, Optional
 
 
+# Runs of whitespace (spaces, newlines, tabs)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
 class EvidenceMatcher:
     """
     Matches evidence text against source context with fuzzy matching support.
@@ -117,7 +121,7 @@ class EvidenceMatcher:
         text = text.lower()
         
         # Normalize whitespace (collapse multiple spaces, newlines, tabs)
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         
         # Normalize common punctuation variants
         # Chinese/Japanese punctuation to standard
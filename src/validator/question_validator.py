@@ -10,7 +10,7 @@ import asyncio
 import json
 import logging
 import re
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 
 from ..core.llm_client import LLMClient
 from ..core.tokenizer import Tokenizer
@@ -24,6 +24,9 @@ from .answer_comparator import compare_answers, parse_answer_from_response
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# JSON object inside a markdown code block, e.g. ```json {...} ```
+_CODE_BLOCK_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+
 
 class QuestionValidator:
     """
@@ -213,7 +216,7 @@ class QuestionValidator:
     async def validate_batch(
         self,
         questions: List[Dict[str, Any]],
-        novel_tokens: List[int],
+        novel_tokens: Sequence[int],
         concurrency: int = 5,
         retry_times: int = 3
     ) -> Tuple[List[ValidationResult], Dict[str, int]]:
@@ -239,7 +242,7 @@ class QuestionValidator:
             idx: int
         ) -> ValidationResult:
             async with semaphore:
-                logger.info(f"Validating question {idx + 1}/{len(questions)}")
+                logger.info("Validating question %d/%d", idx + 1, len(questions))
                 
                 # Extract context for this question
                 context = self._extract_context_for_question(question, novel_tokens)
@@ -248,7 +251,7 @@ class QuestionValidator:
                 result = await self.validate_question(question, context)
                 
                 status = "PASS" if result.is_valid else "FAIL"
-                logger.info(f"Question {idx + 1}: {status}")
+                logger.info("Question %d: %s", idx + 1, status)
                 
                 return result
         
@@ -293,7 +296,7 @@ class QuestionValidator:
     def _extract_context_for_question(
         self,
         question: Dict[str, Any],
-        novel_tokens: List[int]
+        novel_tokens: Sequence[int]
     ) -> str:
         """
         Extract the context that was used to generate this question.
@@ -311,13 +314,8 @@ class QuestionValidator:
         start_pos = position.get("start_pos", 0)
         end_pos = position.get("end_pos", len(novel_tokens))
         
-        # Extract tokens
-        context_tokens = novel_tokens[start_pos:end_pos]
-        
-        # Decode to text
-        context = self.tokenizer.decode(context_tokens)
-        
-        return context
+        # Decode the evidence span in place
+        return self.tokenizer.decode_range(novel_tokens, start_pos, end_pos)
     
     def _format_choices(self, choices: Dict[str, str]) -> str:
         """
@@ -363,8 +361,7 @@ class QuestionValidator:
             pass
         
         # Strategy 2: Extract from markdown code blocks
-        code_block_pattern = r'```(?:json)?\s*(\{[\s\S]*?\})\s*```'
-        match = re.search(code_block_pattern, response, re.DOTALL)
+        match = _CODE_BLOCK_RE.search(response)
         if match:
             try:
                 result = json.loads(match.group(1).strip())
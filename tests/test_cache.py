@@ -0,0 +1,155 @@
+"""
+Tests for the on-disk context cache.
+"""
+
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+from src.core.cache import ContextCache, TokenCache, get_cache_dir, hash_context
+
+
+class CountingTokenizer:
+    """Tokenizer stand-in that encodes text to code points and counts calls."""
+    
+    encoding_id = "test-encoding"
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def encode(self, text):
+        self.calls += 1
+        return [ord(c) for c in text]
+
+
+class TestHashContext:
+    """Test cases for hash_context."""
+    
+    def test_stable_and_content_sensitive(self):
+        """Test that equal contexts hash equally and different ones do not."""
+        assert hash_context("abc") == hash_context("abc")
+        assert hash_context("abc") != hash_context("abd")
+        assert len(hash_context("")) == 32
+
+
+class TestContextCache:
+    """Test cases for ContextCache."""
+    
+    def test_put_and_get(self, tmp_path):
+        """Test storing and retrieving a context."""
+        cache = ContextCache(str(tmp_path / "cache.sqlite"))
+        context = "哈利·波特 " * 100
+        context_hash = hash_context(context)
+        
+        assert cache.get(context_hash) is None
+        cache.put(context_hash, context)
+        assert cache.get(context_hash) == context
+        cache.close()
+    
+    def test_persists_across_instances(self, tmp_path):
+        """Test that a reopened cache still has earlier entries."""
+        db_path = str(tmp_path / "cache.sqlite")
+        cache = ContextCache(db_path)
+        cache.put("h", "context")
+        cache.close()
+        
+        assert ContextCache(db_path).get("h") == "context"
+    
+    def test_stale_entries_pruned_on_open(self, tmp_path):
+        """Test that entries older than max_age are dropped when reopened."""
+        db_path = str(tmp_path / "cache.sqlite")
+        cache = ContextCache(db_path, max_age=3600)
+        cache.put("old", "context")
+        cache.put("new", "context")
+        with cache._connect() as conn:
+            conn.execute("UPDATE contexts SET stored_at = stored_at - 7200 WHERE context_hash = 'old'")
+        cache.close()
+        
+        cache = ContextCache(db_path, max_age=3600)
+        assert cache.get("old") is None
+        assert cache.get("new") == "context"
+        cache.close()
+    
+    def test_put_refreshes_age(self, tmp_path):
+        """Test that storing an existing context again resets its age."""
+        db_path = str(tmp_path / "cache.sqlite")
+        cache = ContextCache(db_path, max_age=3600)
+        cache.put("h", "context")
+        with cache._connect() as conn:
+            conn.execute("UPDATE contexts SET stored_at = stored_at - 7200")
+        cache.put("h", "context")
+        cache.close()
+        
+        assert ContextCache(db_path, max_age=3600).get("h") == "context"
+    
+    def test_usable_from_executor_threads(self, tmp_path):
+        """Test that a cache opened on one thread can be written from another."""
+        cache = ContextCache(str(tmp_path / "cache.sqlite"))
+        assert cache.get("h") is None
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(cache.put, "h", "context").result()
+        
+        assert cache.get("h") == "context"
+        cache.close()
+    
+    def test_unavailable_cache_is_a_miss(self, tmp_path):
+        """Test that an unopenable database degrades to cache misses."""
+        cache = ContextCache(str(tmp_path / "missing" / "cache.sqlite"))
+        cache.put("h", "context")
+        assert cache.get("h") is None
+    
+    def test_cache_dir_from_env(self, tmp_path, monkeypatch):
+        """Test that HOGWARTS_CACHE_DIR overrides the default location."""
+        monkeypatch.setenv("HOGWARTS_CACHE_DIR", str(tmp_path / "c"))
+        assert get_cache_dir() == tmp_path / "c"
+        assert (tmp_path / "c").is_dir()
+
+
+class TestTokenCache:
+    """Test cases for TokenCache."""
+    
+    def test_second_encode_is_a_mapped_hit(self, tmp_path):
+        """Test that a cached text is memory-mapped instead of re-tokenized."""
+        cache = TokenCache(str(tmp_path))
+        tokenizer = CountingTokenizer()
+        text = "哈利·波特与魔法石"
+        
+        first = cache.encode(tokenizer, text)
+        second = cache.encode(tokenizer, text)
+        
+        assert tokenizer.calls == 1
+        assert isinstance(first, array)
+        assert isinstance(second, memoryview)
+        assert list(second) == list(first) == [ord(c) for c in text]
+        assert list(second[2:4]) == [ord(c) for c in text[2:4]]
+    
+    def test_key_includes_encoding(self, tmp_path):
+        """Test that a different encoding does not reuse cached tokens."""
+        cache = TokenCache(str(tmp_path))
+        tokenizer = CountingTokenizer()
+        cache.encode(tokenizer, "text")
+        
+        other = CountingTokenizer()
+        other.encoding_id = "other-encoding"
+        cache.encode(other, "text")
+        
+        assert other.calls == 1
+    
+    def test_empty_text(self, tmp_path):
+        """Test that an empty token list round-trips."""
+        cache = TokenCache(str(tmp_path))
+        tokenizer = CountingTokenizer()
+        
+        cache.encode(tokenizer, "")
+        assert list(cache.encode(tokenizer, "")) == []
+        assert tokenizer.calls == 1
+    
+    def test_unwritable_cache_falls_back(self, tmp_path):
+        """Test that a cache write failure still returns tokens."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        cache = TokenCache(str(blocker / "tokens"))
+        
+        tokens = cache.encode(CountingTokenizer(), "ab")
+        assert isinstance(tokens, array)
+        assert list(tokens) == [97, 98]
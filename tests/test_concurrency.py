@@ -0,0 +1,143 @@
+"""
+Tests for the adaptive concurrency controller and rate limiter.
+"""
+
+import asyncio
+
+import pytest
+from src.core import concurrency
+from src.core.concurrency import AdaptiveSemaphore, RateLimiter
+
+
+class TestAdaptiveSemaphore:
+    """Test cases for AdaptiveSemaphore."""
+    
+    def test_starts_at_max_capacity(self):
+        """Test that capacity starts at the configured cap."""
+        semaphore = AdaptiveSemaphore(8)
+        assert semaphore.capacity == 8
+    
+    def test_invalid_capacity(self):
+        """Test that a non-positive cap is rejected."""
+        with pytest.raises(ValueError):
+            AdaptiveSemaphore(0)
+    
+    def test_rate_limit_halves_capacity(self):
+        """Test multiplicative decrease on rate limit."""
+        semaphore = AdaptiveSemaphore(8, decrease_cooldown=0.0)
+        semaphore.on_rate_limit()
+        assert semaphore.capacity == 4
+        semaphore.on_rate_limit()
+        semaphore.on_rate_limit()
+        semaphore.on_rate_limit()
+        assert semaphore.capacity == 1
+    
+    def test_rate_limit_burst_backs_off_once(self):
+        """Test that simultaneous rate limits only halve capacity once."""
+        semaphore = AdaptiveSemaphore(8, decrease_cooldown=60.0)
+        for _ in range(5):
+            semaphore.on_rate_limit()
+        assert semaphore.capacity == 4
+    
+    def test_successes_increase_capacity_up_to_cap(self):
+        """Test additive increase, clamped to the cap."""
+        semaphore = AdaptiveSemaphore(4, increase_every=10, decrease_cooldown=0.0)
+        semaphore.on_rate_limit()
+        assert semaphore.capacity == 2
+        
+        for _ in range(10):
+            semaphore.on_success()
+        assert semaphore.capacity == 3
+        
+        for _ in range(100):
+            semaphore.on_success()
+        assert semaphore.capacity == 4
+    
+    def test_limits_concurrent_holders(self):
+        """Test that no more than capacity holders run at once."""
+        semaphore = AdaptiveSemaphore(3)
+        peak = 0
+        
+        async def worker():
+            nonlocal peak
+            async with semaphore:
+                peak = max(peak, semaphore.in_use)
+                await asyncio.sleep(0.01)
+        
+        async def run():
+            await asyncio.gather(*(worker() for _ in range(10)))
+        
+        asyncio.run(run())
+        assert peak == 3
+        assert semaphore.in_use == 0
+    
+    def test_reduced_capacity_applies_to_new_acquires(self):
+        """Test that waiters respect a capacity reduced mid-run."""
+        semaphore = AdaptiveSemaphore(4, decrease_cooldown=0.0)
+        peak_after_backoff = 0
+        
+        async def worker(idx):
+            nonlocal peak_after_backoff
+            async with semaphore:
+                if idx == 0:
+                    semaphore.on_rate_limit()
+                    semaphore.on_rate_limit()
+                elif idx >= 4:
+                    peak_after_backoff = max(peak_after_backoff, semaphore.in_use)
+                await asyncio.sleep(0.01)
+        
+        async def run():
+            await asyncio.gather(*(worker(i) for i in range(12)))
+        
+        asyncio.run(run())
+        assert semaphore.capacity == 1
+        assert peak_after_backoff == 1
+
+
+class TestRateLimiter:
+    """Test cases for RateLimiter."""
+    
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Controllable monotonic clock, in seconds."""
+        now = [0.0]
+        monkeypatch.setattr(concurrency.time, "monotonic", lambda: now[0])
+        return now
+    
+    def test_negative_limit(self):
+        """Test that negative limits are rejected."""
+        with pytest.raises(ValueError):
+            RateLimiter(requests_per_minute=-1)
+    
+    def test_burst_then_paced_requests(self, clock):
+        """Test that a full bucket admits a burst, then paces at the rate."""
+        limiter = RateLimiter(requests_per_minute=60)
+        
+        assert all(limiter.reserve() == 0.0 for _ in range(60))
+        assert limiter.reserve() == pytest.approx(1.0)
+        assert limiter.reserve() == pytest.approx(2.0)
+        
+        clock[0] = 10.0
+        assert limiter.reserve() == 0.0
+    
+    def test_token_limit(self, clock):
+        """Test that large requests wait for their tokens to refill."""
+        limiter = RateLimiter(tokens_per_minute=6000)
+        
+        assert limiter.reserve(5000) == 0.0
+        assert limiter.reserve(3000) == pytest.approx(20.0)
+        
+        # Requests larger than the bucket still get through eventually
+        clock[0] = 20.0
+        assert limiter.reserve(9000) == pytest.approx(90.0)
+    
+    def test_slowest_limit_wins(self, clock):
+        """Test that the delay is the longer of the two limits."""
+        limiter = RateLimiter(requests_per_minute=1, tokens_per_minute=60)
+        
+        assert limiter.reserve(30) == 0.0
+        assert limiter.reserve(30) == pytest.approx(60.0)
+    
+    def test_acquire_without_limits(self):
+        """Test that an unlimited limiter never waits."""
+        asyncio.run(RateLimiter().acquire(10 ** 6))
@@ -0,0 +1,194 @@
+"""
+Tests for the ContextBuilder module.
+"""
+
+from array import array
+
+import pytest
+from src.tester.context_builder import ContextBuilder
+
+
+class FakeTokenizer:
+    """Tokenizer stand-in that decodes token i to the text "i "."""
+    
+    def decode_bytes(self, tokens):
+        return b"".join(self.token_bytes(t) for t in tokens)
+    
+    def token_bytes(self, token):
+        return f"{token} ".encode("utf-8")
+
+
+class ByteTokenizer:
+    """Tokenizer stand-in with one token per UTF-8 byte."""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def decode_bytes(self, tokens):
+        self.calls += 1
+        return bytes(list(tokens))
+    
+    def token_bytes(self, token):
+        return bytes([token])
+
+
+def make_builder(novel_length=1000):
+    """Create a builder over a novel whose token i is the integer i."""
+    return ContextBuilder(FakeTokenizer(), list(range(novel_length)))
+
+
+def decoded(result):
+    """Decode a build result's context back to token ints."""
+    return [int(t) for t in result.context.split()]
+
+
+class TestBuildContext:
+    """Test cases for ContextBuilder.build_context."""
+    
+    @pytest.mark.parametrize("depth", [0.0, 0.25, 0.5, 1.0])
+    def test_evidence_placed_at_depth(self, depth):
+        """Test that evidence lands at the requested depth with exact length."""
+        builder = make_builder()
+        question = {"position": {"start_pos": 500, "end_pos": 520}}
+        
+        result = builder.build_context(question, depth, context_length=200, padding_size=10)
+        
+        assert result.success
+        assert result.total_length == 200
+        assert result.evidence_length == 40
+        assert result.prefix_length == int(160 * depth)
+        tokens = decoded(result)
+        assert tokens[result.evidence_start:result.evidence_end] == list(range(490, 530))
+    
+    def test_prefix_borrows_from_after_region(self):
+        """Test that a short before-region is topped up from after the evidence."""
+        builder = make_builder()
+        question = {"position": {"start_pos": 20, "end_pos": 30}}
+        
+        result = builder.build_context(question, 1.0, context_length=100, padding_size=10)
+        
+        tokens = decoded(result)
+        assert result.prefix_length == 70
+        assert tokens[:result.prefix_length] == list(range(0, 10)) + list(range(40, 100))
+    
+    def test_suffix_borrows_from_before_region(self):
+        """Test that a short after-region is topped up from before the evidence."""
+        builder = make_builder()
+        question = {"position": {"start_pos": 970, "end_pos": 980}}
+        
+        result = builder.build_context(question, 0.0, context_length=100, padding_size=10)
+        
+        tokens = decoded(result)
+        assert result.suffix_length == 70
+        assert tokens[result.evidence_end:] == list(range(900, 960)) + list(range(990, 1000))
+    
+    @pytest.mark.parametrize("start_pos", [5, 100, 480, 900, 985])
+    @pytest.mark.parametrize("depth", [0.0, 0.3, 1.0])
+    def test_filler_never_repeats_tokens(self, start_pos, depth):
+        """Test that prefix and suffix filler never share novel tokens."""
+        builder = make_builder()
+        question = {"position": {"start_pos": start_pos, "end_pos": start_pos + 10}}
+        
+        result = builder.build_context(question, depth, context_length=300, padding_size=5)
+        
+        tokens = decoded(result)
+        assert result.total_length == 300
+        assert len(set(tokens)) == len(tokens)
+    
+    def test_novel_shorter_than_context(self):
+        """Test that all available filler is used when the novel is too short."""
+        builder = make_builder(novel_length=100)
+        question = {"position": {"start_pos": 40, "end_pos": 50}}
+        
+        result = builder.build_context(question, 0.5, context_length=500, padding_size=0)
+        
+        assert result.success
+        assert sorted(decoded(result)) == list(range(100))
+    
+    def test_evidence_too_long(self):
+        """Test that evidence longer than the context fails cleanly."""
+        builder = make_builder()
+        question = {"position": {"start_pos": 100, "end_pos": 300}}
+        
+        result = builder.build_context(question, 0.5, context_length=100, padding_size=0)
+        
+        assert not result.success
+        assert "exceeds context length" in result.error_message
+    
+    def test_missing_position(self):
+        """Test that a question without position fails cleanly."""
+        result = make_builder().build_context({}, 0.5, context_length=100)
+        
+        assert not result.success
+    
+    def test_invalid_depth(self):
+        """Test that an out-of-range depth is rejected."""
+        question = {"position": {"start_pos": 100, "end_pos": 110}}
+        result = make_builder().build_context(question, 1.5, context_length=100)
+        
+        assert not result.success
+    
+    def test_multibyte_characters_across_seams(self):
+        """Test that characters split between filler and evidence survive."""
+        text = "哈利·波特与魔法石" * 20
+        novel = list(text.encode("utf-8"))
+        builder = ContextBuilder(ByteTokenizer(), novel)
+        # Evidence starts in the middle of a 3-byte character
+        question = {"position": {"start_pos": 100, "end_pos": 130}}
+        
+        result = builder.build_context(question, 1.0, context_length=90, padding_size=0)
+        
+        assert result.success
+        assert "\ufffd" not in result.context
+        assert result.context.encode("utf-8") == bytes(novel[40:130])
+    
+    def test_builds_slice_predecoded_novel(self):
+        """Test that the novel is decoded once, not per build."""
+        tokenizer = ByteTokenizer()
+        builder = ContextBuilder(tokenizer, list(b"abcdefghij" * 100))
+        question = {"position": {"start_pos": 500, "end_pos": 520}}
+        
+        for depth in (0.0, 0.5, 1.0):
+            result = builder.build_context(question, depth, context_length=200, padding_size=10)
+            assert len(result.context) == 200
+        
+        assert tokenizer.calls == 1
+    
+    def test_novel_decoded_lazily(self):
+        """Test that construction does not decode the novel."""
+        tokenizer = ByteTokenizer()
+        builder = ContextBuilder(tokenizer, list(b"abcdefghij" * 100))
+        assert tokenizer.calls == 0
+        
+        builder.prepare()
+        builder.prepare()
+        assert tokenizer.calls == 1
+    
+    def test_check_budget(self):
+        """Test that check_budget rejects overflow without decoding."""
+        tokenizer = ByteTokenizer()
+        builder = ContextBuilder(tokenizer, list(b"abcdefghij" * 100))
+        question = {"position": {"start_pos": 100, "end_pos": 300}}
+        
+        assert builder.check_budget(question, 0.5, context_length=1000, padding_size=0) is None
+        failure = builder.check_budget(question, 0.5, context_length=100, padding_size=0)
+        assert not failure.success
+        assert failure.evidence_length == 200
+        assert tokenizer.calls == 0
+    
+    def test_accepts_int32_memoryview(self):
+        """Test that a packed int32 view (as from the token cache) is used as is."""
+        tokens = memoryview(array('i', range(1000)))
+        builder = ContextBuilder(FakeTokenizer(), tokens)
+        question = {"position": {"start_pos": 500, "end_pos": 520}}
+        
+        result = builder.build_context(question, 0.5, context_length=200, padding_size=10)
+        
+        assert builder.novel_tokens is tokens
+        assert decoded(result) == decoded(make_builder().build_context(question, 0.5, 200, 10))
+    
+    def test_accepts_int32_array(self):
+        """Test that a packed int32 array (a token cache miss) is not copied."""
+        tokens = array('i', range(1000))
+        
+        assert ContextBuilder(FakeTokenizer(), tokens).novel_tokens is tokens
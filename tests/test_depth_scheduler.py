@@ -0,0 +1,119 @@
+"""
+Tests for depth scheduling and depth-balanced sampling.
+"""
+
+import random
+
+import pytest
+from src.tester.depth_scheduler import (
+    DepthMode,
+    DepthScheduler,
+    _depth_bin_index,
+    sample_questions_by_depth,
+)
+
+
+def make_questions(end_positions):
+    """Create minimal questions with the given evidence end positions."""
+    return [{"id": i, "position": {"end_pos": pos}} for i, pos in enumerate(end_positions)]
+
+
+class TestDepthBinLabel:
+    """Test cases for DepthScheduler._get_depth_bin_label."""
+    
+    @pytest.mark.parametrize("depth, label", [
+        (0.0, "0%"),
+        (0.1, "0%"),
+        (0.125, "0%"),
+        (0.2, "25%"),
+        (0.375, "25%"),
+        (0.6, "50%"),
+        (0.875, "75%"),
+        (0.9, "100%"),
+        (1.0, "100%"),
+    ])
+    def test_closest_bin_with_ties_down(self, depth, label):
+        """Test that depths map to the closest bin, ties to the lower one."""
+        scheduler = DepthScheduler(DepthMode.FIXED, fixed_depth=0.5, context_lengths=[1000])
+        assert scheduler._get_depth_bin_label(depth) == label
+
+
+class TestScheduleUniform:
+    """Test cases for uniform depth scheduling."""
+    
+    def test_cycles_depths_then_lengths(self):
+        """Test that assignments cycle depths fastest, then context lengths."""
+        scheduler = DepthScheduler(DepthMode.UNIFORM, context_lengths=[1000, 2000])
+        
+        assignments = scheduler.schedule([{}] * 12)
+        
+        assert [a.question_index for a in assignments] == list(range(12))
+        assert [a.depth_bin for a in assignments[:6]] == ["0%", "25%", "50%", "75%", "100%", "0%"]
+        assert [a.context_length for a in assignments[4:6]] == [1000, 2000]
+        assert assignments[10].target_depth == 0.0
+        assert assignments[10].context_length == 1000
+    
+    def test_assignments_are_slotted(self):
+        """Test that assignments carry no per-instance dict."""
+        assignment = DepthScheduler(DepthMode.UNIFORM, context_lengths=[1000]).schedule([{}])[0]
+        assert not hasattr(assignment, "__dict__")
+
+
+class TestDepthBinIndex:
+    """Test cases for _depth_bin_index."""
+    
+    @pytest.mark.parametrize("end_pos, bin_idx", [
+        (-5, 0),
+        (0, 0),
+        (199, 0),
+        (200, 1),
+        (600, 3),
+        (799, 3),
+        (800, 4),
+        (1000, 4),
+        (1500, 4),
+    ])
+    def test_bin_edges(self, end_pos, bin_idx):
+        """Test that bin edges belong to the upper bin and overflow is clamped."""
+        question = {"position": {"end_pos": end_pos}}
+        assert _depth_bin_index(question, 1000) == bin_idx
+
+
+class TestSampleQuestionsByDepth:
+    """Test cases for sample_questions_by_depth."""
+    
+    def test_balanced_across_bins(self):
+        """Test that each depth bin contributes an equal share."""
+        questions = make_questions(range(0, 1000, 5))
+        random.seed(0)
+        
+        sampled = sample_questions_by_depth(questions, 10, novel_length=1000)
+        
+        bins = [min(q["position"]["end_pos"] * 5 // 1000, 4) for q in sampled]
+        assert sorted(bins) == [0, 0, 1, 1, 2, 2, 3, 3, 4, 4]
+    
+    def test_short_bins_topped_up_without_duplicates(self):
+        """Test that missing samples are drawn from other bins, once each."""
+        questions = make_questions([10, 20, 30, 40, 50, 60, 900])
+        random.seed(0)
+        
+        sampled = sample_questions_by_depth(questions, 5, novel_length=1000)
+        
+        ids = [q["id"] for q in sampled]
+        assert len(ids) == 5
+        assert len(set(ids)) == 5
+        assert 6 in ids
+    
+    def test_returns_all_when_max_exceeds_count(self):
+        """Test that no sampling happens when every question fits."""
+        questions = make_questions([10, 20])
+        
+        assert sample_questions_by_depth(questions, 5, novel_length=1000) is questions
+    
+    def test_zero_novel_length(self):
+        """Test that a zero novel length puts everything in the first bin."""
+        questions = make_questions([10, 20, 30])
+        
+        sampled = sample_questions_by_depth(questions, 2, novel_length=0)
+        
+        assert len(sampled) == 2
@@ -0,0 +1,87 @@
+"""
+Tests for the FileIO module.
+"""
+
+import pytest
+from src.core.file_io import FileIO
+
+
+class TestJsonl:
+    """Test cases for JSONL reading and writing."""
+    
+    def test_roundtrip_with_metadata(self, tmp_path):
+        """Test that data and metadata survive a write/read roundtrip."""
+        path = tmp_path / "out.jsonl"
+        data = [{"question": "q1", "score": 1.0}, {"question": "q2", "score": 0.5}]
+        metadata = {"model_name": "test-model"}
+        
+        FileIO.write_jsonl(str(path), data, metadata)
+        read_metadata, read_data = FileIO.read_jsonl(str(path))
+        
+        assert read_metadata == metadata
+        assert read_data == data
+    
+    def test_roundtrip_without_metadata(self, tmp_path):
+        """Test reading a file that has no metadata line."""
+        path = tmp_path / "out.jsonl"
+        data = [{"question": "q1"}]
+        
+        FileIO.write_jsonl(str(path), data)
+        read_metadata, read_data = FileIO.read_jsonl(str(path))
+        
+        assert read_metadata == {}
+        assert read_data == data
+    
+    def test_non_ascii_written_unescaped(self, tmp_path):
+        """Test that non-ASCII text is written as UTF-8, not escaped."""
+        path = tmp_path / "out.jsonl"
+        FileIO.write_jsonl(str(path), [{"question": "哈利·波特"}])
+        
+        content = path.read_text(encoding="utf-8")
+        assert "哈利·波特" in content
+        assert content.endswith("\n")
+    
+    def test_int_keys_serialized_as_strings(self, tmp_path):
+        """Test that non-string dict keys are written like json.dumps does."""
+        path = tmp_path / "out.jsonl"
+        FileIO.write_jsonl(str(path), [{"lengths": {128000: 3}}])
+        
+        _, read_data = FileIO.read_jsonl(str(path))
+        assert read_data == [{"lengths": {"128000": 3}}]
+    
+    def test_missing_file(self, tmp_path):
+        """Test that reading a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            FileIO.read_jsonl(str(tmp_path / "missing.jsonl"))
+    
+    def test_write_generator(self, tmp_path):
+        """Test that write_jsonl accepts a generator."""
+        path = tmp_path / "out.jsonl"
+        FileIO.write_jsonl(str(path), ({"i": i} for i in range(3)), {"m": 1})
+        
+        read_metadata, read_data = FileIO.read_jsonl(str(path))
+        assert read_metadata == {"m": 1}
+        assert read_data == [{"i": 0}, {"i": 1}, {"i": 2}]
+
+
+class TestJsonlWriter:
+    """Test cases for incremental JSONL writing."""
+    
+    def test_incremental_write(self, tmp_path):
+        """Test writing records one at a time."""
+        path = tmp_path / "nested" / "out.jsonl"
+        
+        with FileIO.open_jsonl(str(path), {"model_name": "m"}) as writer:
+            writer.write({"question": "q1"})
+            writer.write({"question": "q2"})
+            assert writer.count == 2
+        
+        read_metadata, read_data = FileIO.read_jsonl(str(path))
+        assert read_metadata == {"model_name": "m"}
+        assert read_data == [{"question": "q1"}, {"question": "q2"}]
+    
+    def test_unserializable_record(self, tmp_path):
+        """Test that a record orjson cannot encode raises IOError."""
+        with FileIO.open_jsonl(str(tmp_path / "out.jsonl")) as writer:
+            with pytest.raises(IOError):
+                writer.write({"value": object()})
@@ -200,6 +200,13 @@ Let me analyze this:
         assert answer == ["a"]
         assert status == "regex_extracted"
 
+    def test_unbalanced_braces_in_prose(self):
+        """Test that prose with an opening brace only is a parsing error."""
+        response = 'The answer set is { a, b and so on'
+        answer, status = parse_answer(response)
+        assert answer == []
+        assert status == "parsing_error"
+
 
 class TestIsValidAnswer:
     """Test cases for is_valid_answer function."""
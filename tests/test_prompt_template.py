@@ -8,7 +8,11 @@ import tempfile
 from pathlib import Path
 import pytest
 
-from src.core.prompt_template import PromptTemplateManager
+from src.core.prompt_template import (
+    PromptTemplateManager,
+    _format_split_after_context,
+    _format_with_context,
+)
 
 
 class TestPromptTemplateManager:
@@ -72,6 +76,21 @@ class TestPromptTemplateManager:
         assert "选项A" in user_prompt
         assert "选项B" in user_prompt
     
+    def test_get_split_testing_prompt(self):
+        """Test that the split testing prompt ends its head at the context."""
+        manager = PromptTemplateManager(template_dir="nonexistent_dir/")
+        choices = {"a": "选项A", "b": "选项B"}
+        
+        expected = manager.get_testing_prompt("上下文", "问题？", choices)
+        system_prompt, user_head, user_tail = manager.get_split_testing_prompt(
+            "上下文", "问题？", choices
+        )
+        
+        assert system_prompt == expected[0]
+        assert user_head + user_tail == expected[1]
+        assert user_head.endswith("上下文")
+        assert "问题？" in user_tail
+    
     def test_load_custom_template(self):
         """Test loading a custom template from file."""
         # Create a temporary custom template
@@ -150,5 +169,46 @@ class TestPromptTemplateManager:
             assert info["testing_template"]["loaded"] is True
 
 
+
+class TestFormatWithContext:
+    """Test cases for formatting templates around a large context."""
+    
+    @pytest.mark.parametrize("template", [
+        "{context}",
+        "{question}\n{context}\n{choices}",
+        "{{context}} {context} {{{question}}}",
+        "{question!r:>10}{context}",
+        "{context}{context}",
+        "{context:>5}",
+        "no context {question}",
+    ])
+    def test_matches_str_format(self, template):
+        """Test that the result is identical to str.format."""
+        fields = {"question": "Q", "choices": "C"}
+        context = "a {b} }}{{ c"
+        
+        expected = template.format(context=context, **fields)
+        assert _format_with_context(template, context, **fields) == expected
+    
+    def test_missing_field(self):
+        """Test that a missing field still raises KeyError."""
+        with pytest.raises(KeyError):
+            _format_with_context("{context}{question}", "ctx")
+
+    @pytest.mark.parametrize("template, head", [
+        ("{question}\n{context}\n{choices}", "Q\nctx"),
+        ("{context}{context}", "ctxctx"),
+        ("no context {question}", "no context Q"),
+    ])
+    def test_split_after_context(self, template, head):
+        """Test that the split parts join to the formatted prompt."""
+        fields = {"question": "Q", "choices": "C"}
+        
+        parts = _format_split_after_context(template, "ctx", **fields)
+        
+        assert parts[0] == head
+        assert "".join(parts) == template.format(context="ctx", **fields)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,71 @@
+"""
+Tests for the question pre-checker.
+"""
+
+import pytest
+from src.tester.question_checker import QuestionChecker, QuestionCheckError
+
+
+def make_question(text, is_valid=True, reasons=None):
+    """Create a minimal question with validation metadata."""
+    return {
+        "question": text,
+        "validation": {"is_valid": is_valid, "failure_reasons": reasons or []}
+    }
+
+
+class TestCheckQuestions:
+    """Test cases for QuestionChecker.check_questions."""
+    
+    def test_all_valid(self):
+        """Test that valid questions pass through in order."""
+        questions = [make_question("q1"), make_question("q2")]
+        
+        valid, check_results = QuestionChecker().check_questions(questions)
+        
+        assert valid == questions
+        assert check_results == []
+    
+    def test_missing_validation_raises(self):
+        """Test that questions without validation metadata always error."""
+        questions = [make_question("q1"), {"question": "q2"}, {"question": "q3"}]
+        
+        with pytest.raises(QuestionCheckError) as exc_info:
+            QuestionChecker().check_questions(questions, ignore_invalid=True)
+        
+        results = exc_info.value.check_results
+        assert [r.index for r in results] == [1, 2]
+        assert not any(r.has_validation for r in results)
+    
+    def test_invalid_raises(self):
+        """Test that invalid questions error without ignore_invalid."""
+        questions = [make_question("q1"), make_question("q2", False, ["bad"])]
+        
+        with pytest.raises(QuestionCheckError) as exc_info:
+            QuestionChecker().check_questions(questions)
+        
+        results = exc_info.value.check_results
+        assert [r.index for r in results] == [1]
+        assert results[0].failure_reasons == ["bad"]
+    
+    def test_ignore_invalid_filters(self):
+        """Test that ignore_invalid drops invalid questions."""
+        questions = [make_question("q1", False), make_question("q2"), make_question("q3", False)]
+        
+        valid, check_results = QuestionChecker().check_questions(questions, ignore_invalid=True)
+        
+        assert valid == [questions[1]]
+        assert [r.index for r in check_results] == [0, 2]
+    
+    def test_no_valid_remaining_raises(self):
+        """Test that filtering everything out is an error."""
+        questions = [make_question("q1", False)]
+        
+        with pytest.raises(QuestionCheckError):
+            QuestionChecker().check_questions(questions, ignore_invalid=True)
+    
+    def test_skip_validation(self):
+        """Test that skip_validation returns the input untouched."""
+        questions = [{"question": "q1"}]
+        
+        assert QuestionChecker().check_questions(questions, skip_validation=True) == (questions, [])
@@ -0,0 +1,623 @@
+"""
+Tests for TestingTool helpers.
+"""
+
+import asyncio
+
+import pytest
+from src.core.file_io import FileIO
+from src.tester import testing_tool
+from src.tester.depth_scheduler import DepthAssignment
+from src.tester.question_checker import QuestionChecker
+from src.tester.testing_tool import (
+    BatchAborted,
+    ResultSummary,
+    _SharedContextBuilds,
+    _TimeoutCircuitBreaker,
+    summarize_results,
+)
+
+
+def make_result(status, question_type, score):
+    """Create a minimal test result."""
+    return {"parsing_status": status, "question_type": question_type, "score": score}
+
+
+class TestSummarizeResults:
+    """Test cases for summarize_results."""
+    
+    def test_counts_and_averages(self):
+        """Test status counts, type counts and averages."""
+        results = [
+            make_result("success", "single_choice", 1.0),
+            make_result("success", "single_choice", 0.0),
+            make_result("regex_extracted", "multiple_choice", 0.5),
+            make_result("timeout", "multiple_choice", 0.0),
+        ]
+        
+        summary = summarize_results(results)
+        
+        assert summary["total"] == 4
+        assert summary["status_counts"]["success"] == 2
+        assert summary["status_counts"]["regex_extracted"] == 1
+        assert summary["status_counts"]["timeout"] == 1
+        assert summary["status_counts"]["error"] == 0
+        assert summary["avg_score"] == 0.375
+        assert summary["single_choice"] == 2
+        assert summary["single_correct"] == 1
+        assert summary["multiple_choice"] == 2
+        assert summary["avg_multi_f1"] == 0.25
+    
+    def test_empty(self):
+        """Test that an empty result list yields zero averages."""
+        summary = summarize_results([])
+        
+        assert summary["total"] == 0
+        assert summary["avg_score"] == 0.0
+        assert summary["avg_multi_f1"] == 0.0
+
+
+class TestResultSummary:
+    """Test cases for the incremental ResultSummary."""
+    
+    def test_matches_summarize_results(self):
+        """Test that adding results one by one gives the batch summary."""
+        results = [
+            make_result("success", "single_choice", 1.0),
+            make_result("timeout", "multiple_choice", 0.0),
+            make_result("success", "multiple_choice", 0.5),
+        ]
+        
+        summary = ResultSummary()
+        for r in results:
+            summary.add(r)
+        
+        assert summary.to_dict() == summarize_results(results)
+
+
+class TestTimeoutCircuitBreaker:
+    """Test cases for aborting a batch on excessive timeouts."""
+    
+    def test_trips_above_rate_after_min_results(self):
+        """Test that the breaker waits for min_results, then trips."""
+        breaker = _TimeoutCircuitBreaker(max_timeout_rate=0.5, min_results=4)
+        for _ in range(3):
+            breaker.record(make_result("timeout", "single_choice", 0.0))
+        assert not breaker.tripped
+        breaker.check()
+        
+        breaker.record(make_result("success", "single_choice", 1.0))
+        assert breaker.tripped
+        with pytest.raises(BatchAborted):
+            breaker.check()
+    
+    def test_rate_at_limit_does_not_trip(self):
+        """Test that exactly max_timeout_rate timeouts is tolerated."""
+        breaker = _TimeoutCircuitBreaker(max_timeout_rate=0.5, min_results=4)
+        for status in ("timeout", "timeout", "success", "success"):
+            breaker.record(make_result(status, "single_choice", 0.0))
+        assert not breaker.tripped
+    
+    def test_full_rate_never_trips(self):
+        """Test that a rate of 1.0 disables the breaker."""
+        breaker = _TimeoutCircuitBreaker(max_timeout_rate=1.0, min_results=1)
+        for _ in range(10):
+            breaker.record(make_result("timeout", "single_choice", 0.0))
+        assert not breaker.tripped
+
+
+class TestCalculateScore:
+    """Test cases for TestingTool._calculate_score."""
+    
+    @pytest.fixture
+    def tool(self):
+        """TestingTool without config; scoring uses no instance state."""
+        return testing_tool.TestingTool.__new__(testing_tool.TestingTool)
+    
+    def test_single_choice(self, tool):
+        """Test exact-match scoring for single choice."""
+        assert tool._calculate_score(["a"], ["a"], "single_choice") == (1.0, {})
+        assert tool._calculate_score(["a"], ["b"], "single_choice") == (0.0, {})
+    
+    def test_multiple_choice_f1(self, tool):
+        """Test precision, recall and F1 for multiple choice."""
+        score, metrics = tool._calculate_score(["a", "b"], ["a", "c"], "multiple_choice")
+        
+        assert score == 0.5
+        assert metrics == {"precision": 0.5, "recall": 0.5, "f1_score": 0.5}
+    
+    def test_cached_metrics_not_shared(self, tool):
+        """Test that mutating returned metrics does not affect later calls."""
+        _, metrics = tool._calculate_score(["a"], ["a"], "multiple_choice")
+        metrics["precision"] = -1.0
+        
+        _, metrics = tool._calculate_score(["a"], ["a"], "multiple_choice")
+        assert metrics["precision"] == 1.0
+    
+    def test_unhashable_model_answer(self, tool):
+        """Test that malformed, unhashable answers are scored without the cache."""
+        assert tool._calculate_score(["a"], [["a"]], "single_choice") == (0.0, {})
+    
+    def test_non_list_answer_scored_without_cache(self, tool):
+        """Test that answers that are not lists are scored by _score directly."""
+        score, metrics = tool._calculate_score(("a", "b"), ["a", "b"], "multiple_choice")
+        
+        assert score == 1.0
+        assert metrics == {"precision": 1.0, "recall": 1.0, "f1_score": 1.0}
+
+
+class TestValidateContextLengths:
+    """Test cases for TestingTool._validate_context_lengths."""
+    
+    @pytest.fixture
+    def tool(self):
+        """TestingTool without config; validation uses no instance state."""
+        return testing_tool.TestingTool.__new__(testing_tool.TestingTool)
+    
+    def test_accepts_usable_questions(self, tool):
+        """Test that a question fitting the longest context passes."""
+        questions = [
+            {"position": {"start_pos": 100, "end_pos": 200}},
+            {"position": {"start_pos": 0, "end_pos": 900}},
+        ]
+        tool._validate_context_lengths([300, 500], 1000, questions, 50)
+    
+    def test_no_usable_questions(self, tool):
+        """Test that evidence spans longer than every context length error."""
+        questions = [{"position": {"start_pos": 0, "end_pos": 450}}]
+        
+        with pytest.raises(ValueError, match="No questions can be tested"):
+            tool._validate_context_lengths([500], 1000, questions, 25)
+    
+    def test_missing_positions(self, tool):
+        """Test that questions without end positions are rejected."""
+        with pytest.raises(ValueError, match="No valid position information"):
+            tool._validate_context_lengths([500], 1000, [{"position": {}}, {}], 10)
+
+
+class CountingBuilder:
+    """Context builder stand-in that counts builds."""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def prepare(self):
+        pass
+    
+    def build_context(self, question, target_depth, context_length, padding_size):
+        self.calls += 1
+        return (question["position"]["start_pos"], target_depth, context_length)
+
+
+def make_assignment(depth, context_length=1000):
+    """Create a depth assignment for question 0."""
+    return DepthAssignment(
+        question_index=0,
+        target_depth=depth,
+        depth_bin="50%",
+        context_length=context_length
+    )
+
+
+class TestSharedContextBuilds:
+    """Test cases for batch-wide context build sharing."""
+    
+    def test_identical_assignments_build_once(self):
+        """Test that identical keys share one build and distinct keys do not."""
+        builder = CountingBuilder()
+        question = {"position": {"start_pos": 10, "end_pos": 20}}
+        assignments = [make_assignment(0.5), make_assignment(0.5), make_assignment(0.25)]
+        shared = _SharedContextBuilds(
+            builder,
+            None,
+            500,
+            keys=[_SharedContextBuilds.key(question, a) for a in assignments]
+        )
+        
+        async def run():
+            return await asyncio.gather(*(shared.build(question, a) for a in assignments))
+        
+        results = asyncio.run(run())
+        
+        assert builder.calls == 2
+        assert results[0] == results[1] == (10, 0.5, 1000)
+        assert results[2] == (10, 0.25, 1000)
+        assert shared._builds == {}
+
+
+class FakeLLMClient:
+    """LLM client stand-in without a rate limiter."""
+    
+    rate_limiter = None
+    
+    def set_concurrency_listener(self, listener):
+        pass
+
+
+class FakePromptManager:
+    """Prompt manager stand-in that renders the question after the context."""
+    
+    def get_testing_prompt(self, context, question, choices):
+        return "system", context + question
+
+
+class FakeTokenizer:
+    """Tokenizer stand-in that counts one token per character."""
+    
+    def count_tokens(self, text):
+        return len(text)
+
+
+class TestCountPromptTokens:
+    """Test cases for TestingTool._count_prompt_tokens."""
+    
+    @pytest.fixture
+    def tool(self):
+        """TestingTool with fake prompts and a character-counting tokenizer."""
+        tool = testing_tool.TestingTool.__new__(testing_tool.TestingTool)
+        tool.llm_client = FakeLLMClient()
+        tool.prompt_manager = FakePromptManager()
+        tool.tokenizer = FakeTokenizer()
+        return tool
+    
+    def test_skipped_without_rate_limiter(self, tool):
+        """Test that nothing is counted when no rate limiter needs the count."""
+        tool.tokenizer = None
+        
+        assert tool._count_prompt_tokens(1000, "question", {}) is None
+    
+    def test_adds_context_tokens(self, tool):
+        """Test that the rendered prompt is counted on top of the context."""
+        tool.llm_client.rate_limiter = object()
+        
+        assert tool._count_prompt_tokens(1000, "question", {}) == 1000 + 6 + 8
+
+
+class FakeContextCache:
+    """Context cache stand-in that records stored and requested hashes."""
+    
+    def __init__(self, entries=None):
+        self.entries = dict(entries or {})
+        self.stored = []
+        self.requested = []
+    
+    def get(self, context_hash):
+        self.requested.append(context_hash)
+        return self.entries.get(context_hash)
+    
+    def put(self, context_hash, context):
+        self.stored.append(context_hash)
+
+
+class FakeTokenCache:
+    """Token cache stand-in that encodes any text to 2000 tokens."""
+    
+    def encode(self, tokenizer, text):
+        return [0] * 2000
+
+
+class TestTestBatch:
+    """Test cases for TestingTool._test_batch."""
+    
+    @pytest.fixture
+    def tool(self):
+        """TestingTool whose single-question test sleeps for question['delay']."""
+        tool = testing_tool.TestingTool.__new__(testing_tool.TestingTool)
+        tool.llm_client = FakeLLMClient()
+        tool.context_cache = FakeContextCache()
+        tool.max_timeout_rate = 1.0
+        tool.abort_min_results = 1
+        
+        async def test_single_question(context, question, context_tokens=None):
+            await asyncio.sleep(question["delay"])
+            if question["question"] == "boom":
+                raise RuntimeError("boom")
+            result = make_result("success", "single_choice", 1.0)
+            result["question"] = question["question"]
+            return result
+        
+        tool._test_single_question = test_single_question
+        return tool
+    
+    def test_streams_in_completion_order(self, tool, tmp_path):
+        """Test that results are written as they finish and returned in order."""
+        questions = [
+            {"question": "slow", "delay": 0.1},
+            {"question": "boom", "delay": 0.0},
+            {"question": "fast", "delay": 0.02},
+        ]
+        path = tmp_path / "out.jsonl"
+        
+        with FileIO.open_jsonl(str(path), {"m": 1}) as writer:
+            results = asyncio.run(tool._test_batch("context", questions, 3, writer))
+        
+        assert [r["parsing_status"] for r in results] == ["success", "error", "success"]
+        assert [r["question"] for r in results] == ["slow", "boom", "fast"]
+        assert len({r["context_hash"] for r in results}) == 1
+        assert tool.context_cache.stored == [results[0]["context_hash"]]
+        
+        _, written = FileIO.read_jsonl(str(path))
+        assert [r["question"] for r in written] == ["boom", "fast", "slow"]
+    
+    def test_worker_pool_bounds_in_flight(self, tool):
+        """Test that at most `concurrency` questions are in flight at once."""
+        in_flight = []
+        peak = []
+        
+        async def test_single_question(context, question, context_tokens=None):
+            in_flight.append(question)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(question)
+            return {"question": question["question"], "parsing_status": "success"}
+        
+        tool._test_single_question = test_single_question
+        questions = [{"question": str(i)} for i in range(7)]
+        
+        results = asyncio.run(tool._test_batch("context", questions, 2))
+        
+        assert max(peak) == 2
+        assert [r["question"] for r in results] == [str(i) for i in range(7)]
+
+
+class TestTestDepthAwareBatch:
+    """Test cases for TestingTool._test_depth_aware_batch."""
+    
+    @pytest.fixture
+    def tool(self):
+        """TestingTool whose depth-aware test sleeps for question['delay']."""
+        tool = testing_tool.TestingTool.__new__(testing_tool.TestingTool)
+        tool.llm_client = FakeLLMClient()
+        tool.max_timeout_rate = 1.0
+        tool.abort_min_results = 1
+        
+        async def test_single_depth_aware(question, assignment, **kwargs):
+            await asyncio.sleep(question["delay"])
+            if question["question"] == "boom":
+                raise RuntimeError("boom")
+            result = make_result("success", "single_choice", 1.0)
+            result["question"] = question["question"]
+            return result
+        
+        tool._test_single_depth_aware = test_single_depth_aware
+        return tool
+    
+    def test_streams_in_completion_order(self, tool, tmp_path):
+        """Test that results are written as they finish and returned in order."""
+        questions = [
+            {"question": "slow", "delay": 0.1},
+            {"question": "boom", "delay": 0.0},
+            {"question": "fast", "delay": 0.02},
+        ]
+        assignments = [
+            DepthAssignment(question_index=i, target_depth=0.5, depth_bin="50%", context_length=1000)
+            for i in range(3)
+        ]
+        path = tmp_path / "out.jsonl"
+        
+        with FileIO.open_jsonl(str(path), {"m": 1}) as writer:
+            results = asyncio.run(tool._test_depth_aware_batch(
+                questions, assignments, CountingBuilder(), 0, 3, writer=writer
+            ))
+        
+        assert [r["question"] for r in results] == ["slow", "boom", "fast"]
+        assert results[1]["parsing_status"] == "error"
+        assert results[1]["depth_bin"] == "50%"
+        
+        _, written = FileIO.read_jsonl(str(path))
+        assert [r["question"] for r in written] == ["boom", "fast", "slow"]
+    
+    def test_worker_pool_bounds_in_flight(self, tool):
+        """Test that at most `concurrency` assignments are in flight at once."""
+        in_flight = []
+        peak = []
+        
+        async def test_single_depth_aware(question, assignment, **kwargs):
+            in_flight.append(question)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(question)
+            return {"question": question["question"], "parsing_status": "success"}
+        
+        tool._test_single_depth_aware = test_single_depth_aware
+        questions = [{"question": str(i)} for i in range(7)]
+        assignments = [
+            DepthAssignment(question_index=i, target_depth=0.0, depth_bin="0%", context_length=1000)
+            for i in range(7)
+        ]
+        
+        results = asyncio.run(tool._test_depth_aware_batch(
+            questions, assignments, CountingBuilder(), 0, 2
+        ))
+        
+        assert max(peak) == 2
+        assert [r["question"] for r in results] == [str(i) for i in range(7)]
+
+
+class TestLoadInputs:
+    """Test cases for loading the novel alongside the question set."""
+    
+    def test_question_set_error_not_hidden_by_novel_error(self, tmp_path):
+        """Test that a question set read error is raised even if the novel fails."""
+        tool = testing_tool.TestingTool.__new__(testing_tool.TestingTool)
+        tool.file_io = FileIO()
+        
+        def load_novel(novel_path):
+            raise ValueError("novel failed")
+        
+        tool._load_novel = load_novel
+        
+        with pytest.raises(FileNotFoundError):
+            asyncio.run(tool.run_tests(
+                novel_path=str(tmp_path / "novel.txt"),
+                question_set_path=str(tmp_path / "missing.jsonl"),
+                context_length=1000
+            ))
+
+
+class TestRecovery:
+    """Test cases for recovery mode."""
+    
+    @pytest.fixture
+    def tool(self):
+        """TestingTool without a tokenizer, so any novel rebuild fails."""
+        tool = testing_tool.TestingTool.__new__(testing_tool.TestingTool)
+        tool.file_io = FileIO()
+        tool.question_checker = QuestionChecker()
+        tool.token_cache = None
+        tool._log_summary = lambda results: None
+        tool._log_depth_aware_summary = lambda results: None
+        return tool
+    
+    @pytest.fixture
+    def question_set(self, tmp_path):
+        """Question set file with three questions."""
+        path = tmp_path / "questions.jsonl"
+        FileIO.write_jsonl(
+            str(path), [{"question": "q1"}, {"question": "q2"}, {"question": "q3"}], {"m": 1}
+        )
+        return str(path)
+    
+    def test_recovery_reuses_context_hash(self, tool, question_set, tmp_path):
+        """Test that legacy recovery re-sends the cached shared context."""
+        recovery_path = tmp_path / "prev.jsonl"
+        FileIO.write_jsonl(str(recovery_path), [
+            {"question": "q1", "parsing_status": "parsing_error", "context_hash": "h"},
+            {"question": "q2", "parsing_status": "success", "context_hash": "h"},
+        ], {"context_length": 1000})
+        tool.context_cache = FakeContextCache({"h": "cached context"})
+        calls = []
+        
+        async def test_batch(context, questions, concurrency, writer=None, context_tokens=None):
+            calls.append((context, [q["question"] for q in questions]))
+            return [{"question": "q1", "parsing_status": "success"}]
+        
+        tool._test_batch = test_batch
+        
+        results = asyncio.run(tool.run_recovery(
+            recovery_path=str(recovery_path),
+            novel_path=str(tmp_path / "missing.txt"),
+            question_set_path=question_set,
+            context_length=1000,
+            skip_validation=True
+        ))
+        
+        assert calls == [("cached context", ["q1"])]
+        assert tool.context_cache.requested == ["h"]
+        assert [r["parsing_status"] for r in results] == ["success", "success"]
+    
+    def test_recovery_runs_questions_missing_from_truncated_file(
+        self, tool, question_set, tmp_path
+    ):
+        """Test that legacy recovery tests the planned questions it never reached."""
+        recovery_path = tmp_path / "prev.jsonl"
+        FileIO.write_jsonl(str(recovery_path), [
+            {"question": "q1", "parsing_status": "success", "context_hash": "h"},
+        ], {
+            "context_length": 1000,
+            "total_questions": 2,
+            "planned_tests": [{"question": "q1"}, {"question": "q3"}]
+        })
+        tool.context_cache = FakeContextCache({"h": "cached context"})
+        calls = []
+        
+        async def test_batch(context, questions, concurrency, writer=None, context_tokens=None):
+            calls.append([q["question"] for q in questions])
+            return [{"question": q["question"], "parsing_status": "success"} for q in questions]
+        
+        tool._test_batch = test_batch
+        
+        results = asyncio.run(tool.run_recovery(
+            recovery_path=str(recovery_path),
+            novel_path=str(tmp_path / "missing.txt"),
+            question_set_path=question_set,
+            context_length=1000,
+            skip_validation=True
+        ))
+        
+        assert calls == [["q3"]]
+        assert [r["question"] for r in results] == ["q1", "q3"]
+    
+    def test_recovery_skips_missing_without_planned_tests(self, tool, question_set, tmp_path):
+        """Test that a truncated file that does not list its plan is not topped up."""
+        recovery_path = tmp_path / "prev.jsonl"
+        FileIO.write_jsonl(str(recovery_path), [
+            {"question": "q1", "parsing_status": "success", "context_hash": "h"},
+        ], {"context_length": 1000, "total_questions": 3})
+        calls = []
+        
+        async def test_batch(context, questions, concurrency, writer=None, context_tokens=None):
+            calls.append([q["question"] for q in questions])
+            return []
+        
+        tool._test_batch = test_batch
+        
+        results = asyncio.run(tool.run_recovery(
+            recovery_path=str(recovery_path),
+            novel_path=str(tmp_path / "missing.txt"),
+            question_set_path=question_set,
+            context_length=1000,
+            skip_validation=True
+        ))
+        
+        assert calls == []
+        assert [r["question"] for r in results] == ["q1"]
+    
+    def run_depth_aware_recovery(self, tool, question_set, tmp_path, metadata):
+        """Run depth-aware recovery of a file holding one timed-out q2 result."""
+        recovery_path = tmp_path / "prev.jsonl"
+        FileIO.write_jsonl(str(recovery_path), [
+            {"question": "q2", "parsing_status": "timeout", "depth": 0.25,
+             "depth_bin": "25%", "test_context_length": 1000},
+        ], metadata)
+        calls = []
+        
+        async def test_depth_aware_batch(questions, assignments, context_builder, **kwargs):
+            calls.append([(a.question_index, a.depth_bin) for a in assignments])
+            return [
+                {"question": questions[a.question_index]["question"], "parsing_status": "success",
+                 "depth_bin": a.depth_bin, "test_context_length": a.context_length}
+                for a in assignments
+            ]
+        
+        tool._test_depth_aware_batch = test_depth_aware_batch
+        tool.tokenizer = None
+        tool.token_cache = FakeTokenCache()
+        novel_path = tmp_path / "novel.txt"
+        novel_path.write_text("novel", encoding="utf-8")
+        
+        results = asyncio.run(tool.run_depth_aware_recovery(
+            recovery_path=str(recovery_path),
+            novel_path=str(novel_path),
+            question_set_path=question_set,
+            depth_mode="uniform",
+            context_lengths=(1000,),
+            skip_validation=True
+        ))
+        return calls, [(r["question"], r["depth_bin"]) for r in results]
+    
+    def test_depth_aware_recovery_runs_missing_assignments(self, tool, question_set, tmp_path):
+        """Test that depth-aware recovery runs the planned assignments that have no result."""
+        calls, results = self.run_depth_aware_recovery(tool, question_set, tmp_path, {
+            "total_questions": 2,
+            "planned_tests": [
+                {"question": "q2", "target_depth": 0.25, "depth_bin": "25%",
+                 "test_context_length": 1000},
+                {"question": "q3", "target_depth": 0.75, "depth_bin": "75%",
+                 "test_context_length": 1000},
+            ]
+        })
+        
+        assert calls == [[(1, "25%"), (2, "75%")]]
+        assert results == [("q2", "25%"), ("q3", "75%")]
+    
+    def test_depth_aware_recovery_skips_missing_without_planned_tests(
+        self, tool, question_set, tmp_path
+    ):
+        """Test that a truncated file that does not list its plan only re-runs failures."""
+        calls, results = self.run_depth_aware_recovery(
+            tool, question_set, tmp_path, {"total_questions": 3}
+        )
+        
+        assert calls == [[(1, "25%")]]
+        assert results == [("q2", "25%")]